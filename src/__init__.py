@@ -1,15 +1,35 @@
 # src/__init__.py
 """
 Startup Finder project package.
+
+Subpackages and modules are imported on first attribute access (PEP 562), so
+importing one module doesn't load the whole application.
 """
 
-# Import typing modules
-from typing import List, Dict, Any, Optional, Tuple, Set, Union
+import importlib
+from typing import Any
+
+# Subpackages and modules available as attributes of the package
+__all__ = [
+    "utils",
+    "collector",
+    "processor",
+    "modify_startup_finder",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a subpackage or module the first time it is accessed.
 
-# Import subpackages
-from . import utils
-from . import collector
-from . import processor
+    Args:
+        name: Name of the subpackage or module.
 
-# Import modules
-from . import modify_startup_finder
\ No newline at end of file
+    Returns:
+        The imported module.
+    """
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,12 +22,9 @@ import logging
 import hashlib
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
-import google.generativeai as genai
-from google.generativeai import types
-
 import requests
 import urllib3
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.robotparser import RobotFileParser
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -36,8 +33,12 @@ from urllib3.util.retry import Retry
 from src.processor.linkedin_extractor import LinkedInExtractor
 from src.processor.website_extractor import WebsiteExtractor
 from src.utils.text_cleaner import TextCleaner
+from src.utils.optimization_utils import cache_manager
+
+# Certificates are verified unless TRUST_WEAK_SSL is set, for crawling hosts with broken certificates
+_VERIFY_SSL = os.environ.get("TRUST_WEAK_SSL", "").lower() not in ("1", "true", "yes")
 
-# Disable SSL verification warnings
+# Disable SSL verification warnings, once, for when TRUST_WEAK_SSL is set
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Set up logging
@@ -47,6 +48,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Social media URLs that are skipped during discovery because they yield many false positives
+_SKIP_SOCIAL_URL_RE = re.compile(r"(?:facebook|twitter|instagram|youtube|pinterest|reddit)\.com|linkedin\.com/feed", re.I)
+
+# Tags kept when parsing fetched pages: what the link extraction and the website, LinkedIn
+# and Crunchbase extractors read. Scripts, styles and SVGs outside them are never built.
+_PAGE_STRAINER = SoupStrainer(['title', 'meta', 'main', 'article', 'section', 'div', 'p',
+                               'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a'])
+
+# Headers that mimic a browser for the Beautiful Soup fallback fetches
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# Content types worth parsing; PDFs, images and other binaries are skipped before their body is read
+_FETCHABLE_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "application/xml", "text/plain")
+
+# Pages declaring a larger body than this are skipped rather than downloaded and truncated
+_MAX_CONTENT_LENGTH = 5000000
+
+
+def _is_fetchable_page(url: str, response: requests.Response) -> bool:
+    """
+    Check a streamed response's headers before its body is downloaded.
+
+    Args:
+        url: URL that was fetched.
+        response: Response fetched with stream=True.
+
+    Returns:
+        True if the body should be read and parsed.
+    """
+    content_type = response.headers.get("Content-Type", "").lower()
+    if content_type and not any(allowed in content_type for allowed in _FETCHABLE_CONTENT_TYPES):
+        logger.info(f"Skipping {url}: not an HTML page ({content_type})")
+        return False
+
+    try:
+        content_length = int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > _MAX_CONTENT_LENGTH:
+        logger.info(f"Skipping {url}: page too large ({content_length} bytes)")
+        return False
+
+    return True
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled session with retries for fallback page fetches.
+
+    Returns:
+        Configured requests session.
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=100, pool_maxsize=100)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.verify = _VERIFY_SSL
+    return session
+
+
+# Created once at import so fallback fetches reuse keep-alive connections instead of
+# paying a new TCP/TLS handshake per page
+_SESSION = _create_session()
+
 # These will be defined later in the file
 AutoScraperDataSource = None
 Crawler = None
@@ -169,7 +246,7 @@ class RobotsTxtChecker:
                 parser.set_url(robots_url)
                 try:
                     # Use requests instead of urllib to handle SSL issues
-                    response = requests.get(robots_url, timeout=10, verify=False)  # Doubled timeout from 5 to 10 seconds
+                    response = requests.get(robots_url, timeout=10, verify=_VERIFY_SSL)  # Doubled timeout from 5 to 10 seconds
                     if response.status_code == 200:
                         parser.parse(response.text.splitlines())
                     else:
@@ -369,29 +446,8 @@ class GeminiDataSource(DataSource):
         if not page_content:
             logger.warning(f"Crawl4AI failed for {url}, trying Beautiful Soup as fallback")
             try:
-                # Create a session with retry capability
-                session = requests.Session()
-                retry_strategy = Retry(
-                    total=3,
-                    backoff_factor=0.1,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    allowed_methods=["GET", "HEAD"]
-                )
-                adapter = HTTPAdapter(max_retries=retry_strategy)
-                session.mount("http://", adapter)
-                session.mount("https://", adapter)
-
-                # Set headers to mimic a browser
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1"
-                }
-
-                # Make the request
-                response = session.get(url, headers=headers, timeout=30, verify=False)  # Doubled timeout from 15 to 30 seconds
+                # Make the request over the shared keep-alive session
+                response = _SESSION.get(url, headers=_BROWSER_HEADERS, timeout=30)  # Doubled timeout from 15 to 30 seconds
                 response.raise_for_status()
 
                 # Use TextCleaner to extract and clean HTML content
@@ -633,7 +689,7 @@ class GeminiDataSource(DataSource):
             response = self.api_client.pro_model.generate_content(prompt, stream=True)
 
             # Process the streaming response to handle search grounding
-            full_response = ""
+            response_parts = []
             search_queries = []
 
             for chunk in response:
@@ -644,13 +700,15 @@ class GeminiDataSource(DataSource):
                         if hasattr(content, 'parts') and content.parts:
                             for part in content.parts:
                                 if hasattr(part, 'text') and part.text:
-                                    full_response += part.text
+                                    response_parts.append(part.text)
                                 elif hasattr(part, 'function_call'):
                                     if part.function_call.name == "search":
                                         query = part.function_call.args.get("query", "No query provided")
                                         search_queries.append(query)
                                         logger.info(f"Search grounding query: {query}")
 
+            full_response = "".join(response_parts)
+
             # Log search grounding usage
             if search_queries:
                 logger.info(f"Used {len(search_queries)} search queries for grounding")
@@ -733,12 +791,12 @@ class SimpleRequestStrategy(ContentExtractionStrategy):
                 headers=headers,
                 timeout=20,  # Doubled timeout from 10 to 20 seconds
                 allow_redirects=True,
-                verify=False  # Disable SSL verification to avoid certificate issues
+                verify=_VERIFY_SSL
             )
             response.raise_for_status()
 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=_PAGE_STRAINER)
 
             return response.text, soup
         except Exception as e:
@@ -781,12 +839,12 @@ class AjaxRequestStrategy(ContentExtractionStrategy):
                 headers=ajax_headers,
                 timeout=30,  # Doubled timeout from 15 to 30 seconds
                 allow_redirects=True,
-                verify=False
+                verify=_VERIFY_SSL
             )
             response.raise_for_status()
 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=_PAGE_STRAINER)
 
             return response.text, soup
         except Exception as e:
@@ -825,12 +883,12 @@ class MobileUserAgentStrategy(ContentExtractionStrategy):
                 headers=mobile_headers,
                 timeout=20,  # Doubled timeout from 10 to 20 seconds
                 allow_redirects=True,
-                verify=False
+                verify=_VERIFY_SSL
             )
             response.raise_for_status()
 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=_PAGE_STRAINER)
 
             return response.text, soup
         except Exception as e:
@@ -878,14 +936,34 @@ class WebCrawler:
             allowed_methods=["GET", "HEAD"]
         )
 
-        # Mount the adapter with our retry strategy for both http and https
+        # Mount the adapter with our retry strategy for both http and https.
+        # pool_connections is the number of per-host pools kept alive; enrichment touches
+        # many distinct hosts, so keep enough of them to reuse TLS connections across calls.
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=max_workers * 2,  # Double the number of workers
-            pool_maxsize=max_workers * 4       # Quadruple the number of workers
+            pool_connections=max(50, max_workers * 2),
+            pool_maxsize=max(50, max_workers * 4)
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.session.verify = _VERIFY_SSL
+
+        # Separate keep-alive session for the browser-like fallback fetch
+        self.fallback_session = requests.Session()
+        fallback_retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"]
+        )
+        fallback_adapter = HTTPAdapter(
+            max_retries=fallback_retry_strategy,
+            pool_connections=max(50, max_workers * 2),
+            pool_maxsize=max(50, max_workers * 4)
+        )
+        self.fallback_session.mount("http://", fallback_adapter)
+        self.fallback_session.mount("https://", fallback_adapter)
+        self.fallback_session.verify = _VERIFY_SSL
 
         # Parallel processing
         self.max_workers = max_workers
@@ -1059,10 +1137,15 @@ class WebCrawler:
                 headers=self.headers,
                 timeout=10,  # Doubled timeout from 5 to 10 seconds
                 allow_redirects=True,
-                verify=False  # Disable SSL verification to avoid certificate issues
+                stream=True
             )
             response.raise_for_status()
 
+            # Skip non-HTML and oversized pages without downloading them
+            if not _is_fetchable_page(url, response):
+                response.close()
+                return None, None
+
             # Check content size before processing
             content_size = len(response.text)
             logger.info(f"Fetched {url} with content size: {content_size} characters")
@@ -1074,7 +1157,7 @@ class WebCrawler:
                 html_content = html_content[:200000]
 
             # Parse the HTML
-            soup = BeautifulSoup(html_content, "lxml")
+            soup = BeautifulSoup(html_content, "lxml", parse_only=_PAGE_STRAINER)
 
             # Special handling for Hacker News content
             if "news.ycombinator.com" in url:
@@ -1105,37 +1188,21 @@ class WebCrawler:
             logger.info(f"Trying Beautiful Soup fallback for {url}")
 
             try:
-                # Create a new session with different settings
-                fallback_session = requests.Session()
-                retry_strategy = Retry(
-                    total=3,
-                    backoff_factor=0.1,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    allowed_methods=["GET", "HEAD"]
-                )
-                adapter = HTTPAdapter(max_retries=retry_strategy)
-                fallback_session.mount("http://", adapter)
-                fallback_session.mount("https://", adapter)
-
-                # Set headers to mimic a browser
-                fallback_headers = {
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1"
-                }
-
                 # Make the request with a longer timeout
-                response = fallback_session.get(
+                response = self.fallback_session.get(
                     url,
-                    headers=fallback_headers,
+                    headers=_BROWSER_HEADERS,
                     timeout=30,  # Doubled timeout from 15 to 30 seconds
-                    verify=False,
-                    allow_redirects=True
+                    allow_redirects=True,
+                    stream=True
                 )
                 response.raise_for_status()
 
+                # Skip non-HTML and oversized pages without downloading them
+                if not _is_fetchable_page(url, response):
+                    response.close()
+                    return None, None
+
                 # Check content size before processing
                 content_size = len(response.text)
                 logger.info(f"Fetched {url} with content size: {content_size} characters (fallback method)")
@@ -1147,7 +1214,7 @@ class WebCrawler:
                     html_content = html_content[:200000]
 
                 # Parse the HTML
-                soup = BeautifulSoup(html_content, "lxml")
+                soup = BeautifulSoup(html_content, "lxml", parse_only=_PAGE_STRAINER)
 
                 # Special handling for Hacker News content
                 if "news.ycombinator.com" in url:
@@ -1382,6 +1449,9 @@ class StartupCrawler:
     Main crawler that implements the two-phase approach to startup data collection.
     """
 
+    # Seconds cached Google results stay valid, so later runs pick up new search results
+    SEARCH_CACHE_TTL = 86400
+
     def __init__(self, max_workers: int = 5):
         """Initialize the startup crawler.
 
@@ -1393,6 +1463,9 @@ class StartupCrawler:
         self.gemini = GeminiDataSource()
         self.web_crawler = WebCrawler(max_workers=max_workers)
 
+        # Share the Gemini data source's client for all LLM extraction calls
+        self.api_client = self.gemini.api_client
+
         # Parallel processing
         self.max_workers = max_workers
 
@@ -1401,6 +1474,43 @@ class StartupCrawler:
 
         logger.info(f"Initialized StartupCrawler with {max_workers} workers")
 
+    def _cached_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        Search Google, reusing cached results for queries run within SEARCH_CACHE_TTL seconds.
+
+        Args:
+            query: Search query.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List of search result dictionaries.
+        """
+        # Normalize case and whitespace so near-identical queries share a cache entry
+        normalized_query = " ".join(query.lower().split())
+        cache_key = f"search:{max_results}:{normalized_query}"
+
+        # Entries are (searched_at, results); anything else predates the expiry and is ignored
+        results = None
+        cached = cache_manager.get_cached_value(cache_key)
+        if isinstance(cached, tuple) and len(cached) == 2 and time.time() - cached[0] < self.SEARCH_CACHE_TTL:
+            results = cached[1]
+
+        if results:
+            logger.info(f"Using cached search results for: {query}")
+        else:
+            results = self.google_search.search(query, max_results=max_results)
+
+            # Only cache non-empty results so transient failures are retried
+            if results:
+                cache_manager.cache_value(cache_key, (time.time(), results))
+
+        # Search clients disagree on "url" vs "link"; make sure "url" is always present
+        for result in results or []:
+            if "url" not in result and "link" in result:
+                result["url"] = result["link"]
+
+        return results
+
     def discover_startups(self, query: str, max_results: int = 10, start_index: int = 0, metrics_collector: Optional["MetricsCollector"] = None) -> List[Dict[str, Any]]:
         """
         Phase 1: Discover startup names based on the query.
@@ -1628,9 +1738,7 @@ class StartupCrawler:
             Tuple of (filtered_names, source_info).
         """
         # Skip processing for certain URLs that are likely to contain many false positives
-        skip_domains = ["facebook.com", "twitter.com", "instagram.com", "linkedin.com/feed",
-                       "youtube.com", "pinterest.com", "reddit.com"]
-        if any(domain in url.lower() for domain in skip_domains):
+        if _SKIP_SOCIAL_URL_RE.search(url):
             logger.info(f"Skipping social media URL: {url}")
             return [], {"Source": "Google Search", "Found In": title, "Original URL": url}
 
@@ -1816,7 +1924,7 @@ class StartupCrawler:
         merged_data = startup_info.copy()
 
         # Search for specific information about this startup
-        search_results = self.google_search.search(specific_query, max_results=max_results_per_startup)
+        search_results = self._cached_search(specific_query, max_results=max_results_per_startup)
 
         if metrics_collector:
             metrics_collector.google_api_calls += 1
@@ -1902,7 +2010,7 @@ class StartupCrawler:
             try:
                 # Search for the official website
                 website_query = f"{name} official website"
-                website_results = self.google_search.search(website_query, max_results=1)
+                website_results = self._cached_search(website_query, max_results=1)
                 if website_results:
                     # Check for both "url" and "link" keys
                     official_url = website_results[0].get("url", website_results[0].get("link", ""))
@@ -1916,7 +2024,12 @@ class StartupCrawler:
             try:
                 linkedin_url = merged_data["LinkedIn"]
                 logger.info(f"Extracting LinkedIn data for {name} from {linkedin_url}")
-                linkedin_data = LinkedInExtractor.extract_data(company_name=name, url=linkedin_url)
+                linkedin_data = LinkedInExtractor.extract_data(
+                    company_name=name,
+                    url=linkedin_url,
+                    api_client=self.api_client,
+                    already_have={key for key, value in merged_data.items() if value}
+                )
 
                 # Merge LinkedIn data
                 if linkedin_data:
@@ -1933,7 +2046,8 @@ class StartupCrawler:
             crunchbase_data = CrunchbaseExtractor.search_crunchbase_data(
                 google_search=self.google_search,
                 company_name=name,
-                max_results=3
+                max_results=3,
+                api_client=self.api_client
             )
 
             # Merge Crunchbase data
@@ -1950,7 +2064,7 @@ class StartupCrawler:
             try:
                 website_url = merged_data["Website"]
                 logger.info(f"Extracting website data for {name} from {website_url}")
-                website_data = WebsiteExtractor.extract_data(company_name=name, url=website_url)
+                website_data = WebsiteExtractor.extract_data(company_name=name, url=website_url, api_client=self.api_client)
 
                 # Merge website data
                 if website_data:
@@ -7,20 +7,104 @@ using Google Search as a proxy to avoid scraping restrictions, leveraging LLM fo
 
 import logging
 import requests
+import urllib3
 from typing import Dict, Any, Optional, List, Tuple
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from src.utils.api_client import GeminiAPIClient
+from src.utils.api_client import GeminiAPIClient, get_default_client
+
+# Disable SSL verification warnings; unverified fetches are limited to hosts with broken certificates and logged once per host
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def _create_session() -> requests.Session:
+    """
+    Create a pooled session with retries and browser-like headers for page fetches.
+
+    Returns:
+        Configured requests session.
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Set headers to mimic a browser - Crunchbase may have anti-scraping measures
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1"
+    })
+
+    return session
+
 class CrunchbaseExtractor:
     """
     Extracts data from Crunchbase company pages using Google Search as a proxy and LLM for extraction.
     """
 
+    # Shared across calls so repeated fetches reuse pooled keep-alive connections
+    _session = _create_session()
+
+    # Hosts whose certificates failed verification; only these are fetched unverified
+    _insecure_hosts = set()
+
+    # Fields extracted from Crunchbase company pages
+    FIELDS_TO_EXTRACT = (
+        "Funding",
+        "Founded Year",
+        "Location",
+        "Founders",
+        "Founder LinkedIn Profiles",
+        "CEO/Leadership",
+        "Company Description",
+        "Industry",
+        "Company Size",
+        "Funding Rounds",
+        "Investors",
+        "Technology Stack",
+        "Competitors",
+        "Market Focus",
+        "Social Media Links",
+        "Latest News",
+        "Growth Metrics"
+    )
+
+    # Fields extracted from Crunchbase search result snippets
+    SEARCH_FIELDS = (
+        "Funding",
+        "Founded Year",
+        "Location",
+        "Founders",
+        "Founder LinkedIn Profiles",
+        "CEO/Leadership",
+        "Industry",
+        "Company Size",
+        "Funding Rounds",
+        "Investors",
+        "Technology Stack",
+        "Competitors",
+        "Market Focus",
+        "Social Media Links",
+        "Latest News",
+        "Growth Metrics"
+    )
+
+    # Only build soup nodes for the tags extract_data reads
+    _parse_only = SoupStrainer(['title', 'meta', 'p', 'div', 'section', 'h1', 'h2', 'h3'])
+
     @staticmethod
     def fetch_webpage(url: str) -> Tuple[Optional[str], Optional[BeautifulSoup]]:
         """
@@ -33,33 +117,19 @@ class CrunchbaseExtractor:
             Tuple of (raw_html, soup) or (None, None) if fetch failed.
         """
         try:
-            # Create a session with retry capability
-            session = requests.Session()
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=0.1,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "HEAD"]
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-
-            # Set headers to mimic a browser - Crunchbase may have anti-scraping measures
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1"
-            }
-
-            # Make the request
-            response = session.get(url, headers=headers, timeout=15, verify=False)
+            # Make the request over the shared keep-alive session. Certificates are verified
+            # so TLS sessions can be resumed; hosts with broken certificates fall back to unverified.
+            host = urlparse(url).netloc
+            try:
+                response = CrunchbaseExtractor._session.get(url, timeout=15, verify=host not in CrunchbaseExtractor._insecure_hosts)
+            except requests.exceptions.SSLError:
+                logger.warning(f"Certificate verification failed for {host}, fetching it unverified from now on")
+                CrunchbaseExtractor._insecure_hosts.add(host)
+                response = CrunchbaseExtractor._session.get(url, timeout=15, verify=False)
             response.raise_for_status()
 
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            # Parse the HTML with lxml, keeping only the tags we extract from
+            soup = BeautifulSoup(response.text, "lxml", parse_only=CrunchbaseExtractor._parse_only)
 
             logger.info(f"Successfully fetched Crunchbase page {url} with Beautiful Soup")
             return response.text, soup
@@ -84,9 +154,9 @@ class CrunchbaseExtractor:
             Dictionary of extracted data.
         """
         try:
-            # Initialize API client if not provided
+            # Use the shared API client if none was provided
             if api_client is None:
-                api_client = GeminiAPIClient()
+                api_client = get_default_client()
 
             # If raw_html or soup is not provided, try to fetch the webpage
             if not raw_html or not soup:
@@ -97,50 +167,33 @@ class CrunchbaseExtractor:
                     logger.error(f"Failed to fetch Crunchbase page {url} with Beautiful Soup")
                     return {}
 
-            # Define the fields we want to extract
-            fields_to_extract = [
-                "Funding",
-                "Founded Year",
-                "Location",
-                "Founders",
-                "Founder LinkedIn Profiles",
-                "CEO/Leadership",
-                "Company Description",
-                "Industry",
-                "Company Size",
-                "Funding Rounds",
-                "Investors",
-                "Technology Stack",
-                "Competitors",
-                "Market Focus",
-                "Social Media Links",
-                "Latest News",
-                "Growth Metrics"
-            ]
-
             # Get text content from the soup for better processing
             if soup:
                 # Extract text from the most relevant parts of the page
-                text_content = ""
+                parts = []
 
                 # Add the title
                 if soup.title:
-                    text_content += f"Title: {soup.title.get_text()}\n\n"
+                    parts.append(f"Title: {soup.title.get_text()}\n\n")
 
                 # Add meta descriptions
                 meta_desc = soup.find('meta', attrs={'name': 'description'})
                 if meta_desc and 'content' in meta_desc.attrs:
-                    text_content += f"Meta Description: {meta_desc['content']}\n\n"
+                    parts.append(f"Meta Description: {meta_desc['content']}\n\n")
 
                 # Extract text from main content sections
                 main_content = soup.find_all(['p', 'div', 'section', 'h1', 'h2', 'h3'])
                 for element in main_content:
-                    if element.get_text().strip():
-                        text_content += element.get_text().strip() + "\n"
+                    element_text = element.get_text().strip()
+                    if element_text:
+                        parts.append(element_text + "\n")
+
+                text_content = "".join(parts)
 
-                # If we couldn't extract meaningful text, fall back to raw HTML
-                if len(text_content) < 100 and raw_html:
-                    text_content = raw_html
+                # If we couldn't extract meaningful text, fall back to all of the page's text
+                # rather than re-sending the raw HTML the soup was parsed from
+                if len(text_content) < 100:
+                    text_content = soup.get_text(separator="\n", strip=True)[:10000]
             elif raw_html:
                 text_content = raw_html
             else:
@@ -152,7 +205,7 @@ class CrunchbaseExtractor:
                 company_name=company_name,
                 source_type="Crunchbase",
                 content=text_content,
-                fields=fields_to_extract
+                fields=CrunchbaseExtractor.FIELDS_TO_EXTRACT
             )
 
             logger.info(f"Extracted Crunchbase data for {company_name} using LLM: {list(crunchbase_data.keys())}")
@@ -162,6 +215,68 @@ class CrunchbaseExtractor:
             logger.error(f"Error extracting Crunchbase data from {url}: {e}")
             return {}
 
+    @staticmethod
+    def get_search_query(company_name: str) -> str:
+        """
+        Build the Google Search query used to find Crunchbase results for a company.
+
+        Args:
+            company_name: Name of the company.
+
+        Returns:
+            Search query string.
+        """
+        return f"site:crunchbase.com {company_name} company"
+
+    @staticmethod
+    def format_search_snippets(company_name: str, search_results: List[Dict[str, Any]]) -> str:
+        """
+        Combine Crunchbase search result snippets into a single text.
+
+        Args:
+            company_name: Name of the company.
+            search_results: List of search result dictionaries.
+
+        Returns:
+            Combined snippet text, or an empty string if there are no results.
+        """
+        if not search_results:
+            return ""
+
+        parts = [f"Crunchbase information for {company_name}:\n"]
+
+        for result in search_results:
+            title = result.get("title", "")
+            snippet = result.get("snippet", "")
+            url = result.get("url", "")
+
+            parts.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}\n")
+
+        return "\n".join(parts)
+
+    @staticmethod
+    def search_crunchbase_snippets(google_search, company_name: str, max_results: int = 3) -> str:
+        """
+        Search for Crunchbase results using Google Search and combine their snippets.
+
+        Args:
+            google_search: GoogleSearchClient instance.
+            company_name: Name of the company.
+            max_results: Maximum number of search results to process.
+
+        Returns:
+            Combined snippet text, or an empty string if nothing was found.
+        """
+        try:
+            # Search for Crunchbase information
+            search_results = google_search.search(CrunchbaseExtractor.get_search_query(company_name), max_results=max_results)
+
+            return CrunchbaseExtractor.format_search_snippets(company_name, search_results)
+
+        except Exception as e:
+            logger.error(f"Error searching Crunchbase snippets for {company_name}: {e}")
+            return ""
+
     @staticmethod
     def search_crunchbase_data(google_search, company_name: str, max_results: int = 3, api_client: Optional[GeminiAPIClient] = None) -> Dict[str, Any]:
         """
@@ -177,57 +292,21 @@ class CrunchbaseExtractor:
             Dictionary of extracted data.
         """
         try:
-            # Initialize API client if not provided
+            # Use the shared API client if none was provided
             if api_client is None:
-                api_client = GeminiAPIClient()
+                api_client = get_default_client()
 
-            # Create a specific query for Crunchbase
-            crunchbase_query = f"site:crunchbase.com {company_name} company"
+            combined_text = CrunchbaseExtractor.search_crunchbase_snippets(google_search, company_name, max_results)
 
-            # Search for Crunchbase information
-            search_results = google_search.search(crunchbase_query, max_results=max_results)
-
-            if not search_results:
+            if not combined_text:
                 return {}
 
-            # Combine all snippets into a single text for better context
-            combined_text = f"Crunchbase information for {company_name}:\n\n"
-
-            for result in search_results:
-                title = result.get("title", "")
-                snippet = result.get("snippet", "")
-                url = result.get("url", "")
-
-                combined_text += f"Title: {title}\n"
-                combined_text += f"URL: {url}\n"
-                combined_text += f"Snippet: {snippet}\n\n"
-
-            # Define the fields we want to extract
-            fields_to_extract = [
-                "Funding",
-                "Founded Year",
-                "Location",
-                "Founders",
-                "Founder LinkedIn Profiles",
-                "CEO/Leadership",
-                "Industry",
-                "Company Size",
-                "Funding Rounds",
-                "Investors",
-                "Technology Stack",
-                "Competitors",
-                "Market Focus",
-                "Social Media Links",
-                "Latest News",
-                "Growth Metrics"
-            ]
-
             # Use the LLM to extract structured data
             crunchbase_data = api_client.extract_structured_data(
                 company_name=company_name,
                 source_type="Crunchbase Search Results",
                 content=combined_text,
-                fields=fields_to_extract
+                fields=CrunchbaseExtractor.SEARCH_FIELDS
             )
 
             logger.info(f"Extracted Crunchbase data for {company_name} from Google Search using LLM: {list(crunchbase_data.keys())}")
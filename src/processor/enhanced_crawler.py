@@ -7,17 +7,22 @@ It also supports API key rotation to avoid rate limits.
 """
 
 import logging
+import re
 import time
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import threading
+import concurrent.futures
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+
+from bs4 import BeautifulSoup
 
 from src.processor.crawler import StartupCrawler
 from src.processor.website_extractor import WebsiteExtractor
 from src.processor.linkedin_extractor import LinkedInExtractor
 from src.processor.crunchbase_extractor import CrunchbaseExtractor
-from src.utils.api_client import GeminiAPIClient
 from src.utils.api_key_manager import APIKeyManager
 from src.utils.enhanced_google_search_client import EnhancedGoogleSearchClient
 from src.utils.content_processor import ContentProcessor
+from src.utils.text_cleaner import TextCleaner
 
 # Type checking imports
 if TYPE_CHECKING:
@@ -26,6 +31,26 @@ if TYPE_CHECKING:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Domains that are never a company's official website
+_SKIP_DOMAINS_RE = re.compile(r"(?:linkedin|twitter|facebook|instagram|youtube|crunchbase)\.com", re.I)
+
+# Scheme and "www." prefix stripped before comparing a URL with the company name
+_URL_STRIP_RE = re.compile(r"^https?://(?:www\.)?", re.I)
+
+# LinkedIn company page URLs
+_LINKEDIN_COMPANY_RE = re.compile(r"linkedin\.com/company/", re.I)
+
+
+def _fill_missing(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """
+    Copy non-empty values from src into dst for keys that are missing or empty in dst.
+
+    Args:
+        dst: Data dictionary to update in place.
+        src: Newly extracted data.
+    """
+    dst.update({key: value for key, value in src.items() if value and not dst.get(key)})
+
 class EnhancedStartupCrawler(StartupCrawler):
     """
     Enhanced version of the StartupCrawler that uses Google Search as a proxy
@@ -33,6 +58,15 @@ class EnhancedStartupCrawler(StartupCrawler):
     to avoid rate limits.
     """
 
+    # Fields that, once all filled, make further enrichment steps unnecessary
+    TARGET_FIELDS = ("Company Description", "Company Size", "Industry", "Founded Year", "Location", "Founders", "Funding", "Products/Services")
+
+    # Fields filled from general search results when still missing
+    ADDITIONAL_INFO_FIELDS = ("Location", "Founded Year", "Industry", "Funding", "Company Description", "Products/Services")
+
+    # Fields extracted from LinkedIn search result snippets
+    LINKEDIN_SEARCH_FIELDS = ("Company Description", "Company Size", "Industry", "Founded Year", "Location", "Founders")
+
     def __init__(self, max_workers: int = 5, key_manager: Optional[APIKeyManager] = None):
         """Initialize the enhanced startup crawler.
 
@@ -131,27 +165,64 @@ class EnhancedStartupCrawler(StartupCrawler):
         # Step 1: Find the company's official website
         merged_data = self._find_official_website(name, merged_data)
 
-        # Step 2: Find the company's LinkedIn page and extract data
-        merged_data = self._extract_linkedin_data(name, merged_data)
+        # Step 2: Collect search snippets from LinkedIn, Crunchbase and general search.
+        # The three searches are independent, so run them concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            linkedin_future = executor.submit(self._collect_linkedin_sources, name)
+            crunchbase_future = executor.submit(self._collect_crunchbase_sources, name)
+            general_future = executor.submit(self._collect_general_sources, name, max_results_per_startup)
+
+            linkedin_sources, linkedin_data = linkedin_future.result()
+            crunchbase_sources = crunchbase_future.result()
+            general_sources = general_future.result()
+
+        # Merge the LinkedIn URL found while collecting
+        _fill_missing(merged_data, linkedin_data)
 
-        # Step 3: Extract data from Crunchbase
-        merged_data = self._extract_crunchbase_data(name, merged_data)
+        sources = linkedin_sources + crunchbase_sources + general_sources
+
+        # Step 3: Extract fields from all snippet sources in a single LLM call
+        merged_data = self._extract_from_sources(name, merged_data, sources)
+
+        if not self._get_missing_fields(merged_data, self.TARGET_FIELDS):
+            logger.info(f"All target fields filled for {name} from search snippets, skipping remaining steps")
+            return merged_data
 
         # Step 4: Extract data from the official website if available
         merged_data = self._extract_website_data(name, merged_data)
 
-        # Step 5: Gather additional information from general search results
+        if not self._get_missing_fields(merged_data, self.TARGET_FIELDS):
+            logger.info(f"All target fields filled for {name} after website extraction, skipping remaining steps")
+            return merged_data
+
+        # Step 5: Gather additional information from general search result pages
         merged_data = self._gather_additional_info(name, merged_data, max_results_per_startup)
 
         return merged_data
 
-    def _find_official_website(self, company_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _get_missing_fields(data: Dict[str, Any], fields: List[str]) -> List[str]:
+        """
+        Get the fields that are still missing or empty in the data.
+
+        Args:
+            data: Current data dictionary.
+            fields: Fields to check.
+
+        Returns:
+            List of missing field names, in the given order.
+        """
+        return [field for field in fields if not data.get(field)]
+
+    def _find_official_website(self, company_name: str, data: Dict[str, Any], strict_match: bool = False) -> Dict[str, Any]:
         """
         Find the official website for a company.
 
         Args:
             company_name: Name of the company.
             data: Current data dictionary.
+            strict_match: If the combined query finds no URL matching the company name,
+                also try the individual legacy queries before accepting the first result.
 
         Returns:
             Updated data dictionary.
@@ -160,182 +231,250 @@ class EnhancedStartupCrawler(StartupCrawler):
             return data
 
         try:
-            # Try different search queries to find the official website
-            search_queries = [
-                f"\"{company_name}\" official website",
-                f"{company_name} company website",
-                f"{company_name} homepage"
-            ]
-
-            for query in search_queries:
-                website_results = self.google_search.search(query, max_results=3)
-
-                if website_results:
-                    for result in website_results:
-                        url = result.get("url", "")
-
-                        # Skip LinkedIn, Twitter, Facebook, etc.
-                        if any(domain in url.lower() for domain in ["linkedin.com", "twitter.com", "facebook.com", "instagram.com", "youtube.com", "crunchbase.com"]):
-                            continue
-
-                        # Check if the URL contains the company name or looks like an official website
-                        normalized_company = company_name.lower().replace(" ", "").replace("-", "").replace(".", "")
-                        normalized_url = url.lower().replace("www.", "").replace("http://", "").replace("https://", "")
-
-                        # If the URL contains the company name or starts with the company name, it's likely the official website
-                        if normalized_company in normalized_url.replace(".", "") or normalized_url.split(".")[0] == normalized_company:
-                            data["Website"] = url
-                            logger.info(f"Found official website for {company_name}: {url}")
-                            return data
-
-            # If we couldn't find a good match, return the first result from the first query
-            if website_results:
-                url = website_results[0].get("url", "")
-                if not any(domain in url.lower() for domain in ["linkedin.com", "twitter.com", "facebook.com", "instagram.com", "youtube.com", "crunchbase.com"]):
+            # Normalize the company name once for comparison with candidate URLs
+            normalized_company = company_name.lower().replace(" ", "").replace("-", "").replace(".", "")
+
+            # One combined query covers the "official website" and "homepage" variants
+            website_query = (
+                f"\"{company_name}\" (official website OR homepage) "
+                f"-site:linkedin.com -site:twitter.com -site:facebook.com -site:crunchbase.com"
+            )
+            website_results = self._cached_search(website_query, max_results=5)
+
+            url = self._match_official_website(normalized_company, website_results)
+
+            if not url and strict_match:
+                # Try the individual queries to find a better match
+                search_queries = [
+                    f"\"{company_name}\" official website",
+                    f"{company_name} company website",
+                    f"{company_name} homepage"
+                ]
+
+                for query in search_queries:
+                    url = self._match_official_website(normalized_company, self._cached_search(query, max_results=3))
+                    if url:
+                        break
+
+            if url:
+                data["Website"] = url
+                logger.info(f"Found official website for {company_name}: {url}")
+                return data
+
+            # If we couldn't find a good match, use the first usable result of the combined query
+            for result in website_results:
+                url = result.get("url", "")
+                if url and not _SKIP_DOMAINS_RE.search(url):
                     data["Website"] = url
                     logger.info(f"Using first result as website for {company_name}: {url}")
+                    break
 
             return data
         except Exception as e:
             logger.error(f"Error finding official website for {company_name}: {e}")
             return data
 
-    def _extract_linkedin_data(self, company_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _match_official_website(normalized_company: str, website_results: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Find the search result URL that looks like the company's official website.
+
+        Args:
+            normalized_company: Company name, lowercased without spaces, dashes or dots.
+            website_results: List of search result dictionaries.
+
+        Returns:
+            The matching URL, or None if no result matches.
+        """
+        for result in website_results or []:
+            url = result.get("url", "")
+
+            # Skip LinkedIn, Twitter, Facebook, etc.
+            if not url or _SKIP_DOMAINS_RE.search(url):
+                continue
+
+            # Check if the URL contains the company name or looks like an official website
+            normalized_url = _URL_STRIP_RE.sub("", url.lower())
+
+            # If the URL contains the company name or starts with the company name, it's likely the official website
+            if normalized_company in normalized_url.replace(".", "") or normalized_url.split(".")[0] == normalized_company:
+                return url
+
+        return None
+
+    def _format_snippets(self, header: str, search_results: List[Dict[str, Any]]) -> str:
+        """
+        Combine search result snippets into a single text for LLM extraction.
+
+        Args:
+            header: Header line describing the snippets.
+            search_results: List of search result dictionaries.
+
+        Returns:
+            Combined snippet text.
+        """
+        parts = [f"{header}:\n"]
+
+        for result in search_results:
+            title = result.get("title", "")
+            snippet = result.get("snippet", "")
+            url = result.get("url", "")
+
+            parts.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}\n")
+
+        return "\n".join(parts)
+
+    def _collect_linkedin_sources(self, company_name: str) -> Tuple[List[Tuple[str, str, List[str]]], Dict[str, Any]]:
         """
-        Extract data from LinkedIn using Google Search as a proxy and LLM for extraction.
+        Collect LinkedIn search snippets for a company.
 
         Args:
             company_name: Name of the company.
-            data: Current data dictionary.
 
         Returns:
-            Updated data dictionary.
+            Tuple of (list of (source_type, content, fields) tuples, new data such as the LinkedIn URL).
         """
-        try:
-            # Create an API client instance for LLM extraction
-            api_client = GeminiAPIClient()
+        linkedin_data = {}
 
+        try:
             # Search for LinkedIn information
             linkedin_query = f"site:linkedin.com/company/ \"{company_name}\""
-            linkedin_results = self.google_search.search(linkedin_query, max_results=5)
-
-            if linkedin_results:
-                # First, try to get the LinkedIn URL if we don't have it
-                if "LinkedIn" not in data or not data["LinkedIn"]:
-                    for result in linkedin_results:
-                        url = result.get("url", "")
-                        if "linkedin.com/company/" in url:
-                            data["LinkedIn"] = url
-                            logger.info(f"Found LinkedIn page for {company_name}: {url}")
-                            break
+            linkedin_results = self._cached_search(linkedin_query, max_results=5)
 
-                # Combine all snippets into a single text for better context
-                combined_text = f"LinkedIn information for {company_name}:\n\n"
-
-                for result in linkedin_results:
-                    title = result.get("title", "")
-                    snippet = result.get("snippet", "")
-                    url = result.get("url", "")
-
-                    combined_text += f"Title: {title}\n"
-                    combined_text += f"URL: {url}\n"
-                    combined_text += f"Snippet: {snippet}\n\n"
-
-                # Define the fields we want to extract
-                fields_to_extract = [
-                    "Company Description",
-                    "Company Size",
-                    "Industry",
-                    "Founded Year",
-                    "Location",
-                    "Founders"
-                ]
+            if not linkedin_results:
+                return [], linkedin_data
 
-                # Use the LLM to extract structured data
-                linkedin_data = api_client.extract_structured_data(
-                    company_name=company_name,
-                    source_type="LinkedIn Search Results",
-                    content=combined_text,
-                    fields=fields_to_extract
-                )
+            # Combine the snippets and pick up the LinkedIn company URL in a single pass
+            parts = [f"LinkedIn information for {company_name}:\n"]
 
-                # Merge the LinkedIn data with the main data
-                for key, value in linkedin_data.items():
-                    if value and (key not in data or not data[key]):
-                        data[key] = value
+            for result in linkedin_results:
+                title = result.get("title", "")
+                snippet = result.get("snippet", "")
+                url = result.get("url", "")
 
-                logger.info(f"Extracted LinkedIn data for {company_name} using LLM: {list(linkedin_data.keys())}")
+                if "LinkedIn" not in linkedin_data and _LINKEDIN_COMPANY_RE.search(url):
+                    linkedin_data["LinkedIn"] = url
+                    logger.info(f"Found LinkedIn page for {company_name}: {url}")
 
-            return data
+                parts.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}\n")
+
+            combined_text = "\n".join(parts)
+            return [("LinkedIn Search Results", combined_text, self.LINKEDIN_SEARCH_FIELDS)], linkedin_data
         except Exception as e:
-            logger.error(f"Error extracting LinkedIn data for {company_name}: {e}")
-            return data
+            logger.error(f"Error collecting LinkedIn data for {company_name}: {e}")
+            return [], linkedin_data
 
-    def _extract_crunchbase_data(self, company_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _collect_crunchbase_sources(self, company_name: str) -> List[Tuple[str, str, List[str]]]:
         """
-        Extract data from Crunchbase using Google Search as a proxy and LLM for extraction.
+        Collect Crunchbase and funding search snippets for a company.
 
         Args:
             company_name: Name of the company.
-            data: Current data dictionary.
 
         Returns:
-            Updated data dictionary.
+            List of (source_type, content, fields) tuples.
         """
+        sources = []
+
         try:
-            # Create an API client instance for LLM extraction
-            api_client = GeminiAPIClient()
+            # Search Crunchbase through the shared search cache and format the snippets
+            crunchbase_results = self._cached_search(CrunchbaseExtractor.get_search_query(company_name), max_results=5)
+            crunchbase_text = CrunchbaseExtractor.format_search_snippets(company_name, crunchbase_results)
 
-            # Use the Crunchbase extractor to search for data from Google Search snippets
-            crunchbase_data = CrunchbaseExtractor.search_crunchbase_data(
-                google_search=self.google_search,
-                company_name=company_name,
-                max_results=5,
-                api_client=api_client
-            )
+            if crunchbase_text:
+                sources.append(("Crunchbase Search Results", crunchbase_text, CrunchbaseExtractor.SEARCH_FIELDS))
+        except Exception as e:
+            logger.error(f"Error collecting Crunchbase data for {company_name}: {e}")
 
-            # Try an alternative search query to get more information about funding
-            try:
-                funding_query = f"\"{company_name}\" funding raised crunchbase"
-                funding_results = self.google_search.search(funding_query, max_results=5)
+        # Try an alternative search query to get more information about funding
+        try:
+            funding_query = f"\"{company_name}\" funding raised crunchbase"
+            funding_results = self._cached_search(funding_query, max_results=5)
 
-                if funding_results and "Funding" not in crunchbase_data:
-                    # Combine all snippets into a single text for better context
-                    combined_text = f"Funding information for {company_name}:\n\n"
+            if funding_results:
+                combined_text = self._format_snippets(f"Funding information for {company_name}", funding_results)
+                sources.append(("Funding Search Results", combined_text, ["Funding", "Funding Rounds", "Investors"]))
+        except Exception as e:
+            logger.warning(f"Error getting additional funding data for {company_name}: {e}")
 
-                    for result in funding_results:
-                        title = result.get("title", "")
-                        snippet = result.get("snippet", "")
-                        url = result.get("url", "")
+        return sources
 
-                        combined_text += f"Title: {title}\n"
-                        combined_text += f"URL: {url}\n"
-                        combined_text += f"Snippet: {snippet}\n\n"
+    def _search_general_info(self, company_name: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        Run the general information search for a company.
 
-                    # Use the LLM to extract funding information
-                    funding_data = api_client.extract_structured_data(
-                        company_name=company_name,
-                        source_type="Funding Search Results",
-                        content=combined_text,
-                        fields=["Funding", "Funding Rounds", "Investors"]
-                    )
+        Args:
+            company_name: Name of the company.
+            max_results: Maximum number of search results to return.
+
+        Returns:
+            List of search result dictionaries.
+        """
+        specific_query = f"\"{company_name}\" startup company information"
+        return self._cached_search(specific_query, max_results=max_results)
+
+    def _collect_general_sources(self, company_name: str, max_results: int) -> List[Tuple[str, str, List[str]]]:
+        """
+        Collect general search snippets for a company.
+
+        Args:
+            company_name: Name of the company.
+            max_results: Maximum number of search results to process.
+
+        Returns:
+            List of (source_type, content, fields) tuples.
+        """
+        try:
+            search_results = self._search_general_info(company_name, max_results)
+
+            if not search_results:
+                return []
+
+            combined_text = self._format_snippets(f"General information for {company_name}", search_results)
+            return [("General Search Results", combined_text, self.ADDITIONAL_INFO_FIELDS)]
+        except Exception as e:
+            logger.error(f"Error collecting general search data for {company_name}: {e}")
+            return []
+
+    def _extract_from_sources(self, company_name: str, data: Dict[str, Any], sources: List[Tuple[str, str, List[str]]]) -> Dict[str, Any]:
+        """
+        Extract the still-missing fields from all collected sources with a single LLM call.
+
+        Args:
+            company_name: Name of the company.
+            data: Current data dictionary.
+            sources: List of (source_type, content, fields) tuples.
+
+        Returns:
+            Updated data dictionary.
+        """
+        if not sources:
+            return data
+
+        # Union of the requested fields that we don't already have, preserving order
+        missing_fields = []
+        for _, _, fields in sources:
+            for field in fields:
+                if field not in missing_fields and (field not in data or not data[field]):
+                    missing_fields.append(field)
 
-                    # Add any new funding data
-                    for key, value in funding_data.items():
-                        if value and key not in crunchbase_data:
-                            crunchbase_data[key] = value
-            except Exception as e:
-                logger.warning(f"Error getting additional funding data for {company_name}: {e}")
+        if not missing_fields:
+            return data
 
-            # Merge the Crunchbase data with the main data
-            for key, value in crunchbase_data.items():
-                if value and (key not in data or not data[key]):
-                    data[key] = value
+        try:
+            extracted_data = self.api_client.extract_structured_data_multi(
+                company_name=company_name,
+                sources=[(source_type, content) for source_type, content, _ in sources],
+                fields=missing_fields
+            )
+
+            # Merge the extracted data with the main data
+            _fill_missing(data, extracted_data)
 
-            logger.info(f"Extracted Crunchbase data for {company_name} using LLM: {list(crunchbase_data.keys())}")
+            logger.info(f"Extracted search snippet data for {company_name} using LLM: {list(extracted_data.keys())}")
             return data
         except Exception as e:
-            logger.error(f"Error extracting Crunchbase data for {company_name}: {e}")
+            logger.error(f"Error extracting search snippet data for {company_name}: {e}")
             return data
 
     def _extract_website_data(self, company_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -349,191 +488,188 @@ class EnhancedStartupCrawler(StartupCrawler):
         Returns:
             Updated data dictionary.
         """
-        if "Website" in data and data["Website"]:
-            try:
-                # Create an API client instance for LLM extraction
-                api_client = GeminiAPIClient()
-
-                # Fetch the website
-                official_url = data["Website"]
-                raw_html, soup = self.web_crawler.fetch_webpage(official_url)
-
-                if raw_html and soup:
-                    # Process the raw HTML with the ContentProcessor
-                    cleaned_content = self.content_processor.process_raw_content(raw_html, content_type="html")
-
-                    # If the content is large, chunk it for more efficient processing
-                    if len(cleaned_content) > 50000:
-                        logger.info(f"Content for {company_name} website is large ({len(cleaned_content)} chars), chunking for processing")
-                        chunks = self.content_processor.chunk_text(cleaned_content)
-
-                        # Process each chunk and combine the results
-                        all_website_data = {}
-                        for i, chunk in enumerate(chunks):
-                            logger.info(f"Processing chunk {i+1}/{len(chunks)} for {company_name} website")
-
-                            # Extract data from this chunk
-                            chunk_data = WebsiteExtractor.extract_data(
-                                company_name=company_name,
-                                url=official_url,
-                                raw_html=chunk,  # Use the cleaned and chunked content
-                                soup=None,       # No need for soup with cleaned content
-                                api_client=api_client,
-                                is_processed_content=True  # Flag to indicate this is already processed content
-                            )
-
-                            # Merge chunk data into all_website_data
-                            for key, value in chunk_data.items():
-                                if value and (key not in all_website_data or not all_website_data[key]):
-                                    all_website_data[key] = value
-
-                        # Use the combined data
-                        website_data = all_website_data
-                    else:
-                        # For smaller content, process directly
-                        website_data = WebsiteExtractor.extract_data(
-                            company_name=company_name,
-                            url=official_url,
-                            raw_html=raw_html,
-                            soup=soup,
-                            api_client=api_client
-                        )
-
-                    # Merge the extracted data
-                    for key, value in website_data.items():
-                        if value and (key not in data or not data[key]):
-                            data[key] = value
-
-                    logger.info(f"Extracted website data for {company_name} using LLM: {list(website_data.keys())}")
-                else:
-                    # If we couldn't fetch the website directly, try to get data from Google's cached version
-                    try:
-                        cache_query = f"cache:{official_url}"
-                        cache_results = self.google_search.search(cache_query, max_results=1)
-
-                        if cache_results:
-                            # Extract basic info from the snippet using LLM
-                            snippet = cache_results[0].get("snippet", "")
-                            title = cache_results[0].get("title", "")
-
-                            # Combine into text for LLM processing
-                            cache_text = f"Title: {title}\nSnippet: {snippet}\n"
-
-                            # Use LLM to extract data from cache
-                            cache_data = api_client.extract_structured_data(
-                                company_name=company_name,
-                                source_type="Website Cache",
-                                content=cache_text,
-                                fields=["Company Description", "Products/Services"]
-                            )
-
-                            # Merge cache data
-                            for key, value in cache_data.items():
-                                if value and (key not in data or not data[key]):
-                                    data[key] = value
-
-                            logger.info(f"Used Google cache with LLM for {company_name} website data")
-                    except Exception as e:
-                        logger.warning(f"Error getting cached website data for {company_name}: {e}")
-            except Exception as e:
-                logger.error(f"Error extracting data from website {data.get('Website')}: {e}")
-
-                # If direct access fails, try an alternative approach using Google search
-                try:
-                    about_query = f"site:{data['Website']} about {company_name}"
-                    about_results = self.google_search.search(about_query, max_results=5)
-
-                    if about_results:
-                        # Combine all snippets into a single text for better context
-                        about_text = f"About information for {company_name} from website {data['Website']}:\n\n"
-
-                        for result in about_results:
-                            title = result.get("title", "")
-                            snippet = result.get("snippet", "")
-                            url = result.get("url", "")
-
-                            about_text += f"Title: {title}\n"
-                            about_text += f"URL: {url}\n"
-                            about_text += f"Snippet: {snippet}\n\n"
-
-                        # Use LLM to extract data from about page
-                        about_data = api_client.extract_structured_data(
-                            company_name=company_name,
-                            source_type="Website About Page",
-                            content=about_text,
-                            fields=["Company Description", "Location", "Founded Year", "Products/Services"]
-                        )
-
-                        # Merge about data
-                        for key, value in about_data.items():
-                            if value and (key not in data or not data[key]):
-                                data[key] = value
-
-                        logger.info(f"Used Google search with LLM for {company_name} website data")
-                except Exception as e:
-                    logger.warning(f"Error getting alternative website data for {company_name}: {e}")
+        if "Website" not in data or not data["Website"]:
+            return data
+
+        official_url = data["Website"]
+
+        # Fetch the website
+        try:
+            raw_html, soup = self.web_crawler.fetch_webpage(official_url)
+        except Exception as e:
+            logger.error(f"Error fetching website {official_url}: {e}")
+            raw_html, soup = None, None
+
+        # Only fall back to search snippets when the website couldn't be fetched
+        if raw_html and soup:
+            return self._extract_website_data_direct(company_name, data, official_url, raw_html, soup)
+
+        return self._extract_website_data_fallback(company_name, data, official_url)
+
+    def _extract_website_data_direct(self, company_name: str, data: Dict[str, Any], official_url: str,
+                                     raw_html: str, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract data from the fetched content of the company's official website using LLM.
+
+        Args:
+            company_name: Name of the company.
+            data: Current data dictionary.
+            official_url: URL of the official website.
+            raw_html: Fetched content of the website.
+            soup: Parsed website.
+
+        Returns:
+            Updated data dictionary.
+        """
+        try:
+            # Reuse the crawler's shared API client for LLM extraction
+            api_client = self.api_client
+
+            # Process the raw HTML with the ContentProcessor
+            cleaned_content = self.content_processor.process_raw_content(raw_html, content_type="html")
+
+            # If the content is large, chunk it for more efficient processing
+            if len(cleaned_content) > 50000:
+                logger.info(f"Content for {company_name} website is large ({len(cleaned_content)} chars), chunking for processing")
+                chunks = self.content_processor.chunk_text(cleaned_content)
+
+                # Process each chunk and combine the results
+                all_website_data = {}
+                for i, chunk in enumerate(chunks):
+                    logger.info(f"Processing chunk {i+1}/{len(chunks)} for {company_name} website")
+
+                    # Extract data from this chunk
+                    chunk_data = WebsiteExtractor.extract_data(
+                        company_name=company_name,
+                        url=official_url,
+                        raw_html=chunk,  # Use the cleaned and chunked content
+                        soup=None,       # No need for soup with cleaned content
+                        api_client=api_client,
+                        is_processed_content=True  # Flag to indicate this is already processed content
+                    )
+
+                    # Merge chunk data into all_website_data
+                    _fill_missing(all_website_data, chunk_data)
+
+                # Use the combined data
+                website_data = all_website_data
+            else:
+                # For smaller content, process directly
+                website_data = WebsiteExtractor.extract_data(
+                    company_name=company_name,
+                    url=official_url,
+                    raw_html=raw_html,
+                    soup=soup,
+                    api_client=api_client
+                )
+
+            # Merge the extracted data
+            _fill_missing(data, website_data)
+
+            logger.info(f"Extracted website data for {company_name} using LLM: {list(website_data.keys())}")
+        except Exception as e:
+            logger.error(f"Error extracting data from website {official_url}: {e}")
 
         return data
 
-    def _gather_additional_info(self, company_name: str, data: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+    def _extract_website_data_fallback(self, company_name: str, data: Dict[str, Any], official_url: str) -> Dict[str, Any]:
         """
-        Gather additional information about a company from general search results using LLM.
+        Extract website data from Google search snippets when the website can't be fetched.
 
         Args:
             company_name: Name of the company.
             data: Current data dictionary.
-            max_results: Maximum number of search results to process.
+            official_url: URL of the official website.
 
         Returns:
             Updated data dictionary.
         """
+        # Reuse the crawler's shared API client for LLM extraction
+        api_client = self.api_client
+
+        # Try to get data from Google's cached version
         try:
-            # Create an API client instance for LLM extraction
-            api_client = GeminiAPIClient()
+            cache_query = f"cache:{official_url}"
+            cache_results = self._cached_search(cache_query, max_results=1)
 
-            # Create a specific query for this startup
-            specific_query = f"\"{company_name}\" startup company information"
+            if cache_results:
+                # Extract basic info from the snippet using LLM
+                snippet = cache_results[0].get("snippet", "")
+                title = cache_results[0].get("title", "")
 
-            # Search for specific information about this startup
-            search_results = self.google_search.search(specific_query, max_results=max_results)
+                # Combine into text for LLM processing
+                cache_text = f"Title: {title}\nSnippet: {snippet}\n"
 
-            if not search_results:
-                return data
+                # Use LLM to extract data from cache
+                cache_data = api_client.extract_structured_data(
+                    company_name=company_name,
+                    source_type="Website Cache",
+                    content=cache_text,
+                    fields=["Company Description", "Products/Services"]
+                )
 
-            # First, try to extract information from search snippets using LLM
-            combined_text = f"General information for {company_name}:\n\n"
+                # Merge cache data
+                _fill_missing(data, cache_data)
 
-            for result in search_results:
-                title = result.get("title", "")
-                snippet = result.get("snippet", "")
-                url = result.get("url", "")
+                logger.info(f"Used Google cache with LLM for {company_name} website data")
+        except Exception as e:
+            logger.warning(f"Error getting cached website data for {company_name}: {e}")
+
+        # Try an alternative approach using Google search, only for fields still missing
+        about_fields = self._get_missing_fields(data, ["Company Description", "Location", "Founded Year", "Products/Services"])
+        if not about_fields:
+            return data
 
-                combined_text += f"Title: {title}\n"
-                combined_text += f"URL: {url}\n"
-                combined_text += f"Snippet: {snippet}\n\n"
+        try:
+            about_query = f"site:{official_url} about {company_name}"
+            about_results = self._cached_search(about_query, max_results=5)
 
-            # Define fields that might be missing from our data
-            missing_fields = []
-            for field in ["Location", "Founded Year", "Industry", "Funding", "Company Description", "Products/Services"]:
-                if field not in data or not data[field]:
-                    missing_fields.append(field)
+            if about_results:
+                # Combine all snippets into a single text for better context
+                about_text = self._format_snippets(
+                    f"About information for {company_name} from website {official_url}",
+                    about_results
+                )
 
-            # If we have missing fields, try to extract them from search results
-            if missing_fields:
-                # Use LLM to extract data from search results
-                search_data = api_client.extract_structured_data(
+                # Use LLM to extract data from about page
+                about_data = api_client.extract_structured_data(
                     company_name=company_name,
-                    source_type="General Search Results",
-                    content=combined_text,
-                    fields=missing_fields
+                    source_type="Website About Page",
+                    content=about_text,
+                    fields=about_fields
                 )
 
-                # Merge search data
-                for key, value in search_data.items():
-                    if value and (key not in data or not data[key]):
-                        data[key] = value
+                # Merge about data
+                _fill_missing(data, about_data)
 
-                logger.info(f"Extracted additional data for {company_name} from search snippets using LLM: {list(search_data.keys())}")
+                logger.info(f"Used Google search with LLM for {company_name} website data")
+        except Exception as e:
+            logger.warning(f"Error getting alternative website data for {company_name}: {e}")
+
+        return data
+
+    def _gather_additional_info(self, company_name: str, data: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+        """
+        Gather additional information about a company from general search result pages using LLM.
+
+        Args:
+            company_name: Name of the company.
+            data: Current data dictionary.
+            max_results: Maximum number of search results to process.
+
+        Returns:
+            Updated data dictionary.
+        """
+        try:
+            # Nothing to gather if every field we'd look for is already filled
+            if not self._get_missing_fields(data, self.ADDITIONAL_INFO_FIELDS):
+                return data
+
+            # Reuse the general search results (served from the search cache)
+            search_results = self._search_general_info(company_name, max_results)
+
+            if not search_results:
+                return data
 
             # Prepare URLs for parallel fetching (for more detailed extraction)
             urls_to_fetch = []
@@ -551,63 +687,81 @@ class EnhancedStartupCrawler(StartupCrawler):
             # Fetch webpages in parallel
             webpage_results = self.web_crawler.fetch_webpages_parallel(urls_to_fetch)
 
-            # Process each result with LLM
-            for url, (raw_html, soup) in webpage_results.items():
-                if not raw_html or not soup:
-                    continue
-
-                # Check if we still have missing fields
-                missing_fields = []
-                for field in ["Location", "Founded Year", "Industry", "Funding", "Company Description", "Products/Services"]:
-                    if field not in data or not data[field]:
-                        missing_fields.append(field)
+            # Only pages that were fetched successfully are worth sending to the LLM
+            pages = [(url, soup) for url, (raw_html, soup) in webpage_results.items() if raw_html and soup]
 
-                # If we have all fields, we can stop
-                if not missing_fields:
-                    break
-
-                try:
-                    # Extract text content from the page
-                    text_content = ""
-
-                    # Add the title
-                    if soup.title:
-                        text_content += f"Title: {soup.title.get_text()}\n\n"
-
-                    # Add meta descriptions
-                    meta_desc = soup.find('meta', attrs={'name': 'description'})
-                    if meta_desc and 'content' in meta_desc.attrs:
-                        text_content += f"Meta Description: {meta_desc['content']}\n\n"
+            missing_fields = self._get_missing_fields(data, self.ADDITIONAL_INFO_FIELDS)
+            if not pages or not missing_fields:
+                return data
 
-                    # Extract text from main content
-                    main_content = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    for element in main_content:
-                        if element.get_text().strip():
-                            text_content += element.get_text().strip() + "\n"
+            # Process the pages with LLM concurrently, stopping once every field is filled
+            stop_event = threading.Event()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                future_to_url = {
+                    executor.submit(self._extract_additional_page, company_name, url, soup, missing_fields, stop_event): url
+                    for url, soup in pages
+                }
 
-                    # If we couldn't extract meaningful text, skip this page
-                    if len(text_content) < 100:
+                for future in concurrent.futures.as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        page_data = future.result()
+                    except Exception as e:
+                        logger.error(f"Error extracting additional data from {url}: {e}")
                         continue
 
-                    # Use LLM to extract data from the page
-                    page_data = api_client.extract_structured_data(
-                        company_name=company_name,
-                        source_type="Additional Webpage",
-                        content=text_content,
-                        fields=missing_fields
-                    )
+                    if not page_data:
+                        continue
 
                     # Merge page data
-                    for key, value in page_data.items():
-                        if value and (key not in data or not data[key]):
-                            data[key] = value
+                    _fill_missing(data, page_data)
 
                     logger.info(f"Extracted additional data for {company_name} from {url} using LLM: {list(page_data.keys())}")
 
-                except Exception as e:
-                    logger.error(f"Error extracting additional data from {url}: {e}")
+                    # If we have all fields, we can stop
+                    if not self._get_missing_fields(data, self.ADDITIONAL_INFO_FIELDS):
+                        stop_event.set()
+                        for pending in future_to_url:
+                            pending.cancel()
+                        break
 
         except Exception as e:
             logger.error(f"Error gathering additional info for {company_name}: {e}")
 
         return data
+
+    def _extract_additional_page(self, company_name: str, url: str, soup: BeautifulSoup,
+                                 fields: List[str], stop_event: threading.Event) -> Dict[str, Any]:
+        """
+        Extract additional fields from a single fetched search result page using LLM.
+
+        Args:
+            company_name: Name of the company.
+            url: URL of the page.
+            soup: Parsed page.
+            fields: Fields to extract.
+            stop_event: Set once all fields have been filled from other pages.
+
+        Returns:
+            Dictionary of extracted data.
+        """
+        if stop_event.is_set():
+            return {}
+
+        # Extract text content from the page (the fetched content is already-cleaned text,
+        # so the parsed soup is serialized back to HTML for lxml)
+        text_content = TextCleaner.extract_page_text(str(soup), ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+        # Fall back to all of the page's text, and skip the page if there still isn't enough
+        if len(text_content) < 100:
+            text_content = soup.get_text(separator="\n", strip=True)[:10000]
+            if len(text_content) < 100:
+                return {}
+
+        # Reuse the crawler's shared API client for LLM extraction
+        return self.api_client.extract_structured_data(
+            company_name=company_name,
+            source_type="Additional Webpage",
+            content=text_content,
+            fields=fields
+        )
@@ -6,7 +6,26 @@ relevance to the original query and information quality.
 """
 
 import re
-from typing import Dict, List, Any, Optional, Set
+import functools
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=10000)
+def _info_quality(fingerprint: Tuple[Tuple[str, str], ...]) -> float:
+    """
+    Calculate information quality from an important-field fingerprint.
+    
+    Args:
+        fingerprint: Tuple of (field, value) pairs for the important fields, with
+                     missing or empty values given as "".
+            
+    Returns:
+        Quality score between 0 and 1.
+    """
+    present_fields = sum(1 for _, value in fingerprint if value and value != "Unknown")
+    return present_fields / len(fingerprint)
 
 
 class Ranker:
@@ -17,25 +36,61 @@ class Ranker:
     based on their content and the original search query.
     """
     
+    # Common words ignored when matching terms
+    _STOP_WORDS = frozenset({
+        "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "with",
+        "by", "about", "as", "of", "from", "is", "are", "was", "were", "be", "been",
+        "being", "have", "has", "had", "do", "does", "did", "will", "would", "shall",
+        "should", "can", "could", "may", "might", "must", "that", "which", "who",
+        "whom", "whose", "this", "these", "those", "i", "you", "he", "she", "it",
+        "we", "they", "me", "him", "her", "us", "them"
+    })
+    
+    # Word tokenizer, compiled once rather than per call
+    _WORD_RE = re.compile(r'\b\w+\b')
+    
+    # Important fields for information quality assessment
+    _IMPORTANT_FIELDS = (
+        "Company Name",
+        "Founded Year",
+        "Location",
+        "Website",
+        "Founders",
+        "Funding Information",
+        "Technology Stack",
+        "Product Description"
+    )
+    
+    # Weights for the different components of the overall score
+    _OVERALL_WEIGHTS = {
+        "content_relevance": 0.6,
+        "information_quality": 0.4
+    }
+    
     def __init__(self):
         """Initialize the ranker."""
-        # Define important fields for information quality assessment
-        self.important_fields = [
-            "Company Name",
-            "Founded Year",
-            "Location",
-            "Website",
-            "Founders",
-            "Funding Information",
-            "Technology Stack",
-            "Product Description"
-        ]
-        
-        # Define weights for different components of the overall score
-        self.weights = {
-            "content_relevance": 0.6,
-            "information_quality": 0.4
-        }
+        # Per-instance copies so callers can tune a ranker without affecting others
+        self.important_fields = list(self._IMPORTANT_FIELDS)
+        self.weights = dict(self._OVERALL_WEIGHTS)
+        
+        # Extracted terms per query, so scoring many startups against one query tokenizes it once
+        self._query_terms_cache = {}
+    
+    def _get_query_terms(self, query: str) -> FrozenSet[str]:
+        """
+        Get the terms of a query, extracting them only the first time the query is seen.
+        
+        Args:
+            query: Search query.
+            
+        Returns:
+            Frozen set of query terms (excluding common words).
+        """
+        query_terms = self._query_terms_cache.get(query)
+        if query_terms is None:
+            query_terms = frozenset(self._extract_terms(query))
+            self._query_terms_cache[query] = query_terms
+        return query_terms
     
     def calculate_content_relevance(self, startup_data: Dict[str, Any], query: str) -> float:
         """
@@ -48,21 +103,33 @@ class Ranker:
         Returns:
             Relevance score between 0 and 1.
         """
-        # Extract query terms (excluding common words)
-        query_terms = set(self._extract_terms(query))
-        
-        # Extract terms from startup data
-        startup_terms = set()
-        for field, value in startup_data.items():
-            if isinstance(value, str):
-                startup_terms.update(self._extract_terms(value))
+        return self._calculate_content_relevance(startup_data, self._get_query_terms(query))
+    
+    def _calculate_content_relevance(self, startup_data: Dict[str, Any], query_terms: FrozenSet[str]) -> float:
+        """
+        Calculate content relevance against query terms that were already extracted.
         
-        # Calculate overlap between query terms and startup terms
+        Args:
+            startup_data: Dictionary containing startup information.
+            query_terms: Frozen set of terms extracted from the query.
+            
+        Returns:
+            Relevance score between 0 and 1.
+        """
         if not query_terms:
             return 0.0
-            
-        overlap = len(query_terms.intersection(startup_terms))
-        relevance = overlap / len(query_terms)
+        
+        # Match each field's words against the query terms. Query terms already exclude
+        # stop words and single characters, so the field words need no filtering, and
+        # we can stop as soon as every query term has been found.
+        matched_terms = set()
+        for value in startup_data.values():
+            if isinstance(value, str):
+                matched_terms.update(query_terms.intersection(self._WORD_RE.findall(value.lower())))
+                if len(matched_terms) == len(query_terms):
+                    break
+        
+        relevance = len(matched_terms) / len(query_terms)
         
         return min(1.0, relevance)
     
@@ -76,17 +143,15 @@ class Ranker:
         Returns:
             Quality score between 0 and 1.
         """
-        # Count how many important fields are present and have meaningful values
-        present_fields = 0
-        
-        for field in self.important_fields:
-            if field in startup_data and startup_data[field] and startup_data[field] != "Unknown":
-                present_fields += 1
+        # Quality doesn't depend on the query, so it is memoized on the important fields'
+        # values; re-ranking overlapping result sets reuses earlier scores
+        fingerprint = tuple(
+            (field, str(startup_data[field]) if startup_data.get(field) else "")
+            for field in self.important_fields
+        )
         
         # Calculate quality as the proportion of important fields present
-        quality = present_fields / len(self.important_fields)
-        
-        return quality
+        return _info_quality(fingerprint)
     
     def calculate_startup_relevance(self, startup_data: Dict[str, Any], query: str) -> float:
         """
@@ -99,8 +164,8 @@ class Ranker:
         Returns:
             Relevance score between 0 and 1.
         """
-        # Calculate content relevance
-        content_relevance = self.calculate_content_relevance(startup_data, query)
+        # Calculate content relevance, tokenizing the query only once per ranker
+        content_relevance = self._calculate_content_relevance(startup_data, self._get_query_terms(query))
         
         # Calculate information quality
         information_quality = self.calculate_information_quality(startup_data)
@@ -139,23 +204,35 @@ class Ranker:
         Returns:
             Ranked list of startup data dictionaries with confidence scores.
         """
-        # Calculate scores for each result
-        scored_results = []
+        if not results:
+            return []
         
-        for result in results:
-            score = self.calculate_overall_score(result, query)
-            
-            # Only include results above the minimum confidence threshold
-            if score >= min_confidence:
-                # Create a copy of the result with the confidence score added
-                scored_result = result.copy()
-                scored_result["confidence"] = score
-                scored_results.append(scored_result)
+        # Extract query terms once for the whole batch
+        query_terms = self._get_query_terms(query)
+        
+        # Fill the per-startup component scores in a single pass
+        content_scores = np.fromiter(
+            (self._calculate_content_relevance(result, query_terms) for result in results),
+            dtype=float, count=len(results)
+        )
+        quality_scores = np.fromiter(
+            (self.calculate_information_quality(result) for result in results),
+            dtype=float, count=len(results)
+        )
         
-        # Sort by score in descending order
-        ranked_results = sorted(scored_results, key=lambda x: x["confidence"], reverse=True)
+        # Weighted sum of the components, computed for all startups at once
+        scores = (
+            self.weights["content_relevance"] * content_scores +
+            self.weights["information_quality"] * quality_scores
+        )
         
-        return ranked_results
+        # Sort by score in descending order (stable, so ties keep their input order),
+        # keeping only results above the minimum confidence threshold
+        order = np.argsort(-scores, kind="stable")
+        order = order[scores[order] >= min_confidence]
+        
+        # Copy the kept results with the confidence score added
+        return [{**results[i], "confidence": float(scores[i])} for i in order]
     
     def _extract_terms(self, text: str) -> List[str]:
         """
@@ -169,23 +246,7 @@ class Ranker:
         """
         if not text:
             return []
-            
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove punctuation and split into words
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Remove common stop words
-        stop_words = {
-            "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "with",
-            "by", "about", "as", "of", "from", "is", "are", "was", "were", "be", "been",
-            "being", "have", "has", "had", "do", "does", "did", "will", "would", "shall",
-            "should", "can", "could", "may", "might", "must", "that", "which", "who",
-            "whom", "whose", "this", "these", "those", "i", "you", "he", "she", "it",
-            "we", "they", "me", "him", "her", "us", "them"
-        }
-        
-        terms = [word for word in words if word not in stop_words and len(word) > 1]
         
-        return terms
+        # Lowercase, split into words and drop stop words and single characters
+        return [word for word in self._WORD_RE.findall(text.lower())
+                if len(word) > 1 and word not in self._STOP_WORDS]
@@ -2,22 +2,280 @@
 Website data extractor for the Startup Finder project.
 """
 
+import asyncio
+import itertools
 import logging
+import re
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, Tuple
-from bs4 import BeautifulSoup
+import urllib3
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, List, Callable
+import lxml.html
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from src.utils.api_client import GeminiAPIClient
+from src.utils.api_client import GeminiAPIClient, get_default_client
+from src.utils.text_cleaner import TextCleaner
+
+# Disable SSL verification warnings; unverified fetches are limited to hosts with broken certificates and logged once per host
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sites whose links point to the company's social media profiles
+_SOCIAL_HOSTS = frozenset(["twitter.com", "x.com", "facebook.com", "linkedin.com", "instagram.com", "youtube.com"])
+
+
+def _is_social_link(href: str) -> bool:
+    """
+    Check whether a link points to a social media site.
+
+    Matches on the last two labels of the link's host, so subdomains such as
+    m.facebook.com count while look-alikes such as facebook.com.example.org
+    and URLs that only mention a social site in their path or query don't.
+
+    Args:
+        href: Link target.
+
+    Returns:
+        True if the link's host is a social media site.
+    """
+    try:
+        host = urlparse(href).hostname
+    except ValueError:
+        return False
+    if not host:
+        return False
+    return ".".join(host.rsplit(".", 2)[-2:]) in _SOCIAL_HOSTS
+
+# Section and div classes that suggest about, company, team or contact information.
+# re.A keeps the case folding ASCII-only, like the XPath translate() it replaced.
+_ABOUT_CLASS_RE = re.compile(r"about|company|team|contact", re.I | re.A)
+
+# Containers checked against the about keywords
+_ABOUT_CONTAINER_TAGS = frozenset(['section', 'div'])
+
+# Paragraph and heading tags whose text makes up the main content
+_MAIN_TEXT_TAGS = frozenset(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled session with retries and browser-like headers for page fetches.
+
+    Returns:
+        Configured requests session.
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Set headers to mimic a browser
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1"
+    })
+
+    return session
+
 class WebsiteExtractor:
     """
     Extracts data from company websites using LLM.
     """
 
+    # Fields extracted from company websites
+    FIELDS_TO_EXTRACT = (
+        "Company Description",
+        "Contact",
+        "Founded Year",
+        "Location",
+        "Products/Services",
+        "Team",
+        "Founders",
+        "Founder LinkedIn Profiles",
+        "CEO/Leadership",
+        "Industry",
+        "Technology Stack",
+        "Competitors",
+        "Market Focus",
+        "Social Media Links",
+        "Latest News",
+        "Investors",
+        "Growth Metrics"
+    )
+
+    # Maximum characters of page text sent to the LLM (~3k tokens); the useful signal is near the top
+    MAX_CHARS = 12000
+
+    # Stop collecting section and paragraph text past this many characters. Repeated
+    # lines are dropped before the MAX_CHARS cap, so this leaves a generous margin.
+    MAX_COLLECTED_CHARS = 60000
+
+    # Pages with less text than this are skeletons or error pages, not worth an LLM call
+    MIN_USEFUL_CHARS = 200
+
+    # Bytes of a page read before the rest is dropped; some sites inline megabytes of
+    # SVG and scripts that never yield useful text
+    MAX_PAGE_BYTES = 2000000
+
+    # Content types worth parsing; anything else (PDFs, images, downloads) is skipped unread
+    _HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+    # Shared across calls so repeated fetches reuse pooled keep-alive connections
+    _session = _create_session()
+
+    # Hosts whose certificates failed verification; only these are fetched unverified
+    _insecure_hosts = set()
+
+    # Only build soup nodes for the tags extract_data reads
+    _parse_only = SoupStrainer(['title', 'meta', 'p', 'div', 'section', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a'])
+
+    # Recently fetched pages, so a URL reached through several pipeline paths in one run
+    # is downloaded once. Least recently used pages are evicted past PAGE_CACHE_SIZE.
+    PAGE_CACHE_TTL = 900
+    PAGE_CACHE_SIZE = 1000
+    _page_cache = OrderedDict()
+    _page_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _get_cached_page(url: str) -> Optional[str]:
+        """
+        Get a recently fetched page's HTML.
+
+        Args:
+            url: URL of the webpage.
+
+        Returns:
+            Raw HTML, or None if the page wasn't fetched within PAGE_CACHE_TTL seconds.
+        """
+        with WebsiteExtractor._page_cache_lock:
+            cached_page = WebsiteExtractor._page_cache.get(url)
+            if cached_page is None:
+                return None
+
+            fetched_at, raw_html = cached_page
+            if time.time() - fetched_at >= WebsiteExtractor.PAGE_CACHE_TTL:
+                del WebsiteExtractor._page_cache[url]
+                return None
+
+            WebsiteExtractor._page_cache.move_to_end(url)
+            return raw_html
+
+    @staticmethod
+    def _cache_page(url: str, raw_html: str):
+        """
+        Remember a fetched page's HTML.
+
+        Args:
+            url: URL of the webpage.
+            raw_html: Raw HTML of the page.
+        """
+        with WebsiteExtractor._page_cache_lock:
+            WebsiteExtractor._page_cache[url] = (time.time(), raw_html)
+            WebsiteExtractor._page_cache.move_to_end(url)
+            while len(WebsiteExtractor._page_cache) > WebsiteExtractor.PAGE_CACHE_SIZE:
+                WebsiteExtractor._page_cache.popitem(last=False)
+
+    @staticmethod
+    def _fetch_html(url: str) -> str:
+        """
+        Fetch a webpage's HTML, reusing it if it was fetched recently.
+
+        Args:
+            url: URL of the webpage to fetch.
+
+        Returns:
+            Raw HTML of the page.
+
+        Raises:
+            requests.exceptions.RequestException: If the fetch failed.
+            ValueError: If the response is not an HTML page.
+        """
+        raw_html = WebsiteExtractor._get_cached_page(url)
+        if raw_html is not None:
+            logger.info(f"Using recently fetched page {url}")
+            return raw_html
+
+        # Make the request over the shared keep-alive session. Certificates are verified
+        # so TLS sessions can be resumed; hosts with broken certificates fall back to unverified.
+        host = urlparse(url).netloc
+        try:
+            response = WebsiteExtractor._session.get(url, timeout=15, stream=True,
+                                                     verify=host not in WebsiteExtractor._insecure_hosts)
+        except requests.exceptions.SSLError:
+            logger.warning(f"Certificate verification failed for {host}, fetching it unverified from now on")
+            WebsiteExtractor._insecure_hosts.add(host)
+            response = WebsiteExtractor._session.get(url, timeout=15, stream=True, verify=False)
+
+        with response:
+            response.raise_for_status()
+            WebsiteExtractor._check_content_type(response.headers.get("Content-Type"))
+
+            # Stream the body and stop reading once the byte limit is reached
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= WebsiteExtractor.MAX_PAGE_BYTES:
+                    logger.debug(f"Stopped reading {url} after {total} bytes")
+                    break
+
+            # Decode once with the declared encoding
+            raw_html = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+        WebsiteExtractor._cache_page(url, raw_html)
+        return raw_html
+
+    @staticmethod
+    def _check_content_type(content_type: Optional[str]):
+        """
+        Make sure a response is an HTML page before its body is read.
+
+        Args:
+            content_type: Value of the Content-Type header, if any.
+
+        Raises:
+            ValueError: If the response declares a non-HTML content type.
+        """
+        if content_type and not content_type.strip().lower().startswith(WebsiteExtractor._HTML_CONTENT_TYPES):
+            raise ValueError(f"Not an HTML page ({content_type})")
+
+    @staticmethod
+    async def _read_limited_async(response) -> str:
+        """
+        Read an aiohttp response body up to MAX_PAGE_BYTES and decode it once.
+
+        Args:
+            response: aiohttp response.
+
+        Returns:
+            Decoded (possibly truncated) body.
+        """
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= WebsiteExtractor.MAX_PAGE_BYTES:
+                break
+
+        return b"".join(chunks).decode(response.charset or "utf-8", errors="replace")
+
     @staticmethod
     def fetch_webpage(url: str) -> Tuple[Optional[str], Optional[BeautifulSoup]]:
         """
@@ -30,41 +288,342 @@ class WebsiteExtractor:
             Tuple of (raw_html, soup) or (None, None) if fetch failed.
         """
         try:
-            # Create a session with retry capability
-            session = requests.Session()
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=0.1,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "HEAD"]
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-
-            # Set headers to mimic a browser
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1"
-            }
-
-            # Make the request
-            response = session.get(url, headers=headers, timeout=15, verify=False)
-            response.raise_for_status()
+            raw_html = WebsiteExtractor._fetch_html(url)
 
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            # Parse the HTML with lxml, keeping only the tags we extract from. Soups get
+            # modified by callers, so each call parses its own even for a recently fetched page.
+            soup = BeautifulSoup(raw_html, "lxml", parse_only=WebsiteExtractor._parse_only)
 
             logger.info(f"Successfully fetched {url} with Beautiful Soup")
-            return response.text, soup
+            return raw_html, soup
 
         except Exception as e:
             logger.error(f"Failed to fetch {url} with Beautiful Soup: {e}")
             return None, None
 
+    @staticmethod
+    async def _fetch_html_async(session, url: str) -> str:
+        """
+        Fetch a webpage's HTML asynchronously, reusing it if it was fetched recently.
+
+        Args:
+            session: Shared aiohttp.ClientSession.
+            url: URL of the webpage to fetch.
+
+        Returns:
+            Raw HTML of the page.
+
+        Raises:
+            aiohttp.ClientError: If the fetch failed.
+            ValueError: If the response is not an HTML page.
+        """
+        import aiohttp
+
+        raw_html = WebsiteExtractor._get_cached_page(url)
+        if raw_html is not None:
+            logger.info(f"Using recently fetched page {url}")
+            return raw_html
+
+        # Verify certificates except for hosts already known to have broken ones
+        timeout = aiohttp.ClientTimeout(total=15)
+        host = urlparse(url).netloc
+        try:
+            async with session.get(url, timeout=timeout, ssl=host not in WebsiteExtractor._insecure_hosts) as response:
+                response.raise_for_status()
+                WebsiteExtractor._check_content_type(response.headers.get("Content-Type"))
+                raw_html = await WebsiteExtractor._read_limited_async(response)
+        except aiohttp.ClientSSLError:
+            logger.warning(f"Certificate verification failed for {host}, fetching it unverified from now on")
+            WebsiteExtractor._insecure_hosts.add(host)
+            async with session.get(url, timeout=timeout, ssl=False) as response:
+                response.raise_for_status()
+                WebsiteExtractor._check_content_type(response.headers.get("Content-Type"))
+                raw_html = await WebsiteExtractor._read_limited_async(response)
+
+        WebsiteExtractor._cache_page(url, raw_html)
+        return raw_html
+
+    @staticmethod
+    async def fetch_webpage_async(session, url: str) -> Tuple[Optional[str], Optional[BeautifulSoup]]:
+        """
+        Fetch webpage content asynchronously.
+
+        Args:
+            session: Shared aiohttp.ClientSession.
+            url: URL of the webpage to fetch.
+
+        Returns:
+            Tuple of (raw_html, soup) or (None, None) if fetch failed.
+        """
+        try:
+            raw_html = await WebsiteExtractor._fetch_html_async(session, url)
+
+            # Parse the HTML with lxml, keeping only the tags we extract from
+            soup = BeautifulSoup(raw_html, "lxml", parse_only=WebsiteExtractor._parse_only)
+
+            logger.info(f"Successfully fetched {url} asynchronously")
+            return raw_html, soup
+
+        except Exception as e:
+            logger.error(f"Failed to fetch {url} asynchronously: {e}")
+            return None, None
+
+    @staticmethod
+    async def fetch_many(urls: List[str], concurrency: int = 50) -> Dict[str, Tuple[Optional[str], Optional[BeautifulSoup]]]:
+        """
+        Fetch many webpages concurrently over one keep-alive session.
+
+        Args:
+            urls: URLs to fetch.
+            concurrency: Maximum number of connections open at once.
+
+        Returns:
+            Dictionary mapping each URL to (raw_html, soup), or (None, None) if its fetch failed.
+        """
+        import aiohttp
+
+        urls = list(dict.fromkeys(urls))
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300, keepalive_timeout=30)
+        async with aiohttp.ClientSession(headers=dict(WebsiteExtractor._session.headers), connector=connector) as session:
+            results = await asyncio.gather(
+                *(WebsiteExtractor.fetch_webpage_async(session, url) for url in urls),
+                return_exceptions=True
+            )
+
+        return {
+            url: (None, None) if isinstance(result, BaseException) else result
+            for url, result in zip(urls, results)
+        }
+
+    @staticmethod
+    def fetch_webpages(urls: List[str], concurrency: int = 50) -> Dict[str, Tuple[Optional[str], Optional[BeautifulSoup]]]:
+        """
+        Synchronous wrapper around fetch_many.
+
+        Args:
+            urls: URLs to fetch.
+            concurrency: Maximum number of connections open at once.
+
+        Returns:
+            Dictionary mapping each URL to (raw_html, soup), or (None, None) if its fetch failed.
+        """
+        if not urls:
+            return {}
+
+        try:
+            return asyncio.run(WebsiteExtractor.fetch_many(urls, concurrency))
+        except Exception as e:
+            # asyncio.run can't be used from inside a running event loop; fetch one at a time instead
+            logger.warning(f"Async fetching failed: {e}. Falling back to sequential fetching.")
+            return {url: WebsiteExtractor.fetch_webpage(url) for url in dict.fromkeys(urls)}
+
+    @staticmethod
+    def _extract_page_text(html_content: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract the text relevant for LLM extraction from a website's HTML.
+
+        The page is parsed once by lxml and walked once, collecting the title, meta
+        descriptions, about sections, social links and main text in the same pass.
+        Section and paragraph text stops being collected once max_chars is reached,
+        so huge pages don't build strings that are cut off anyway.
+
+        Args:
+            html_content: The HTML content of the page.
+            max_chars: Maximum characters of section and paragraph text to collect
+                (defaults to MAX_COLLECTED_CHARS).
+
+        Returns:
+            Extracted text, or an empty string if the HTML could not be parsed.
+        """
+        try:
+            root = lxml.html.fromstring(html_content).getroottree().getroot()
+        except Exception as e:
+            logger.warning(f"Error parsing website HTML: {e}")
+            return ""
+
+        title_buf = []
+        meta_desc = None
+        og_desc = None
+        about_buf = []
+        social_buf = []
+        main_buf = []
+        # Text pieces of the outermost open paragraph/heading element, which become one line
+        line_buf = []
+
+        if max_chars is None:
+            max_chars = WebsiteExtractor.MAX_COLLECTED_CHARS
+        collected = 0
+
+        # The outermost about section being walked (its text is included whole, so
+        # nested sections and main text inside it are skipped), the number of open
+        # paragraph/heading elements, and the elements whose subtree is still open
+        about_section = None
+        main_depth = 0
+        open_elements = []
+
+        # root.iter() visits comments too, whose tails are text; a trailing None closes every open element
+        for element in itertools.chain(root.iter(), [None]):
+            parent = element.getparent() if element is not None else None
+
+            # Close the elements whose subtree has ended; their tails belong to their parents
+            while open_elements and open_elements[-1] is not parent:
+                closed = open_elements.pop()
+                if isinstance(closed.tag, str):
+                    if closed.tag in _MAIN_TEXT_TAGS:
+                        main_depth -= 1
+                        # Inline text nodes of a paragraph or heading stay on one line, so
+                        # repeated-line removal never drops words out of the middle of it
+                        if not main_depth and line_buf:
+                            main_buf.append(" ".join("".join(line_buf).split()))
+                            line_buf = []
+                    if closed is about_section:
+                        about_section = None
+                if main_depth and about_section is None and closed.tail and collected < max_chars:
+                    line_buf.append(closed.tail)
+                    collected += len(closed.tail)
+
+            if element is None:
+                break
+            open_elements.append(element)
+
+            # Comments and processing instructions only contribute their tails
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+
+            if tag in _MAIN_TEXT_TAGS:
+                main_depth += 1
+            elif tag == 'a':
+                href = element.get('href')
+                if href and _is_social_link(href):
+                    social_buf.append(f"Social Media Link: {href}")
+            elif tag in _ABOUT_CONTAINER_TAGS:
+                if about_section is None and collected < max_chars:
+                    class_attr = element.get('class')
+                    if class_attr and _ABOUT_CLASS_RE.search(class_attr):
+                        about_section = element
+                        about_text = element.text_content().strip()
+                        about_buf.append(about_text)
+                        collected += len(about_text)
+            elif tag == 'title':
+                if element.text:
+                    title_buf.append(element.text)
+            elif tag == 'meta':
+                if meta_desc is None and element.get('name') == 'description':
+                    meta_desc = element.get('content')
+                if og_desc is None and element.get('property') == 'og:description':
+                    og_desc = element.get('content')
+
+            if main_depth and about_section is None and element.text and collected < max_chars:
+                line_buf.append(element.text)
+                collected += len(element.text)
+
+        parts = []
+
+        # Add the title
+        title = " ".join(t.strip() for t in title_buf if t.strip())
+        if title:
+            parts.append(f"Title: {title}\n\n")
+
+        # Add meta descriptions which often contain valuable information
+        if meta_desc is not None:
+            parts.append(f"Meta Description: {meta_desc}\n\n")
+
+        if og_desc is not None:
+            parts.append(f"OG Description: {og_desc}\n\n")
+
+        # Add text from about, contact, and team sections which often contain location and founding info.
+        # Text and separators go into parts separately so the final join is the only copy of the page text.
+        for about_text in about_buf:
+            parts.append(about_text)
+            parts.append("\n\n")
+
+        # Add social media links. They come before the main text so the
+        # prompt length cap never cuts them off.
+        if social_buf:
+            for link in social_buf:
+                parts.append(link)
+                parts.append("\n")
+            parts.append("\n")
+
+        # Add paragraph and heading text from outside the about sections, one line per element
+        separator = ""
+        for text in main_buf:
+            if text:
+                parts.append(separator)
+                parts.append(text)
+                separator = "\n"
+
+        return "".join(parts)
+
+    @staticmethod
+    def _text_from_html(url: str, html_content: str, soup: Optional[BeautifulSoup] = None) -> Optional[str]:
+        """
+        Get the text to send to the LLM from a website's HTML.
+
+        Args:
+            url: URL of the website.
+            html_content: HTML of the page.
+            soup: BeautifulSoup object for the page (optional, only needed for the short page fallback).
+
+        Returns:
+            Text content of the page, or None if it has nothing worth extracting.
+        """
+        # Extract text from the most relevant parts of the page
+        text_content = WebsiteExtractor._extract_page_text(html_content)
+
+        # If we couldn't extract meaningful text, fall back to all of the page's text
+        # rather than re-sending the raw HTML. The soup is only built for this case.
+        if len(text_content) < 100:
+            if soup is None:
+                soup = BeautifulSoup(html_content, "lxml", parse_only=WebsiteExtractor._parse_only)
+            text_content = soup.get_text(separator="\n", strip=True)[:10000]
+
+        # Drop repeated boilerplate lines and cap the prompt size
+        text_content = TextCleaner.compact_for_llm(text_content, WebsiteExtractor.MAX_CHARS)
+
+        # Skip the LLM call when the page clearly holds no company data
+        if len(text_content) < WebsiteExtractor.MIN_USEFUL_CHARS:
+            logger.info(f"Skipping {url}: only {len(text_content)} characters of text")
+            return None
+
+        return text_content
+
+    @staticmethod
+    def _prepare_content(url: str, raw_html: Optional[str] = None, soup: Optional[BeautifulSoup] = None,
+                         is_processed_content: bool = False) -> Optional[str]:
+        """
+        Get the text to send to the LLM for a website, fetching it if needed.
+
+        Args:
+            url: URL of the website.
+            raw_html: Raw HTML content or processed text content (optional).
+            soup: BeautifulSoup object (optional).
+            is_processed_content: Whether the raw_html parameter contains already processed content.
+
+        Returns:
+            Text content of the page, or None if the page could not be fetched or has nothing worth extracting.
+        """
+        # Check if we're working with already processed content
+        if is_processed_content and raw_html:
+            # If the content is already processed, use it directly
+            logger.info(f"Using pre-processed content for {url} ({len(raw_html)} chars)")
+            return raw_html
+
+        # If raw_html or soup is not provided, fetch the page. Its HTML is parsed
+        # by lxml directly, without building a BeautifulSoup tree first.
+        if not raw_html or not soup:
+            logger.info(f"No HTML content provided for {url}, fetching it")
+            try:
+                html_content = WebsiteExtractor._fetch_html(url)
+            except Exception as e:
+                logger.error(f"Failed to fetch {url}: {e}")
+                return None
+            return WebsiteExtractor._text_from_html(url, html_content)
+
+        # Callers may pass already-cleaned text as raw_html, so serialize the soup instead
+        return WebsiteExtractor._text_from_html(url, str(soup), soup)
+
     @staticmethod
     def extract_data(company_name: str, url: str, raw_html: Optional[str] = None, soup: Optional[BeautifulSoup] = None,
                     api_client: Optional[GeminiAPIClient] = None, is_processed_content: bool = False) -> Dict[str, Any]:
@@ -83,100 +642,21 @@ class WebsiteExtractor:
             Dictionary of extracted data.
         """
         try:
-            # Initialize API client if not provided
+            # Use the shared API client if none was provided
             if api_client is None:
-                api_client = GeminiAPIClient()
-
-            # Define the fields we want to extract
-            fields_to_extract = [
-                "Company Description",
-                "Contact",
-                "Founded Year",
-                "Location",
-                "Products/Services",
-                "Team",
-                "Founders",
-                "Founder LinkedIn Profiles",
-                "CEO/Leadership",
-                "Industry",
-                "Technology Stack",
-                "Competitors",
-                "Market Focus",
-                "Social Media Links",
-                "Latest News",
-                "Investors",
-                "Growth Metrics"
-            ]
-
-            # Check if we're working with already processed content
-            if is_processed_content and raw_html:
-                # If the content is already processed, use it directly
-                logger.info(f"Using pre-processed content for {url} ({len(raw_html)} chars)")
-                text_content = raw_html
-            else:
-                # If raw_html or soup is not provided, try to fetch the webpage
-                if not raw_html or not soup:
-                    logger.info(f"No HTML content provided for {url}, trying to fetch with Beautiful Soup")
-                    raw_html, soup = WebsiteExtractor.fetch_webpage(url)
-
-                    if not raw_html or not soup:
-                        logger.error(f"Failed to fetch {url} with Beautiful Soup")
-                        return {}
-
-                # Get text content from the soup for better processing
-                if soup:
-                    # Extract text from the most relevant parts of the page
-                    text_content = ""
-
-                    # Add the title
-                    if soup.title:
-                        text_content += f"Title: {soup.title.get_text()}\n\n"
-
-                    # Add meta descriptions which often contain valuable information
-                    meta_desc = soup.find('meta', attrs={'name': 'description'})
-                    if meta_desc and 'content' in meta_desc.attrs:
-                        text_content += f"Meta Description: {meta_desc['content']}\n\n"
-
-                    og_desc = soup.find('meta', attrs={'property': 'og:description'})
-                    if og_desc and 'content' in og_desc.attrs:
-                        text_content += f"OG Description: {og_desc['content']}\n\n"
-
-                    # Extract text from about, contact, and team pages which often contain location and founding info
-                    about_sections = soup.find_all(['section', 'div'], class_=lambda c: c and any(x in str(c).lower() for x in ['about', 'company', 'team', 'contact']))
-                    for section in about_sections:
-                        text_content += section.get_text().strip() + "\n\n"
-
-                    # Extract text from main content
-                    main_content = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    for element in main_content:
-                        if element.get_text().strip():
-                            text_content += element.get_text().strip() + "\n"
-
-                    # Extract social media links
-                    social_links = []
-                    for a in soup.find_all('a', href=True):
-                        href = a['href']
-                        if any(platform in href for platform in ['twitter.com', 'facebook.com', 'linkedin.com', 'instagram.com', 'youtube.com']):
-                            social_links.append(f"Social Media Link: {href}")
-
-                    if social_links:
-                        text_content += "\n" + "\n".join(social_links)
-
-                    # If we couldn't extract meaningful text, fall back to raw HTML
-                    if len(text_content) < 100 and raw_html:
-                        text_content = raw_html
-                elif raw_html:
-                    text_content = raw_html
-                else:
-                    logger.error(f"No content available for {url}")
-                    return {}
+                api_client = get_default_client()
+
+            # Get the page text, fetching the page if it wasn't provided
+            text_content = WebsiteExtractor._prepare_content(url, raw_html, soup, is_processed_content)
+            if not text_content:
+                return {}
 
             # Use the LLM to extract structured data
             website_data = api_client.extract_structured_data(
                 company_name=company_name,
                 source_type="Website",
                 content=text_content,
-                fields=fields_to_extract
+                fields=WebsiteExtractor.FIELDS_TO_EXTRACT
             )
 
             logger.info(f"Extracted website data for {company_name} using LLM: {list(website_data.keys())}")
@@ -185,3 +665,151 @@ class WebsiteExtractor:
         except Exception as e:
             logger.error(f"Error extracting website data from {url}: {e}")
             return {}
+
+    @staticmethod
+    async def extract_data_async(pairs: List[Tuple[str, str]], api_client: Optional[GeminiAPIClient] = None,
+                                 http_concurrency: int = 50, llm_concurrency: int = 10,
+                                 on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch and extract many company websites concurrently.
+
+        Each company moves on to its Gemini call as soon as its own page is fetched, so
+        page fetches and LLM round trips overlap. Gemini calls run in worker threads.
+
+        Args:
+            pairs: List of tuples (company_name, url).
+            api_client: Optional GeminiAPIClient instance.
+            http_concurrency: Maximum number of concurrent page fetches.
+            llm_concurrency: Maximum number of concurrent Gemini calls.
+            on_result: Optional callback called with (company_name, data) as each company finishes,
+                e.g. to append rows to a CSV while the rest are still running.
+
+        Returns:
+            Dictionary mapping company name to extracted data.
+        """
+        import aiohttp
+
+        # Use the shared API client if none was provided
+        if api_client is None:
+            api_client = get_default_client()
+
+        http_semaphore = asyncio.Semaphore(http_concurrency)
+        llm_semaphore = asyncio.Semaphore(llm_concurrency)
+
+        async def process(company_name, url):
+            try:
+                # Step 1: Fetch the page
+                async with http_semaphore:
+                    raw_html = await WebsiteExtractor._fetch_html_async(session, url)
+
+                # Step 2: Extract the page text off the event loop
+                text_content = await asyncio.to_thread(WebsiteExtractor._text_from_html, url, raw_html)
+                if not text_content:
+                    return company_name, {}
+
+                # Step 3: Extract structured data with the LLM
+                async with llm_semaphore:
+                    website_data = await asyncio.to_thread(
+                        api_client.extract_structured_data, company_name, "Website", text_content, WebsiteExtractor.FIELDS_TO_EXTRACT
+                    )
+                return company_name, website_data
+
+            except Exception as e:
+                logger.error(f"Error extracting website data from {url}: {e}")
+                return company_name, {}
+
+        results = {}
+        connector = aiohttp.TCPConnector(limit=http_concurrency, ttl_dns_cache=300, keepalive_timeout=30)
+        async with aiohttp.ClientSession(headers=dict(WebsiteExtractor._session.headers), connector=connector) as session:
+            for next_result in asyncio.as_completed([process(company_name, url) for company_name, url in pairs]):
+                company_name, website_data = await next_result
+                results[company_name] = website_data
+                if on_result is not None:
+                    on_result(company_name, website_data)
+
+        logger.info(f"Extracted website data for {len(results)} companies asynchronously")
+        return results
+
+    @staticmethod
+    def run_batch(pairs: List[Tuple[str, str]], api_client: Optional[GeminiAPIClient] = None,
+                  http_concurrency: int = 50, llm_concurrency: int = 10,
+                  on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Synchronous wrapper around extract_data_async.
+
+        Args:
+            pairs: List of tuples (company_name, url).
+            api_client: Optional GeminiAPIClient instance.
+            http_concurrency: Maximum number of concurrent page fetches.
+            llm_concurrency: Maximum number of concurrent Gemini calls.
+            on_result: Optional callback called with (company_name, data) as each company finishes.
+
+        Returns:
+            Dictionary mapping company name to extracted data.
+        """
+        try:
+            return asyncio.run(WebsiteExtractor.extract_data_async(pairs, api_client, http_concurrency,
+                                                                   llm_concurrency, on_result))
+        except Exception as e:
+            logger.error(f"Error running async website extraction: {e}")
+            return {}
+
+    @staticmethod
+    def submit_batch(companies: List[Tuple[str, str, Optional[str], Optional[BeautifulSoup]]],
+                     api_client: Optional[GeminiAPIClient] = None) -> Optional[str]:
+        """
+        Submit Website extraction for many companies as a Gemini batch job.
+
+        For bulk runs that don't need results right away: the job completes within
+        24 hours at half the cost of interactive extraction. Collect it with collect_batch.
+
+        Args:
+            companies: List of tuples (company_name, url, raw_html, soup). raw_html and soup may be None.
+            api_client: Optional GeminiAPIClient instance.
+
+        Returns:
+            Batch job name, or None if nothing could be submitted.
+        """
+        # Use the shared API client if none was provided
+        if api_client is None:
+            api_client = get_default_client()
+
+        # Fetch the pages that weren't provided concurrently
+        fetched = WebsiteExtractor.fetch_webpages([url for _, url, raw_html, soup in companies if not raw_html or not soup])
+
+        # Get the page text for every company
+        rows = []
+        for company_name, url, raw_html, soup in companies:
+            if not raw_html or not soup:
+                raw_html, soup = fetched.get(url, (None, None))
+                if not raw_html or not soup:
+                    continue
+
+            try:
+                text_content = WebsiteExtractor._prepare_content(url, raw_html, soup)
+            except Exception as e:
+                logger.error(f"Error preparing website content from {url}: {e}")
+                text_content = None
+
+            if text_content:
+                rows.append((company_name, text_content))
+
+        return api_client.submit_extraction_batch("Website", rows, WebsiteExtractor.FIELDS_TO_EXTRACT)
+
+    @staticmethod
+    def collect_batch(job_name: str, api_client: Optional[GeminiAPIClient] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Collect the results of a batch job submitted with submit_batch.
+
+        Args:
+            job_name: Batch job name returned by submit_batch.
+            api_client: Optional GeminiAPIClient instance.
+
+        Returns:
+            Dictionary mapping company name to extracted data, or None if the job hasn't finished.
+        """
+        # Use the shared API client if none was provided
+        if api_client is None:
+            api_client = get_default_client()
+
+        return api_client.collect_extraction_batch(job_name, WebsiteExtractor.FIELDS_TO_EXTRACT)
@@ -1,36 +1,52 @@
 # src/utils/__init__.py
 """
 Utility modules for the Startup Finder project.
+
+Modules are imported on first attribute access (PEP 562), so importing one
+utility doesn't load all of them.
 """
 
-# Import typing modules
-from typing import List, Dict, Any, Optional, Tuple, Set, Union
+import importlib
+from typing import Any
+
+# Utility modules available as attributes of the package
+__all__ = [
+    "api_client",
+    "api_key_manager",
+    "api_optimizer",
+    "batch_processor",
+    "content_processor",
+    "csv_appender",
+    "data_cleaner",
+    "database_manager",
+    "enhanced_google_search_client",
+    "google_search_client",
+    "logging_config",
+    "metrics_collector",
+    "optimization_utils",
+    "process_monitor",
+    "progressive_loader",
+    "query_optimizer",
+    "report_generator",
+    "smart_content_processor",
+    "startup_name_cleaner",
+    "text_chunker",
+    "text_cleaner",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a utility module the first time it is accessed.
 
-# Import utility modules to make them available when importing the package
-from . import api_client
-from . import api_key_manager
-from . import api_optimizer
-from . import batch_processor
-from . import content_processor
-from . import csv_appender
-from . import data_cleaner
-from . import database_manager
-from . import enhanced_google_search_client
-from . import google_search_client
-from . import logging_config
-from . import metrics_collector
-from . import optimization_utils
-from . import process_monitor
-from . import progressive_loader
-from . import query_optimizer
-from . import report_generator
-from . import smart_content_processor
-from . import startup_name_cleaner
-from . import text_chunker
-from . import text_cleaner
+    Args:
+        name: Name of the module.
 
-# Import utility scripts
-from . import append_intermediate_results
-from . import deduplicate_and_overwrite
-from . import deduplicate_startups
-from . import run_with_monitoring
\ No newline at end of file
+    Returns:
+        The imported module.
+    """
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,22 +7,567 @@ startup intelligence gathering with robust validation and error handling.
 
 import os
 import json
+import random
+import asyncio
 import time
+import hashlib
 import logging
 import re
+import tempfile
+import threading
 import traceback
-from typing import Dict, List, Optional, Union, Any, Tuple, Set
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable, Awaitable
 
-import google.generativeai as genai
-from google.generativeai import types
+import requests
 
-from src.utils.batch_processor import GeminiAPIBatchProcessor
+from src.utils.api_optimizer import TokenBucket
+from src.utils.batch_processor import is_transient_error
+from src.utils.llm_cache import LLMCache, get_llm_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The Gemini SDK and gRPC take about a second to import, so the SDK is imported by
+# _configure_genai when the first client is created rather than with this module
+genai = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Define response validation constants
-MAX_CONTENT_LENGTH = 15000  # Maximum content length for Gemini API
+MAX_CONTENT_LENGTH = int(os.environ.get("GEMINI_MAX_CONTENT_LENGTH", 15000))  # Maximum content length for Gemini API
+CONTENT_HEAD_RATIO = 0.8  # Share of the budget kept from the start of truncated content
+BATCH_API_BASE_URL = "https://generativelanguage.googleapis.com"  # Gemini Batch Mode REST endpoint
+RESPONSE_MEMO_SIZE = 4096  # Expansion and analysis responses kept in memory per client
+EXTRACTION_MEMO_SIZE = 4096  # Extracted pages kept in memory per client
+MULTIPLEXED_EXPANSION_SIZE = 20  # Queries expanded together in a single prompt
+EXTRACTION_GROUP_SIZE = 8  # Companies extracted together in a single prompt
+
+def _loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, with orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter either way.
+
+    Args:
+        data: JSON text.
+
+    Returns:
+        Parsed value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(value: Any, indent: bool = False) -> str:
+    """
+    Serialize a value to JSON text, with orjson when it is installed.
+
+    Non-ASCII characters are written as-is rather than escaped, whichever library is used.
+
+    Args:
+        value: Value to serialize.
+        indent: Whether to indent with two spaces.
+
+    Returns:
+        JSON text.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json handles (e.g. non-string keys); let the stdlib try
+            pass
+    return json.dumps(value, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _coerce_to_str(value: Any) -> str:
+    """Convert a mistyped field value to a string."""
+    return str(value)
+
+
+def _coerce_comma_list(value: Any) -> Any:
+    """Split a comma-separated string into a list; other values are kept."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",")]
+    return value
+
+
+def _coerce_json_dict(value: Any) -> Any:
+    """Parse a string holding a JSON object; other values, and unparseable strings, are kept."""
+    if isinstance(value, str):
+        try:
+            return _loads_json(value)
+        except json.JSONDecodeError:
+            return value
+    return value
+
+
+def _keep_value(value: Any) -> Any:
+    """Keep a mistyped field value unchanged."""
+    return value
+
+
+def _build_field_spec(expected_types: Tuple[type, ...]) -> Tuple[Tuple[type, ...], Callable[[Any], Any]]:
+    """
+    Pair a field's expected types with the coercer for mismatches.
+
+    The coercer is picked by type priority: a field that accepts strings stringifies any
+    other value, one that accepts lists splits comma-separated strings, and one that
+    accepts dicts parses JSON strings.
+
+    Args:
+        expected_types: Tuple of expected types, passed straight to isinstance.
+
+    Returns:
+        Tuple of (expected types, coercer).
+    """
+    if str in expected_types:
+        return expected_types, _coerce_to_str
+    if list in expected_types:
+        return expected_types, _coerce_comma_list
+    if dict in expected_types:
+        return expected_types, _coerce_json_dict
+    return expected_types, _keep_value
+
+
+def _strip_list_prefix(line: str) -> str:
+    """
+    Remove the numbering or bullet the model sometimes puts in front of a line.
+
+    Only the first character decides which prefix to look for, so unnumbered lines
+    are returned without scanning or splitting them.
+
+    Args:
+        line: Stripped, non-empty line of model output.
+
+    Returns:
+        The line without a leading "1. ", "- " or "* ".
+    """
+    first = line[0]
+    if first.isdigit():
+        end = line.find('. ')
+        if end > 0 and line[:end].isdigit():
+            return line[end + 2:].strip()
+    elif first in '-*' and line[1:2] == ' ':
+        return line[2:].strip()
+    return line
+
+
+# Decoder used to parse JSON embedded in model responses, wherever it starts
+_JSON_DECODER = json.JSONDecoder()
+_JSON_START_RE = re.compile(r"[\[{]")
+
+
+def _decode_json_to_fence(text: str, start: int) -> Optional[Any]:
+    """
+    Parse JSON that runs from a bracket up to the closing fence or the end of the text.
+
+    Well-formed responses look like this, so orjson can parse them in one go.
+
+    Args:
+        text: Text containing JSON.
+        start: Index of the opening bracket.
+
+    Returns:
+        The parsed JSON object or array, or None if orjson isn't installed or the text
+        doesn't have that shape.
+    """
+    if orjson is None:
+        return None
+    # str.find runs in C without backtracking; a lazy ```(.*?)``` regex over the same
+    # text is an order of magnitude slower
+    end = text.find("```", start)
+    last = (end if end >= 0 else len(text)) - 1
+    while last > start and text[last].isspace():
+        last -= 1
+    if text[last] not in "}]":
+        return None
+    try:
+        return orjson.loads(text[start:last + 1])
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _decode_embedded_json(text: str, start: int = 0) -> Any:
+    """
+    Parse the first JSON object or array in a text, ignoring anything around it.
+
+    The decoder reads straight from the opening bracket and stops at the matching close,
+    so prose or code fences around the JSON never need to be split off. A bracket that
+    doesn't start valid JSON (e.g. "[note]") is skipped along with everything the decoder
+    read past it, so each part of the text is parsed at most once. JSON that is all there
+    is up to the closing fence is parsed with orjson when it is installed.
+
+    Args:
+        text: Text containing JSON.
+        start: Index to start looking from.
+
+    Returns:
+        The parsed JSON object or array.
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON object or array was found.
+    """
+    error = None
+    match = _JSON_START_RE.search(text, start)
+
+    if match is not None:
+        parsed_data = _decode_json_to_fence(text, match.start())
+        if parsed_data is not None:
+            return parsed_data
+
+    while match is not None:
+        try:
+            return _JSON_DECODER.raw_decode(text, match.start())[0]
+        except json.JSONDecodeError as e:
+            error = e
+            match = _JSON_START_RE.search(text, max(e.pos, match.start() + 1))
+
+    raise error or json.JSONDecodeError("No JSON object or array found", text, start)
+
+
+def _decode_complete_json(text: str) -> Optional[Any]:
+    """
+    Parse the JSON a response starts with, if it has been received in full.
+
+    Only the first bracket is tried, so a list whose first items have arrived is not
+    mistaken for a complete response.
+
+    Args:
+        text: Response text received so far.
+
+    Returns:
+        The parsed JSON object or array, or None if it isn't complete yet.
+    """
+    fence = text.find("```")
+    match = _JSON_START_RE.search(text, fence + 3 if fence >= 0 else 0)
+    if match is None:
+        return None
+    parsed_data = _decode_json_to_fence(text, match.start())
+    if parsed_data is not None:
+        return parsed_data
+    try:
+        return _JSON_DECODER.raw_decode(text, match.start())[0]
+    except json.JSONDecodeError:
+        return None
+
+
+def _get_chunk_text(chunk) -> str:
+    """
+    Get the text of a streamed response chunk.
+
+    Args:
+        chunk: Streamed response chunk.
+
+    Returns:
+        The chunk's text, or an empty string for chunks without text parts.
+    """
+    try:
+        return chunk.text
+    except ValueError:
+        return ""
+
+
+class _JsonStream:
+    """Text of a streamed JSON response, parsing the JSON it starts with once it is complete."""
+
+    def __init__(self):
+        """
+        Initialize an empty stream.
+        """
+        self.parts: List[str] = []
+        self.open_brackets = 0
+        self.close_brackets = 0
+        self.data: Optional[Any] = None
+
+    def add(self, chunk) -> bool:
+        """
+        Add a streamed chunk to the text received so far.
+
+        Brackets are counted as chunks arrive, and the JSON is only decoded once every
+        opening bracket has a closing one, instead of re-decoding the whole text on every
+        chunk. Brackets inside strings can throw the counts off; at worst that means
+        reading the rest of the stream.
+
+        Args:
+            chunk: Streamed response chunk.
+
+        Returns:
+            True once the JSON the response starts with is complete.
+        """
+        text = _get_chunk_text(chunk)
+        if not text:
+            return False
+        self.parts.append(text)
+
+        self.open_brackets += text.count("{") + text.count("[")
+        # Only a closing bracket can complete the JSON
+        closing = text.count("}") + text.count("]")
+        if not closing:
+            return False
+        self.close_brackets += closing
+        if self.close_brackets < self.open_brackets:
+            return False
+        # Keep the parsed JSON so it doesn't have to be parsed again from the text
+        self.data = _decode_complete_json(self.text())
+        return self.data is not None
+
+    def text(self) -> str:
+        """
+        Get the text received so far.
+
+        Returns:
+            Response text.
+        """
+        return "".join(self.parts)
+
+
+# Client-side pacing per model, shared by all clients, so batch runs stay under the quota
+# instead of running into 429s and retry backoff. Defaults are the paid tier 1 limits.
+MODEL_RATE_LIMITS = {
+    "gemini-2.0-flash": TokenBucket(
+        requests_per_minute=float(os.environ.get("GEMINI_FLASH_RPM", 2000)),
+        tokens_per_minute=float(os.environ.get("GEMINI_FLASH_TPM", 4000000))
+    ),
+    "gemini-2.5-flash-preview-05-20": TokenBucket(
+        requests_per_minute=float(os.environ.get("GEMINI_PRO_RPM", 1000)),
+        tokens_per_minute=float(os.environ.get("GEMINI_PRO_TPM", 1000000))
+    )
+}
+
+# Guidelines shared by the single-query and multi-query expansion prompts
+_EXPANSION_GUIDELINES = """GUIDELINES:
+        - Maximize DIVERSITY in the search vector space - each query should target a different aspect or dimension
+        - Avoid semantic overlap between queries - each should retrieve a substantially different set of results
+        - Consider different:
+          * Industry verticals (energy, mobility, social tech, etc.)
+          * Geographic focuses (specific regions, urban/rural)
+          * Technology approaches (hardware, software, services)
+          * Business models (B2B, B2C, marketplace)
+          * Company stages (early-stage, growth, established)
+          * Funding status (bootstrapped, seed, venture-backed)
+        - Use industry-specific terminology where appropriate
+        - Include both specific and general variations, but ensure they target different result sets
+        - Each query should be 2-8 words long and search-engine optimized
+        - Prioritize queries that would yield unique startups not found by other queries
+
+        EXAMPLES of good query variations for "AI startups":
+        - "artificial intelligence companies"
+        - "machine learning ventures"
+        - "AI tech entrepreneurs"
+        - "deep learning businesses"
+        - "neural network startups\""""
+
+# Prompt for expanding one query, with {query} and {num_expansions} placeholders
+_EXPANSION_PROMPT_TEMPLATE = """
+        You are a startup intelligence researcher specializing in query expansion for Google search.
+
+        TASK:
+        Generate exactly {num_expansions} different search query variations for finding startups related to: "{query}"
+
+        """ + _EXPANSION_GUIDELINES + """
+
+        FORMAT:
+        Return EXACTLY {num_expansions} queries, one per line, without numbering or any other text.
+        Do not include the original query "{query}" in your response.
+        Each line should contain only one search query.
+        """
+
+
+@lru_cache(maxsize=8)
+def _expansion_prompt_parts(num_expansions: int) -> Tuple[str, ...]:
+    """
+    Get the expansion prompt with the number of expansions filled in, split around the query.
+
+    The count rarely changes within a run, so each call only joins the parts with the query.
+
+    Args:
+        num_expansions: Number of new query variations to ask for.
+
+    Returns:
+        Prompt pieces to be joined with the query.
+    """
+    return tuple(_EXPANSION_PROMPT_TEMPLATE.replace("{num_expansions}", str(num_expansions)).split("{query}"))
+
+
+# Safety settings for validation, which must not block startup descriptions
+_SAFETY_SETTINGS_BLOCK_NONE = [
+    {
+        "category": "HARM_CATEGORY_HARASSMENT",
+        "threshold": "BLOCK_NONE"
+    },
+    {
+        "category": "HARM_CATEGORY_HATE_SPEECH",
+        "threshold": "BLOCK_NONE"
+    },
+    {
+        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "threshold": "BLOCK_NONE"
+    },
+    {
+        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "threshold": "BLOCK_NONE"
+    }
+]
+
+# Low-temperature generation config for validation
+_LOW_TEMP_GEN_CONFIG = {
+    "temperature": 0.2,
+    "top_p": 0.95,
+    "top_k": 64,
+    "max_output_tokens": 8192,
+}
+
+# Prompt for validating and enriching startup data, shared by the batch and chunk validators
+_VALIDATION_PROMPT_TEMPLATE = """
+        You are a startup intelligence analyst specializing in data validation and enrichment.
+        I have a dataset of startups related to the search query: "{query}".
+
+        TASK:
+        Analyze the following startup data to:
+        1. VERIFY each startup is RELEVANT to the query
+        2. CORRECT any anomalies, inconsistencies, or inaccuracies
+        3. FILL IN missing information where possible
+        4. STANDARDIZE formatting across all entries
+
+        STARTUP RELEVANCE CRITERIA:
+        - The startup's core business, products, or services must directly relate to query
+        - The startup should be operating in the industry or solving problems mentioned in the query
+        - The startup should be targeting the market or audience implied by the query
+
+        DATA VALIDATION GUIDELINES:
+        - Company Name: Ensure correct spelling and proper capitalization
+        - Website: Verify it's the official company website (not social media or third-party sites)
+        - LinkedIn: Ensure it's the correct company LinkedIn page
+        - Location: Standardize format (City, State/Region, Country)
+        - Founded Year: Verify accuracy and use 4-digit year format
+        - Industry: Use specific, standardized industry categories
+        - Company Size: Standardize format (e.g., "11-50 employees")
+        - Funding: Include latest round, amount, and date if available
+        - Product Description: Ensure it accurately describes what the company does
+
+        DATA TO VALIDATE:
+        {data}
+
+        Return ONLY the corrected data in valid JSON format, with the same structure as the above json.
+        If a startup is not relevant to the query, remove it completely from the results.
+        """
+
+# Values that mean a field was not found in extracted data
+_EMPTY_VALUES = frozenset((None, "null", "Not available", ""))
+
+# Static pieces of the structured data extraction prompt, joined around the company name,
+# source type, requested fields and content
+_EXTRACTION_PROMPT_HEAD = """
+        You are a startup intelligence data extractor specializing in comprehensive company analysis.
+        Extract the following information about """
+_EXTRACTION_PROMPT_SOURCE = ' from this '
+_EXTRACTION_PROMPT_FIELDS = ' content: '
+_EXTRACTION_PROMPT_CONTENT = '.\n\n        Content:\n        '
+_EXTRACTION_PROMPT_TAIL = """
+
+        For each field, provide the most accurate and detailed information available in the content.
+        If information for a field is not available, respond with null.
+
+        Specific guidelines for extraction:
+
+        - Company Description: Extract a comprehensive description of what the company does, its mission, and value proposition.
+
+        - Founders: List all founders with their full names. Format as a comma-separated list.
+
+        - Founder LinkedIn Profiles: Extract LinkedIn profile URLs for founders if available. Format as a JSON array.
+
+        - CEO/Leadership: Extract information about the CEO and key leadership team members with their roles.
+
+        - Location: Extract the company's headquarters location. Include city, region/state, and country if available.
+
+        - Founded Year: Extract the year the company was founded as a 4-digit number.
+
+        - Industry: Extract the primary industry and any sub-industries the company operates in.
+
+        - Company Size: Extract the number of employees, preferably as a range (e.g., "11-50 employees").
+
+        - Funding: Extract detailed funding information including total amount raised, latest round, and date if available.
+
+        - Technology Stack: Extract technologies, programming languages, frameworks, or platforms used by the company.
+
+        - Competitors: Extract names of direct competitors if mentioned. Format as a comma-separated list.
+
+        - Market Focus: Extract the target market, customer segments, or geographical focus areas.
+
+        - Social Media Links: Extract all social media profile URLs. Format as a JSON object with platform names as keys.
+
+        - Latest News: Extract recent news, announcements, or milestones about the company.
+
+        - Investors: Extract names of investors, VCs, or investment firms that have funded the company.
+
+        - Growth Metrics: Extract any metrics related to company growth, such as user numbers, revenue growth, etc.
+
+        - Products/Services: Extract detailed information about the company's products or services.
+
+        - Team: Extract information about the team size, key team members, and their roles.
+
+        - Contact: Extract contact information including email, phone, or contact form URL.
+
+        Format your response as a JSON object with the requested fields as keys.
+        Be precise and extract only factual information present in the content.
+        """
+
+# API key the SDK is configured with. genai.configure() discards the SDK's cached service
+# clients along with their gRPC channels, so it only runs when the key changes; every
+# GeminiAPIClient, model and thread then multiplexes its calls over the same channels.
+_configured_api_key: Optional[str] = None
+_configure_lock = threading.Lock()
+
+
+def _configure_genai(api_key: str):
+    """
+    Import the Gemini SDK on first use and configure it with an API key, unless it
+    already uses that key.
+
+    Args:
+        api_key: Gemini API key.
+    """
+    global _configured_api_key, genai
+    with _configure_lock:
+        if genai is None:
+            import google.generativeai as genai
+        if api_key != _configured_api_key:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+
+
+# Background event loop behind the synchronous batch methods. The SDK's async client is
+# bound to the loop it is first used on, so all async Gemini calls share this one loop.
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_loop_lock = threading.Lock()
+
+
+def _run_async(coro):
+    """
+    Run a coroutine on the shared background event loop and wait for its result.
+
+    Works from any thread, including one that is already running its own event loop.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name="gemini-async-loop", daemon=True).start()
+
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop).result()
 
 
 class GeminiAPIClient:
@@ -76,8 +621,8 @@ class GeminiAPIClient:
                     "set GEMINI_API_KEY environment variable, or run setup_env.py first."
                 )
 
-        # Initialize the Gemini API
-        genai.configure(api_key=self.api_key)
+        # Initialize the Gemini API, keeping the connections of any client configured before
+        _configure_genai(self.api_key)
 
         # Use Gemini 2.0 Flash for most operations
         self.flash_model = genai.GenerativeModel('gemini-2.0-flash')  # For most responses
@@ -85,17 +630,37 @@ class GeminiAPIClient:
         # Use Gemini 2.5 Flash for query expansion and other advanced tasks
         self.pro_model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')  # For query expansion and validation
 
-        # Set up response validation parameters
+        # Gemini 2.0 Flash with search grounding for startup validation, created on first use.
+        # Not built here: SDK versions that don't know the web_search tool raise while building
+        # it, which would take down expansion and extraction along with validation.
+        self._validation_model = None
+
+        # In-run memo of extractions: (company name, content digest) -> list of (fields, data).
+        # Lets a request for a subset of already-extracted fields on the same content skip the LLM.
+        # Least recently used pages are evicted past EXTRACTION_MEMO_SIZE.
+        self._extraction_memo = OrderedDict()
+        self._extraction_memo_lock = threading.Lock()
+
+        # In-memory LRU in front of the persistent cache for expansion and analysis responses,
+        # and the tasks computing them on the event loop so concurrent duplicates share one call
+        self._response_memo = OrderedDict()
+        self._response_memo_lock = threading.Lock()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # Track how often extraction content exceeds the budget, to tune MAX_CONTENT_LENGTH
+        self.truncation_stats = {"calls": 0, "truncated": 0}
+
+        # Set up response validation parameters; each field maps to a tuple of accepted types
         self.expected_field_types = {
-            "Company Name": str,
-            "Website": str,
-            "LinkedIn": str,
-            "Location": str,
+            "Company Name": (str,),
+            "Website": (str,),
+            "LinkedIn": (str,),
+            "Location": (str,),
             "Founded Year": (str, int),
-            "Industry": str,
-            "Company Size": str,
+            "Industry": (str,),
+            "Company Size": (str,),
             "Funding": (str, dict),
-            "Company Description": str,
+            "Company Description": (str,),
             "Products/Services": (str, list),
             "Founders": (str, list),
             "Founder LinkedIn Profiles": (str, list),
@@ -103,20 +668,28 @@ class GeminiAPIClient:
             "Team": (str, dict, list),
             "Technology Stack": (str, list),
             "Competitors": (str, list),
-            "Market Focus": str,
+            "Market Focus": (str,),
             "Social Media Links": (str, dict),
-            "Latest News": str,
+            "Latest News": (str,),
             "Investors": (str, list),
             "Growth Metrics": (str, dict),
             "Contact": (str, dict)
         }
 
-    def _validate_response(self, response_text: str) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        # Accepted types and mismatch coercer per known field, resolved once for _validate_fields
+        self._field_spec = {
+            field: _build_field_spec(expected_types)
+            for field, expected_types in self.expected_field_types.items()
+        }
+
+    def _validate_response(self, response_text: str,
+                           parsed_data: Optional[Any] = None) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """
         Validate and parse a response from the Gemini API.
 
         Args:
             response_text: The raw text response from the API.
+            parsed_data: The response JSON if it was already parsed while streaming (optional).
 
         Returns:
             Tuple containing:
@@ -127,65 +700,24 @@ class GeminiAPIClient:
         if not response_text or not response_text.strip():
             return False, None, "Empty response from API"
 
-        # Extract JSON content if wrapped in code blocks
-        json_content = response_text.strip()
-
-        # Handle markdown code blocks
-        if "```json" in json_content:
-            try:
-                json_content = json_content.split("```json")[1].split("```")[0].strip()
-            except IndexError:
-                return False, None, "Malformed JSON code block in response"
-        elif "```" in json_content:
-            try:
-                json_content = json_content.split("```")[1].strip()
-            except IndexError:
-                return False, None, "Malformed code block in response"
-
-        # Try to parse the JSON directly without regex validation
-        # This is more lenient and will handle valid JSON that doesn't match the regex pattern
-        try:
-            parsed_data = json.loads(json_content)
-
-            # Validate the structure based on expected type
-            if isinstance(parsed_data, dict):
-                return True, parsed_data, None
-            elif isinstance(parsed_data, list):
-                # For list responses, check if all items are dictionaries
-                if all(isinstance(item, dict) for item in parsed_data):
-                    return True, parsed_data, None
-                else:
-                    return False, None, "List response contains non-dictionary items"
-            else:
-                return False, None, f"Unexpected response type: {type(parsed_data)}"
-
-        except json.JSONDecodeError as e:
-            # If JSON parsing fails, log the error and the content for debugging
-            logger.debug(f"JSON parsing error: {str(e)}")
-            logger.debug(f"JSON content: {json_content[:500]}...")
-
-            # Try to clean the content and parse again
+        if parsed_data is None:
+            # Parse the JSON in place, starting inside the code block if there is one
+            fence = response_text.find("```")
             try:
-                # Sometimes Gemini adds extra text before or after the JSON
-                # Try to find JSON-like content using a more relaxed approach
-                if json_content.find('{') >= 0 and json_content.rfind('}') >= 0:
-                    start = json_content.find('{')
-                    end = json_content.rfind('}') + 1
-                    cleaned_json = json_content[start:end]
-                    parsed_data = json.loads(cleaned_json)
-                    logger.info("Successfully parsed JSON after cleaning")
-                    return True, parsed_data, None
-                elif json_content.find('[') >= 0 and json_content.rfind(']') >= 0:
-                    start = json_content.find('[')
-                    end = json_content.rfind(']') + 1
-                    cleaned_json = json_content[start:end]
-                    parsed_data = json.loads(cleaned_json)
-                    logger.info("Successfully parsed JSON array after cleaning")
-                    return True, parsed_data, None
-            except json.JSONDecodeError:
-                pass
-
-            return False, None, f"JSON parsing error: {str(e)}"
+                parsed_data = _decode_embedded_json(response_text, fence + 3 if fence >= 0 else 0)
+            except json.JSONDecodeError as e:
+                # If JSON parsing fails, log the error and the content for debugging
+                logger.debug(f"JSON parsing error: {str(e)}")
+                logger.debug(f"JSON content: {response_text[:500]}...")
+                return False, None, f"JSON parsing error: {str(e)}"
+
+        # Validate the structure based on expected type
+        if isinstance(parsed_data, dict):
+            return True, parsed_data, None
+        # For list responses, check if all items are dictionaries
+        if all(isinstance(item, dict) for item in parsed_data):
+            return True, parsed_data, None
+        return False, None, "List response contains non-dictionary items"
 
     def _validate_fields(self, data: Dict[str, Any], required_fields: Optional[List[str]] = None) -> Tuple[bool, Dict[str, Any], List[str]]:
         """
@@ -198,7 +730,8 @@ class GeminiAPIClient:
         Returns:
             Tuple containing:
             - Boolean indicating if the data is valid
-            - Cleaned data with validated fields
+            - Cleaned data with validated fields; the input dictionary itself when
+              every field is present, non-null and of its expected type
             - List of validation warnings
         """
         warnings = []
@@ -210,57 +743,552 @@ class GeminiAPIClient:
             if missing_fields:
                 warnings.append(f"Missing required fields: {', '.join(missing_fields)}")
 
+        field_spec = self._field_spec
+
+        # Most responses are already well-typed; return those as is instead of copying them
+        if not warnings:
+            for field, value in data.items():
+                if value is None:
+                    break
+                spec = field_spec.get(field)
+                if spec is not None and not isinstance(value, spec[0]):
+                    break
+            else:
+                return True, data, warnings
+
         # Validate each field against expected types
         for field, value in data.items():
             # Skip null values
             if value is None:
                 continue
 
-            # Check if this is a known field
-            if field in self.expected_field_types:
-                expected_types = self.expected_field_types[field]
-                if not isinstance(expected_types, tuple):
-                    expected_types = (expected_types,)
-
-                # Check if the value matches any of the expected types
-                if not any(isinstance(value, t) for t in expected_types):
-                    warnings.append(f"Field '{field}' has unexpected type: {type(value).__name__}, expected {expected_types}")
-
-                    # Try to convert to the first expected type
-                    try:
-                        if str in expected_types and not isinstance(value, str):
-                            # Convert to string
-                            cleaned_data[field] = str(value)
-                        elif list in expected_types and isinstance(value, str):
-                            # Convert comma-separated string to list
-                            cleaned_data[field] = [item.strip() for item in value.split(",")]
-                        elif dict in expected_types and isinstance(value, str):
-                            # Try to parse string as JSON
-                            try:
-                                cleaned_data[field] = json.loads(value)
-                            except json.JSONDecodeError:
-                                cleaned_data[field] = value
-                        else:
-                            # Keep original value
-                            cleaned_data[field] = value
-                    except Exception as e:
-                        warnings.append(f"Error converting field '{field}': {str(e)}")
-                        cleaned_data[field] = value
-                else:
-                    # Value has correct type
-                    cleaned_data[field] = value
-            else:
-                # Unknown field, keep as is
+            # Unknown fields are kept as is
+            spec = field_spec.get(field)
+            if spec is None:
+                cleaned_data[field] = value
+                continue
+
+            expected_types, coerce = spec
+            if isinstance(value, expected_types):
+                # Value has correct type
+                cleaned_data[field] = value
+                continue
+
+            warnings.append(f"Field '{field}' has unexpected type: {type(value).__name__}, expected {expected_types}")
+
+            # Try to convert to the first expected type
+            try:
+                cleaned_data[field] = coerce(value)
+            except Exception as e:
+                warnings.append(f"Error converting field '{field}': {str(e)}")
                 cleaned_data[field] = value
 
         return len(warnings) == 0, cleaned_data, warnings
 
-    def expand_query(self, query: str, num_expansions: int = 5) -> List[str]:
+    def _truncate_content(self, content: str, max_chars: int) -> str:
         """
-        Expand a search query into multiple variations using Gemini 2.5 Flash.
-
-        Uses Gemini 2.5 Flash for all query expansions to maximize semantic diversity
-        and ensure each query targets a different aspect of the search space.
+        Truncate content to a character budget, keeping its head and tail.
+
+        Args:
+            content: Content to truncate.
+            max_chars: Maximum number of characters to keep.
+
+        Returns:
+            The content, truncated if it was over budget.
+        """
+        if len(content) <= max_chars:
+            return content
+
+        # Keep most of the head (titles, descriptions) and a little of the tail (contact/footer info)
+        head_chars = int(max_chars * CONTENT_HEAD_RATIO)
+        tail_chars = max_chars - head_chars
+        # One f-string builds the result directly, without the intermediate string a + b + c makes
+        return f"{content[:head_chars]}\n...\n{content[len(content) - tail_chars:]}"
+
+    @staticmethod
+    def _filter_empty_values(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Drop null, "not available" and empty values from extracted data.
+
+        Args:
+            data: Extracted data dictionary.
+
+        Returns:
+            Dictionary with only non-empty values.
+        """
+        # Lists and dicts are unhashable, so only other values are checked against the sentinels
+        return {
+            k: v for k, v in data.items()
+            if (any(v) if isinstance(v, list) else
+                bool(v) if isinstance(v, dict) else
+                v not in _EMPTY_VALUES)
+        }
+
+    def _get_extraction_cache_key(self, company_name: str, source_type: str, content: str, fields: List[str]) -> str:
+        """
+        Build the cache key for a structured data extraction request.
+
+        The key covers the content as it is sent to the model, after truncation, so pages
+        that only differ in the part truncation drops share an entry, and long pages aren't
+        hashed in full.
+
+        Args:
+            company_name: Name of the company.
+            source_type: Type of source.
+            content: Content to analyze.
+            fields: Fields to extract.
+
+        Returns:
+            Cache key string.
+        """
+        return LLMCache.make_key(company_name, source_type, self._truncate_content(content, MAX_CONTENT_LENGTH), fields)
+
+    @staticmethod
+    def _get_prompt_cache_key(kind: str, prompt: str) -> str:
+        """
+        Build the cache key for a response that depends only on its prompt.
+
+        Args:
+            kind: Kind of request, e.g. "expand".
+            prompt: Prompt sent to the model.
+
+        Returns:
+            Cache key string.
+        """
+        return f"{kind}:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}"
+
+    def _get_cached_response(self, cache_key: str) -> Optional[Any]:
+        """
+        Look a response up in the in-memory LRU, then in the persistent LLM cache.
+
+        Args:
+            cache_key: Cache key.
+
+        Returns:
+            The cached response, or None if it isn't cached.
+        """
+        with self._response_memo_lock:
+            if cache_key in self._response_memo:
+                self._response_memo.move_to_end(cache_key)
+                return self._response_memo[cache_key]
+
+        value = get_llm_cache().get(cache_key)
+        if value is not None:
+            self._remember_response(cache_key, value)
+        return value
+
+    def _remember_response(self, cache_key: str, value: Any):
+        """
+        Add a response to the in-memory LRU.
+
+        Args:
+            cache_key: Cache key.
+            value: Response to remember.
+        """
+        with self._response_memo_lock:
+            self._response_memo[cache_key] = value
+            self._response_memo.move_to_end(cache_key)
+            while len(self._response_memo) > RESPONSE_MEMO_SIZE:
+                self._response_memo.popitem(last=False)
+
+    def _memoized(self, cache_key: str, compute: Callable[[], Any], is_cacheable: Callable[[Any], bool]) -> Any:
+        """
+        Get a response from the cache, or compute and cache it.
+
+        Concurrent threads asking for the same key wait for a single computation.
+
+        Args:
+            cache_key: Cache key.
+            compute: Function producing the response.
+            is_cacheable: Whether a computed response is complete enough to cache.
+
+        Returns:
+            The response.
+        """
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        with get_llm_cache().key_lock(cache_key):
+            # Another thread may have computed it while we waited
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+            value = compute()
+            if is_cacheable(value):
+                self._remember_response(cache_key, value)
+                get_llm_cache().set(cache_key, value)
+            return value
+
+    async def _amemoized(self, cache_key: str, compute: Callable[[], Awaitable[Any]],
+                         is_cacheable: Callable[[Any], bool]) -> Any:
+        """
+        Asynchronous version of _memoized.
+
+        Concurrent coroutines asking for the same key await a single in-flight computation.
+
+        Args:
+            cache_key: Cache key.
+            compute: Function returning a coroutine that produces the response.
+            is_cacheable: Whether a computed response is complete enough to cache.
+
+        Returns:
+            The response.
+        """
+        cached = await asyncio.to_thread(self._get_cached_response, cache_key)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            async def compute_and_cache():
+                try:
+                    value = await compute()
+                    if is_cacheable(value):
+                        self._remember_response(cache_key, value)
+                        await asyncio.to_thread(get_llm_cache().set, cache_key, value)
+                    return value
+                finally:
+                    self._in_flight.pop(cache_key, None)
+
+            task = self._in_flight[cache_key] = asyncio.ensure_future(compute_and_cache())
+
+        # Shield the shared task so one cancelled waiter doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _get_rate_limit(model) -> Optional[TokenBucket]:
+        """
+        Get the token bucket pacing calls to a model.
+
+        Args:
+            model: Gemini model.
+
+        Returns:
+            The model's token bucket, or None if it has no configured limit.
+        """
+        return MODEL_RATE_LIMITS.get(model.model_name.split("/")[-1])
+
+    def _generate(self, model, prompt: str):
+        """
+        Generate content, first waiting for the model's rate limit.
+
+        The token count is estimated at four characters per token.
+
+        Args:
+            model: Gemini model to call.
+            prompt: Prompt to send.
+
+        Returns:
+            The model response.
+        """
+        rate_limit = self._get_rate_limit(model)
+        if rate_limit is not None:
+            rate_limit.acquire(len(prompt) // 4)
+        return model.generate_content(prompt)
+
+    def _generate_json(self, model, prompt: str) -> Tuple[str, Optional[Any]]:
+        """
+        Stream a JSON response, stopping as soon as the JSON it starts with is complete.
+
+        Parsing can start while the model is still generating trailing tokens.
+
+        Args:
+            model: Gemini model to call.
+            prompt: Prompt to send.
+
+        Returns:
+            Tuple of (response text received, parsed JSON or None if the stream ended
+            before it was complete).
+        """
+        rate_limit = self._get_rate_limit(model)
+        if rate_limit is not None:
+            rate_limit.acquire(len(prompt) // 4)
+
+        stream = _JsonStream()
+        for chunk in model.generate_content(prompt, stream=True):
+            if stream.add(chunk):
+                break
+        return stream.text(), stream.data
+
+    async def _agenerate(self, model, prompt: str, semaphore: Optional[asyncio.Semaphore] = None,
+                         max_retries: int = 3):
+        """
+        Generate content asynchronously within the model's rate limit, retrying transient errors with backoff.
+
+        Args:
+            model: Gemini model to call.
+            prompt: Prompt to send.
+            semaphore: Optional semaphore bounding the number of calls in flight.
+            max_retries: Maximum number of retry attempts for transient errors.
+
+        Returns:
+            The model response.
+
+        Raises:
+            Exception: If the call fails with a non-transient error or keeps failing.
+        """
+        return await self._acall_with_retries(
+            model, prompt, lambda: model.generate_content_async(prompt), semaphore, max_retries
+        )
+
+    async def _agenerate_json(self, model, prompt: str, semaphore: Optional[asyncio.Semaphore] = None,
+                              max_retries: int = 3) -> Tuple[str, Optional[Any]]:
+        """
+        Asynchronous version of _generate_json, retrying transient errors with backoff.
+
+        Args:
+            model: Gemini model to call.
+            prompt: Prompt to send.
+            semaphore: Optional semaphore bounding the number of calls in flight.
+            max_retries: Maximum number of retry attempts for transient errors.
+
+        Returns:
+            Tuple of (response text received, parsed JSON or None if the stream ended
+            before it was complete).
+
+        Raises:
+            Exception: If the call fails with a non-transient error or keeps failing.
+        """
+        async def stream():
+            json_stream = _JsonStream()
+            async for chunk in await model.generate_content_async(prompt, stream=True):
+                if json_stream.add(chunk):
+                    break
+            return json_stream.text(), json_stream.data
+
+        return await self._acall_with_retries(model, prompt, stream, semaphore, max_retries)
+
+    async def _acall_with_retries(self, model, prompt: str, call: Callable[[], Awaitable[Any]],
+                                  semaphore: Optional[asyncio.Semaphore] = None, max_retries: int = 3) -> Any:
+        """
+        Make a Gemini call within the model's rate limit, retrying transient errors with backoff.
+
+        Args:
+            model: Gemini model being called.
+            prompt: Prompt being sent, used to estimate the token count.
+            call: Function returning a coroutine that makes the call.
+            semaphore: Optional semaphore bounding the number of calls in flight.
+            max_retries: Maximum number of retry attempts for transient errors.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            Exception: If the call fails with a non-transient error or keeps failing.
+        """
+        rate_limit = self._get_rate_limit(model)
+
+        async def send():
+            # Wait for the model's rate limit, estimating four characters per token
+            if rate_limit is not None:
+                await rate_limit.aacquire(len(prompt) // 4)
+            return await call()
+
+        retries = 0
+        while True:
+            try:
+                if semaphore is None:
+                    return await send()
+                async with semaphore:
+                    return await send()
+            except Exception as e:
+                if retries >= max_retries or not is_transient_error(e):
+                    raise
+                retries += 1
+
+                # Back off exponentially with 10% jitter, outside the semaphore
+                backoff_delay = 2 ** (retries - 1)
+                total_delay = backoff_delay + random.uniform(0, 0.1 * backoff_delay)
+                logger.warning(f"Transient Gemini error (attempt {retries}/{max_retries}): {e}. "
+                               f"Retrying in {total_delay:.2f} seconds...")
+                await asyncio.sleep(total_delay)
+
+    @staticmethod
+    def _build_expansion_prompt(query: str, num_expansions: int) -> str:
+        """
+        Build the query expansion prompt.
+
+        Args:
+            query: The original search query.
+            num_expansions: Number of new query variations to ask for.
+
+        Returns:
+            Prompt string.
+        """
+        return query.join(_expansion_prompt_parts(num_expansions))
+
+    @staticmethod
+    def _build_expansion_fallback_prompt(query: str, missing_count: int, expanded_queries: List[str]) -> str:
+        """
+        Build the simpler prompt used when the first expansion came back short.
+
+        Args:
+            query: The original search query.
+            missing_count: Number of variations still needed.
+            expanded_queries: Queries collected so far, starting with the original.
+
+        Returns:
+            Prompt string.
+        """
+        return f"""
+                Generate {missing_count} more search variations for: "{query}"
+                Make them different from these existing ones: {', '.join(expanded_queries[1:])}
+                Return only the new queries, one per line.
+                """
+
+    @staticmethod
+    def _clean_expansions(query: str, response_text: str) -> List[str]:
+        """
+        Split an expansion response into queries, dropping numbering and the original query.
+
+        Args:
+            query: The original search query.
+            response_text: Text of the model response.
+
+        Returns:
+            List of cleaned query variations.
+        """
+        # Split by newlines and clean up
+        new_queries = [line.strip() for line in response_text.strip().split('\n') if line.strip()]
+
+        # Remove any numbering or bullet points that might have been added
+        cleaned_queries = []
+        for new_query in new_queries:
+            # Remove common prefixes like "1.", "- ", etc.
+            cleaned_query = _strip_list_prefix(new_query)
+            if cleaned_query and cleaned_query.lower() != query.lower():
+                cleaned_queries.append(cleaned_query)
+
+        return cleaned_queries
+
+    @staticmethod
+    def _add_expansions(expanded_queries: List[str], new_queries: List[str], num_expansions: int):
+        """
+        Add unique query variations until the requested number is reached.
+
+        Variations are compared case-insensitively, like the check against the original query.
+
+        Args:
+            expanded_queries: Queries collected so far, starting with the original; updated in place.
+            new_queries: Candidate variations.
+            num_expansions: Number of variations requested.
+        """
+        seen = {expanded_query.lower() for expanded_query in expanded_queries}
+        for new_query in new_queries:
+            if len(expanded_queries) >= num_expansions + 1:  # +1 for original query
+                break
+            key = new_query.lower()
+            if new_query and key not in seen:
+                seen.add(key)
+                expanded_queries.append(new_query)
+
+    @staticmethod
+    def _build_multiplexed_expansion_prompt(queries: List[str], num_expansions: int) -> str:
+        """
+        Build the prompt expanding several queries in one call.
+
+        Args:
+            queries: The original search queries.
+            num_expansions: Number of new query variations to ask for per query.
+
+        Returns:
+            Prompt string.
+        """
+        return f"""
+        You are a startup intelligence researcher specializing in query expansion for Google search.
+
+        TASK:
+        For each of the following {len(queries)} queries, generate exactly {num_expansions} different search query variations for finding startups related to it:
+        {_dumps_json(queries, indent=True)}
+
+        {_EXPANSION_GUIDELINES}
+
+        FORMAT:
+        Return a JSON object mapping each query, copied exactly as given, to a list of EXACTLY {num_expansions} variations.
+        Do not include the original query in its own list.
+        Return only the JSON object, without any other text.
+        """
+
+    def expand_queries_multiplexed(self, queries: List[str], num_expansions: int = 5) -> Dict[str, List[str]]:
+        """
+        Expand several queries with a single Gemini call.
+
+        Args:
+            queries: List of queries to expand.
+            num_expansions: Number of NEW query variations to generate per query.
+
+        Returns:
+            Dictionary mapping each query whose expansion came back complete to its
+            expansions, including the original query. Other queries are left out.
+        """
+        return _run_async(self.aexpand_queries_multiplexed(queries, num_expansions))
+
+    async def aexpand_queries_multiplexed(self, queries: List[str], num_expansions: int = 5,
+                                          semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, List[str]]:
+        """
+        Asynchronous version of expand_queries_multiplexed.
+
+        Complete expansions are cached under the same keys as expand_query, so later
+        single-query requests reuse them.
+
+        Args:
+            queries: List of queries to expand.
+            num_expansions: Number of NEW query variations to generate per query.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
+
+        Returns:
+            Dictionary mapping each query whose expansion came back complete to its
+            expansions, including the original query.
+        """
+        try:
+            prompt = self._build_multiplexed_expansion_prompt(queries, num_expansions)
+            response = await self._agenerate(self.pro_model, prompt, semaphore)
+        except Exception as e:
+            logger.error(f"Error expanding {len(queries)} queries with one Gemini call: {e}")
+            return {}
+
+        is_valid, parsed, error = self._validate_response(response.text)
+        if not is_valid or not isinstance(parsed, dict):
+            logger.warning(f"Invalid multiplexed expansion response: {error or 'expected a JSON object'}")
+            return {}
+
+        # Match the returned keys loosely in case the model changed case or spacing
+        variations_by_query = {str(key).strip().lower(): value for key, value in parsed.items()}
+
+        expansions = {}
+        for query in queries:
+            variations = variations_by_query.get(query.strip().lower())
+            if not isinstance(variations, list):
+                continue
+
+            # Always start with the original query
+            expanded_queries = [query]
+            new_queries = [
+                variation.strip() for variation in variations
+                if isinstance(variation, str) and variation.strip().lower() != query.strip().lower()
+            ]
+            self._add_expansions(expanded_queries, new_queries, num_expansions)
+
+            # Incomplete expansions go through the per-query path instead
+            if len(expanded_queries) != num_expansions + 1:
+                continue
+
+            cache_key = self._get_prompt_cache_key("expand", self._build_expansion_prompt(query, num_expansions))
+            self._remember_response(cache_key, expanded_queries)
+            await asyncio.to_thread(get_llm_cache().set, cache_key, expanded_queries)
+            expansions[query] = expanded_queries
+
+        logger.info(f"Expanded {len(expansions)} of {len(queries)} queries with one Gemini call")
+        return expansions
+
+    def expand_query(self, query: str, num_expansions: int = 5) -> List[str]:
+        """
+        Expand a search query into multiple variations using Gemini 2.5 Flash.
+
+        Uses Gemini 2.5 Flash for all query expansions to maximize semantic diversity
+        and ensure each query targets a different aspect of the search space.
 
         Args:
             query: The original search query.
@@ -281,76 +1309,38 @@ class GeminiAPIClient:
         if num_expansions <= 0:
             return [query]
 
-        # Create an enhanced prompt for Gemini 2.5 Flash with diversity optimization
-        prompt = f"""
-        You are a startup intelligence researcher specializing in query expansion for Google search.
+        prompt = self._build_expansion_prompt(query, num_expansions)
 
-        TASK:
-        Generate exactly {num_expansions} different search query variations for finding startups related to: "{query}"
+        # Reuse an earlier expansion of the same prompt; incomplete expansions aren't cached
+        return list(self._memoized(
+            self._get_prompt_cache_key("expand", prompt),
+            lambda: self._expand_query_uncached(query, num_expansions, prompt),
+            lambda expanded_queries: len(expanded_queries) == num_expansions + 1
+        ))
 
-        GUIDELINES:
-        - Maximize DIVERSITY in the search vector space - each query should target a different aspect or dimension
-        - Avoid semantic overlap between queries - each should retrieve a substantially different set of results
-        - Consider different:
-          * Industry verticals (energy, mobility, social tech, etc.)
-          * Geographic focuses (specific regions, urban/rural)
-          * Technology approaches (hardware, software, services)
-          * Business models (B2B, B2C, marketplace)
-          * Company stages (early-stage, growth, established)
-          * Funding status (bootstrapped, seed, venture-backed)
-        - Use industry-specific terminology where appropriate
-        - Include both specific and general variations, but ensure they target different result sets
-        - Each query should be 2-8 words long and search-engine optimized
-        - Prioritize queries that would yield unique startups not found by other queries
+    def _expand_query_uncached(self, query: str, num_expansions: int, prompt: str) -> List[str]:
+        """
+        Expand a search query with the model, without consulting the cache.
 
-        EXAMPLES of good query variations for "AI startups":
-        - "artificial intelligence companies"
-        - "machine learning ventures"
-        - "AI tech entrepreneurs"
-        - "deep learning businesses"
-        - "neural network startups"
+        Args:
+            query: The original search query.
+            num_expansions: Number of NEW query variations to generate.
+            prompt: Expansion prompt for the query.
 
-        FORMAT:
-        Return EXACTLY {num_expansions} queries, one per line, without numbering or any other text.
-        Do not include the original query "{query}" in your response.
-        Each line should contain only one search query.
+        Returns:
+            A list of expanded query strings, including the original query.
         """
-
         try:
             # Use Gemini 2.5 Flash for query expansions
             logger.info("Using Gemini 2.5 Flash for query expansion...")
-            response = self.pro_model.generate_content(prompt)
+            response = self._generate(self.pro_model, prompt)
             logger.info("Successfully used Gemini 2.5 Flash for query expansion")
 
             # Always start with the original query
             expanded_queries = [query]
 
             if response.text:
-                # Split by newlines and clean up
-                new_queries = [line.strip() for line in response.text.strip().split('\n') if line.strip()]
-
-                # Remove any numbering or bullet points that might have been added
-                cleaned_queries = []
-                for new_query in new_queries:
-                    # Remove common prefixes like "1.", "- ", etc.
-                    cleaned_query = new_query
-                    if '. ' in cleaned_query and cleaned_query.split('. ', 1)[0].isdigit():
-                        cleaned_query = cleaned_query.split('. ', 1)[1]
-                    elif cleaned_query.startswith('- '):
-                        cleaned_query = cleaned_query[2:]
-                    elif cleaned_query.startswith('* '):
-                        cleaned_query = cleaned_query[2:]
-
-                    cleaned_query = cleaned_query.strip()
-                    if cleaned_query and cleaned_query.lower() != query.lower():
-                        cleaned_queries.append(cleaned_query)
-
-                # Add unique expansions up to the requested number
-                for new_query in cleaned_queries:
-                    if len(expanded_queries) >= num_expansions + 1:  # +1 for original query
-                        break
-                    if new_query not in expanded_queries:
-                        expanded_queries.append(new_query)
+                self._add_expansions(expanded_queries, self._clean_expansions(query, response.text), num_expansions)
 
             # If we didn't get enough variations, try to generate more with a simpler approach
             if len(expanded_queries) < num_expansions + 1:
@@ -358,21 +1348,13 @@ class GeminiAPIClient:
                 logger.warning(f"Only got {len(expanded_queries)-1} variations, need {missing_count} more")
 
                 # Try a simpler fallback prompt
-                fallback_prompt = f"""
-                Generate {missing_count} more search variations for: "{query}"
-                Make them different from these existing ones: {', '.join(expanded_queries[1:])}
-                Return only the new queries, one per line.
-                """
+                fallback_prompt = self._build_expansion_fallback_prompt(query, missing_count, expanded_queries)
 
                 try:
-                    fallback_response = self.pro_model.generate_content(fallback_prompt)
+                    fallback_response = self._generate(self.pro_model, fallback_prompt)
                     if fallback_response.text:
                         fallback_queries = [line.strip() for line in fallback_response.text.strip().split('\n') if line.strip()]
-                        for fallback_query in fallback_queries:
-                            if len(expanded_queries) >= num_expansions + 1:
-                                break
-                            if fallback_query and fallback_query not in expanded_queries:
-                                expanded_queries.append(fallback_query)
+                        self._add_expansions(expanded_queries, fallback_queries, num_expansions)
                 except Exception as fallback_error:
                     logger.warning(f"Fallback query generation failed: {fallback_error}")
 
@@ -384,24 +1366,95 @@ class GeminiAPIClient:
             # Return the original query if there's an error
             return [query]
 
-    def analyze_startup(self, startup_data: Dict[str, str], fields: List[str]) -> Dict[str, Union[str, Dict]]:
+    async def aexpand_query(self, query: str, num_expansions: int = 5,
+                            semaphore: Optional[asyncio.Semaphore] = None) -> List[str]:
         """
-        Analyze startup data to extract requested fields using Gemini AI.
+        Asynchronous version of expand_query.
 
         Args:
-            startup_data: Raw data about the startup.
-            fields: List of fields to extract (e.g., "Founders", "Funding").
+            query: The original search query.
+            num_expansions: Number of NEW query variations to generate (in addition to original).
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
 
         Returns:
-            A dictionary with the extracted information.
-
-        Raises:
-            Exception: If there's an error communicating with the Gemini API.
+            A list of expanded query strings, including the original query.
         """
-        # Convert startup data to a string representation
-        data_str = "\n".join([f"{k}: {v}" for k, v in startup_data.items()])
+        # If query is empty or only whitespace, or no expansions requested, return it as is
+        if not query or not query.strip() or num_expansions <= 0:
+            return [query]
 
-        # Create a prompt for Gemini
+        prompt = self._build_expansion_prompt(query, num_expansions)
+
+        # Reuse an earlier expansion of the same prompt, sharing one call between concurrent requests
+        return list(await self._amemoized(
+            self._get_prompt_cache_key("expand", prompt),
+            lambda: self._aexpand_query_uncached(query, num_expansions, prompt, semaphore),
+            lambda expanded_queries: len(expanded_queries) == num_expansions + 1
+        ))
+
+    async def _aexpand_query_uncached(self, query: str, num_expansions: int, prompt: str,
+                                      semaphore: Optional[asyncio.Semaphore] = None) -> List[str]:
+        """
+        Asynchronous version of _expand_query_uncached.
+
+        Args:
+            query: The original search query.
+            num_expansions: Number of NEW query variations to generate.
+            prompt: Expansion prompt for the query.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
+
+        Returns:
+            A list of expanded query strings, including the original query.
+        """
+        try:
+            response = await self._agenerate(self.pro_model, prompt, semaphore)
+
+            # Always start with the original query
+            expanded_queries = [query]
+
+            if response.text:
+                self._add_expansions(expanded_queries, self._clean_expansions(query, response.text), num_expansions)
+
+            # If we didn't get enough variations, try to generate more with a simpler approach
+            if len(expanded_queries) < num_expansions + 1:
+                missing_count = (num_expansions + 1) - len(expanded_queries)
+                logger.warning(f"Only got {len(expanded_queries)-1} variations for '{query}', need {missing_count} more")
+
+                fallback_prompt = self._build_expansion_fallback_prompt(query, missing_count, expanded_queries)
+
+                try:
+                    fallback_response = await self._agenerate(self.pro_model, fallback_prompt, semaphore)
+                    if fallback_response.text:
+                        fallback_queries = [line.strip() for line in fallback_response.text.strip().split('\n') if line.strip()]
+                        self._add_expansions(expanded_queries, fallback_queries, num_expansions)
+                except Exception as fallback_error:
+                    logger.warning(f"Fallback query generation failed: {fallback_error}")
+
+            logger.info(f"Generated {len(expanded_queries)-1} unique query variations for '{query}' (requested {num_expansions})")
+            return expanded_queries
+
+        except Exception as e:
+            logger.error(f"Error expanding query '{query}' with Gemini API: {e}")
+            # Return the original query if there's an error
+            return [query]
+
+    @staticmethod
+    def _build_analysis_prompt(startup_data: Dict[str, str], fields: List[str]) -> str:
+        """
+        Build the startup analysis prompt.
+
+        Args:
+            startup_data: Raw data about the startup.
+            fields: List of fields to extract.
+
+        Returns:
+            Prompt string.
+        """
+        # Convert startup data to a string representation. str.join builds a list from
+        # a generator anyway, so the list comprehension is the fastest form here.
+        data_str = "\n".join([f"{k}: {v}" for k, v in startup_data.items()])
+
+        # Create a prompt for Gemini
         fields_str = ", ".join(fields)
         prompt = f"""
         You are a startup intelligence analyst. Extract the following information about
@@ -415,43 +1468,74 @@ class GeminiAPIClient:
 
         Format your response as a JSON object with the requested fields as keys.
         """
+        return prompt
 
+    def _parse_analysis(self, response_text: str, parsed_data: Optional[Any] = None) -> Dict[str, Union[str, Dict]]:
+        """
+        Parse a startup analysis response.
+
+        Args:
+            response_text: Text of the model response.
+            parsed_data: The response JSON if it was already parsed while streaming (optional).
+
+        Returns:
+            A dictionary with the extracted information, or the raw response if it isn't JSON.
+        """
+        is_valid, parsed_data, _ = self._validate_response(response_text, parsed_data)
+        if not is_valid:
+            # If we can't parse as JSON, return the raw response
+            return {
+                "raw_response": response_text,
+                "confidence": 0.5,  # Lower confidence for unparseable responses
+                "last_updated": "2024-04-01"  # Placeholder
+            }
+
+        # Add metadata
+        return {
+            "data": parsed_data,
+            "confidence": 0.9,  # Placeholder - in a real implementation, this would be calculated
+            "last_updated": "2024-04-01"  # Placeholder - in a real implementation, this would be dynamic
+        }
+
+    def analyze_startup(self, startup_data: Dict[str, str], fields: List[str]) -> Dict[str, Union[str, Dict]]:
+        """
+        Analyze startup data to extract requested fields using Gemini AI.
+
+        Args:
+            startup_data: Raw data about the startup.
+            fields: List of fields to extract (e.g., "Founders", "Funding").
+
+        Returns:
+            A dictionary with the extracted information.
+
+        Raises:
+            Exception: If there's an error communicating with the Gemini API.
+        """
+        prompt = self._build_analysis_prompt(startup_data, fields)
+
+        # Reuse an earlier analysis of the same data; failed or unparseable responses aren't cached
+        return dict(self._memoized(
+            self._get_prompt_cache_key("analyze", prompt),
+            lambda: self._analyze_startup_uncached(prompt),
+            lambda result: "data" in result
+        ))
+
+    def _analyze_startup_uncached(self, prompt: str) -> Dict[str, Union[str, Dict]]:
+        """
+        Analyze startup data with the model, without consulting the cache.
+
+        Args:
+            prompt: Analysis prompt for the startup.
+
+        Returns:
+            A dictionary with the extracted information.
+        """
         try:
             # Use the pro model with search grounding for deeper analysis
             # Note: Search grounding is configured when the model is initialized
 
-            # Generate content with search grounding
-            response = self.pro_model.generate_content(prompt)
-
-            # Try to parse the response as JSON
-            try:
-                # Extract JSON from the response
-                response_text = response.text.strip()
-
-                # If the response is wrapped in ```json and ```, extract just the JSON part
-                if response_text.startswith("```json") and response_text.endswith("```"):
-                    response_text = response_text[7:-3].strip()
-                elif response_text.startswith("```") and response_text.endswith("```"):
-                    response_text = response_text[3:-3].strip()
-
-                parsed_data = json.loads(response_text)
-
-                # Add metadata
-                result = {
-                    "data": parsed_data,
-                    "confidence": 0.9,  # Placeholder - in a real implementation, this would be calculated
-                    "last_updated": "2024-04-01"  # Placeholder - in a real implementation, this would be dynamic
-                }
-
-                return result
-
-            except json.JSONDecodeError:
-                # If we can't parse as JSON, return the raw response
-                return {
-                    "raw_response": response.text,
-                    "confidence": 0.5,  # Lower confidence for unparseable responses
-                    "last_updated": "2024-04-01"  # Placeholder
-                }
+            # Generate content with search grounding, parsing as soon as the JSON is complete
+            return self._parse_analysis(*self._generate_json(self.pro_model, prompt))
 
         except Exception as e:
             print(f"Error analyzing startup with Gemini API: {e}")
@@ -461,405 +1545,870 @@ class GeminiAPIClient:
                 "last_updated": "2024-04-01"  # Placeholder
             }
 
-    def expand_queries_batch(self, queries: List[str], num_expansions: int = 5) -> Dict[str, List[str]]:
+    async def aanalyze_startup(self, startup_data: Dict[str, str], fields: List[str],
+                               semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Union[str, Dict]]:
         """
-        Expand multiple queries in parallel.
+        Asynchronous version of analyze_startup.
+
+        Args:
+            startup_data: Raw data about the startup.
+            fields: List of fields to extract (e.g., "Founders", "Funding").
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
+
+        Returns:
+            A dictionary with the extracted information.
+        """
+        prompt = self._build_analysis_prompt(startup_data, fields)
+
+        # Reuse an earlier analysis of the same data, sharing one call between concurrent requests
+        return dict(await self._amemoized(
+            self._get_prompt_cache_key("analyze", prompt),
+            lambda: self._aanalyze_startup_uncached(prompt, semaphore),
+            lambda result: "data" in result
+        ))
+
+    async def _aanalyze_startup_uncached(self, prompt: str,
+                                         semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Union[str, Dict]]:
+        """
+        Asynchronous version of _analyze_startup_uncached.
+
+        Args:
+            prompt: Analysis prompt for the startup.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
+
+        Returns:
+            A dictionary with the extracted information.
+        """
+        try:
+            return self._parse_analysis(*await self._agenerate_json(self.pro_model, prompt, semaphore))
+
+        except Exception as e:
+            logger.error(f"Error analyzing startup with Gemini API: {e}")
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "last_updated": "2024-04-01"  # Placeholder
+            }
+
+    def expand_queries_batch(self, queries: List[str], num_expansions: int = 5,
+                             concurrency: int = 30) -> Dict[str, List[str]]:
+        """
+        Expand multiple queries concurrently.
 
         Args:
             queries: List of queries to expand.
             num_expansions: Number of expansions per query.
+            concurrency: Maximum number of Gemini calls in flight.
 
         Returns:
             Dictionary mapping original queries to their expansions.
         """
-        logger.info(f"Expanding {len(queries)} queries in parallel with {num_expansions} expansions each")
+        return _run_async(self.aexpand_queries_batch(queries, num_expansions, concurrency))
 
-        batch_processor = GeminiAPIBatchProcessor(max_workers=30)
+    async def aexpand_queries_batch(self, queries: List[str], num_expansions: int = 5,
+                                    concurrency: int = 30) -> Dict[str, List[str]]:
+        """
+        Expand multiple queries concurrently on the event loop.
 
-        # Define the processing function
-        def process_query(api_client, query, num_expansions):
-            return {
-                "query": query,
-                "expansions": api_client.expand_query(query, num_expansions)
-            }
+        Duplicate queries are expanded once. Queries are expanded MULTIPLEXED_EXPANSION_SIZE
+        at a time in a single prompt; queries whose multiplexed expansion came back incomplete
+        are expanded one by one. Queries already being expanded by a concurrent request share
+        its result, and concurrent requests share this batch's results.
 
-        # Process the batch
-        results = batch_processor.process_batch(
-            self, queries, process_query, num_expansions
-        )
+        Args:
+            queries: List of queries to expand.
+            num_expansions: Number of expansions per query.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            Dictionary mapping original queries to their expansions.
+        """
+        logger.info(f"Expanding {len(queries)} queries concurrently with {num_expansions} expansions each")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        expansions = {}
+        pending = {}  # query -> (cache key, future shared with concurrent requests)
+        joined = {}  # query -> in-flight computation started by another request
+
+        # Duplicate queries are only expanded once
+        for query in dict.fromkeys(queries):
+            # Empty queries and zero expansions need no API call
+            if not query or not query.strip() or num_expansions <= 0:
+                expansions[query] = [query]
+                continue
+
+            # Skip queries that were already expanded, and join those being expanded right now
+            cache_key = self._get_prompt_cache_key("expand", self._build_expansion_prompt(query, num_expansions))
+            cached = await asyncio.to_thread(self._get_cached_response, cache_key)
+            if cached is not None:
+                expansions[query] = list(cached)
+            elif cache_key in self._in_flight:
+                joined[query] = self._in_flight[cache_key]
+            else:
+                # Register the query so concurrent requests for it wait for this batch
+                future = loop.create_future()
+                self._in_flight[cache_key] = future
+                pending[query] = (cache_key, future)
 
-        # Convert to dictionary
-        expansions_dict = {}
-        for result in results:
-            if isinstance(result, dict) and "query" in result and "expansions" in result:
-                expansions_dict[result["query"]] = result["expansions"]
-            elif isinstance(result, dict) and "error" in result and "item" in result:
-                # Handle error case
-                query = result["item"]
-                logger.error(f"Error expanding query '{query}': {result['error']}")
-                expansions_dict[query] = [query]  # Use original query as fallback
+        try:
+            # Step 1: Expand the remaining queries several at a time
+            queries_to_send = list(pending)
+            chunks = [queries_to_send[i:i + MULTIPLEXED_EXPANSION_SIZE]
+                      for i in range(0, len(queries_to_send), MULTIPLEXED_EXPANSION_SIZE)]
+            for chunk_expansions in await asyncio.gather(*(
+                self.aexpand_queries_multiplexed(chunk, num_expansions, semaphore) for chunk in chunks
+            )):
+                expansions.update(chunk_expansions)
+
+            # Step 2: Fall back to one call per query for those the multiplexed calls missed
+            missing = [query for query in queries_to_send if query not in expansions]
+            if missing:
+                logger.info(f"Expanding {len(missing)} queries individually")
+
+                # Unregister them first so aexpand_query doesn't wait on this batch
+                for query in missing:
+                    self._in_flight.pop(pending[query][0], None)
+
+                for query, expanded_queries in zip(missing, await asyncio.gather(*(
+                    self.aexpand_query(query, num_expansions, semaphore) for query in missing
+                ))):
+                    expansions[query] = expanded_queries
+        finally:
+            # Hand the results to requests that joined while the batch ran
+            for query, (cache_key, future) in pending.items():
+                if self._in_flight.get(cache_key) is future:
+                    del self._in_flight[cache_key]
+                if not future.done():
+                    future.set_result(expansions.get(query, [query]))
+
+        # Step 3: Collect queries another request was already expanding
+        for query, in_flight in joined.items():
+            expansions[query] = list(await asyncio.shield(in_flight))
+
+        # aexpand_query falls back to the original query on errors, so every query has an entry
+        expansions_dict = {query: expansions[query] for query in queries}
 
         logger.info(f"Successfully expanded {len(expansions_dict)} queries")
         return expansions_dict
 
-    def analyze_startups_batch(self, startups_data: List[Dict[str, str]], fields: List[str]) -> List[Dict[str, Any]]:
+    def analyze_startups_batch(self, startups_data: List[Dict[str, str]], fields: List[str],
+                               concurrency: int = 30) -> List[Dict[str, Any]]:
         """
-        Analyze multiple startups in parallel.
+        Analyze multiple startups concurrently.
 
         Args:
             startups_data: List of startup data dictionaries.
             fields: List of fields to extract for each startup.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with analyzed startup data, in input order.
+        """
+        return _run_async(self.aanalyze_startups_batch(startups_data, fields, concurrency))
+
+    async def aanalyze_startups_batch(self, startups_data: List[Dict[str, str]], fields: List[str],
+                                      concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Analyze multiple startups concurrently on the event loop.
+
+        Args:
+            startups_data: List of startup data dictionaries.
+            fields: List of fields to extract for each startup.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with analyzed startup data, in input order.
+        """
+        logger.info(f"Analyzing {len(startups_data)} startups concurrently")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(*(
+            self.aanalyze_startup(startup_data, fields, semaphore) for startup_data in startups_data
+        ))
+
+        logger.info(f"Successfully analyzed {len(results)} startups")
+        return list(results)
+
+    @staticmethod
+    def _build_validation_prompt(batch: List[Dict[str, Any]], query: str) -> str:
+        """
+        Build the prompt that validates and enriches a batch of startups.
+
+        Args:
+            batch: Startup dictionaries to validate.
+            query: The original search query.
+
+        Returns:
+            Prompt string.
+        """
+        return _VALIDATION_PROMPT_TEMPLATE.format(query=query, data=_dumps_json(batch, indent=True))
+
+    @staticmethod
+    def _create_validation_model():
+        """
+        Create the Gemini 2.0 Flash model with search grounding used for validation.
+
+        Returns:
+            Configured GenerativeModel.
+        """
+        # Use Gemini 2.0 Flash with search grounding for validation
+        return genai.GenerativeModel(
+            model_name='gemini-2.0-flash',
+            generation_config=_LOW_TEMP_GEN_CONFIG,
+            safety_settings=_SAFETY_SETTINGS_BLOCK_NONE,
+            tools=[{"web_search": {}}]  # Enable search grounding
+        )
+
+    def _get_validation_model(self):
+        """
+        Get the validation model, creating it on first use and reusing it afterwards.
+
+        Returns:
+            Configured GenerativeModel.
+        """
+        if self._validation_model is None:
+            self._validation_model = self._create_validation_model()
+        return self._validation_model
+
+    def validate_startups_batch(self, startups: List[Dict[str, Any]], query: str,
+                                concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Validate multiple startups concurrently.
+
+        Args:
+            startups: List of startup dictionaries to validate.
+            query: The original search query.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of validated startup dictionaries.
+        """
+        return _run_async(self.avalidate_startups_batch(startups, query, concurrency))
+
+    async def avalidate_startups_batch(self, startups: List[Dict[str, Any]], query: str,
+                                       concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Validate multiple startups concurrently on the event loop.
+
+        Args:
+            startups: List of startup dictionaries to validate.
+            query: The original search query.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of validated startup dictionaries.
+        """
+        logger.info(f"Validating {len(startups)} startups concurrently")
+
+        # Split into smaller batches for better performance with Gemini
+        batch_size = 5  # Gemini works better with smaller batches
+        batches = [startups[i:i+batch_size] for i in range(0, len(startups), batch_size)]
+
+        try:
+            model = self._get_validation_model()
+        except Exception as e:
+            logger.error(f"Error creating the validation model: {e}")
+            return startups  # Return the original startups on error
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_batch(batch):
+            try:
+                response_text, parsed_data = await self._agenerate_json(model, self._build_validation_prompt(batch, query),
+                                                                        semaphore)
+            except Exception as e:
+                logger.error(f"Error validating batch of {len(batch)} startups: {e}")
+                return batch  # Return original batch on error
+
+            try:
+                is_valid, validated_data, error_message = self._validate_response(response_text, parsed_data)
+            except Exception as e:
+                is_valid, error_message = False, str(e)
+
+            if not is_valid:
+                logger.error(f"Error parsing response: {error_message}")
+                return batch  # Return original batch on error
+            return validated_data
+
+        # Flatten results, keeping the batch order
+        results = []
+        for batch_result in await asyncio.gather(*(process_batch(batch) for batch in batches)):
+            if isinstance(batch_result, list):
+                results.extend(batch_result)
+            else:
+                results.append(batch_result)
+
+        logger.info(f"Successfully validated {len(results)} startups")
+        return results
+
+    def validate_startups_chunk(self, chunk_text: str, query: str, startup_indices: List[int]) -> Dict[str, Any]:
+        """
+        Validate a chunk of startup data using Gemini 2.0 Flash.
+
+        This method is designed to work with the ContentProcessor's chunking functionality.
+
+        Args:
+            chunk_text: The text chunk containing startup data.
+            query: The original search query.
+            startup_indices: List of indices of startups in the original list.
+
+        Returns:
+            Dictionary with validated startup data and metadata.
+        """
+        logger.info(f"Validating chunk with {len(startup_indices)} startups")
+
+        prompt = _VALIDATION_PROMPT_TEMPLATE.format(query=query, data=chunk_text)
+
+        try:
+            # Get response from Gemini 2.0 Flash with search grounding
+            model = self._get_validation_model()
+            response_text, parsed_data = self._generate_json(model, prompt)
+
+            is_valid, validated_data, error_message = self._validate_response(response_text, parsed_data)
+            if not is_valid:
+                raise ValueError(error_message)
+
+            # Return the validated data with metadata
+            return {
+                "validated_data": validated_data,
+                "startup_indices": startup_indices,
+                "success": True
+            }
+
+        except Exception as e:
+            logger.error(f"Error validating chunk: {e}")
+            # Return error information
+            return {
+                "error": str(e),
+                "startup_indices": startup_indices,
+                "success": False
+            }
+
+    def combine_validated_chunks(self, validated_chunks: List[Dict[str, Any]], original_startups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Combine validated chunks into a single result.
+
+        Args:
+            validated_chunks: List of dictionaries with validated startup data and metadata.
+            original_startups: The original list of startup dictionaries.
+
+        Returns:
+            List of validated startup dictionaries.
+        """
+        logger.info(f"Combining {len(validated_chunks)} validated chunks")
+
+        # Create a copy of the original startups to update. Copying the list is a single memcpy,
+        # so updating it in place is cheaper than a sparse dict of updates merged index by index.
+        result_startups = list(original_startups)
+        num_original = len(result_startups)
+        extra_startups = []
+
+        # Process each validated chunk
+        for chunk in validated_chunks:
+            # Skip failed chunks
+            if not chunk.get("success", False):
+                logger.warning(f"Skipping failed chunk: {chunk.get('error', 'Unknown error')}")
+                continue
+
+            # Get the validated data and startup indices
+            validated_data = chunk.get("validated_data", [])
+            startup_indices = chunk.get("startup_indices", [])
+
+            # If validated_data is a list, process each item
+            if isinstance(validated_data, list):
+                # Match validated startups with original startups by index; zip stops at the shorter list
+                for original_index, validated_startup in zip(startup_indices, validated_data):
+                    if original_index < num_original:
+                        # Update the startup with validated data
+                        result_startups[original_index] = validated_startup
+
+                # If there are more validated startups than indices, append them
+                extra_startups.extend(validated_data[len(startup_indices):])
+
+            # If validated_data is a dictionary, process it as a single startup
+            elif isinstance(validated_data, dict):
+                # Update the first startup in the indices
+                if startup_indices and startup_indices[0] < num_original:
+                    result_startups[startup_indices[0]] = validated_data
+
+        result_startups.extend(extra_startups)
+
+        # Filter out any None values or empty dictionaries
+        result_startups = [s for s in result_startups if s and isinstance(s, dict)]
+
+        logger.info(f"Combined {len(result_startups)} validated startups")
+        return result_startups
+
+    def extract_structured_data_batch(self, items: List[Tuple[str, str, str, List[str]]],
+                                      concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from multiple sources concurrently.
+
+        Args:
+            items: List of tuples (company_name, source_type, content, fields).
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with extracted data, in the order of the items.
+        """
+        return _run_async(self.aextract_structured_data_batch(items, concurrency))
+
+    async def aextract_structured_data_batch(self, items: List[Tuple[str, str, str, List[str]]],
+                                             concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from multiple sources concurrently on the event loop.
+
+        Args:
+            items: List of tuples (company_name, source_type, content, fields).
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with extracted data, in the order of the items.
+        """
+        logger.info(f"Extracting structured data from {len(items)} sources concurrently")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        extracted = await asyncio.gather(*(
+            self.aextract_structured_data(company_name, source_type, content, fields, semaphore)
+            for company_name, source_type, content, fields in items
+        ))
+
+        results = [
+            {"company_name": company_name, "source_type": source_type, "data": data}
+            for (company_name, source_type, _, _), data in zip(items, extracted)
+        ]
+
+        logger.info(f"Successfully extracted data from {len(results)} sources")
+        return results
+
+    def extract_structured_data_multibatch(self, items: List[Tuple[str, str, str, List[str]]],
+                                           group_size: int = EXTRACTION_GROUP_SIZE,
+                                           concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from multiple sources, several companies per Gemini call.
+
+        Items sharing a source type and field list are sent group_size at a time through
+        aextract_structured_data_rows, so the instructions are sent once per group instead
+        of once per company. Items a group response doesn't cover fall back to single
+        extractions.
+
+        Args:
+            items: List of tuples (company_name, source_type, content, fields).
+            group_size: Maximum number of companies per prompt.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with extracted data, in the order of the items.
+        """
+        return _run_async(self.aextract_structured_data_multibatch(items, group_size, concurrency))
+
+    async def aextract_structured_data_multibatch(self, items: List[Tuple[str, str, str, List[str]]],
+                                                  group_size: int = EXTRACTION_GROUP_SIZE,
+                                                  concurrency: int = 30) -> List[Dict[str, Any]]:
+        """
+        Asynchronous version of extract_structured_data_multibatch.
+
+        Args:
+            items: List of tuples (company_name, source_type, content, fields).
+            group_size: Maximum number of companies per prompt.
+            concurrency: Maximum number of Gemini calls in flight.
+
+        Returns:
+            List of dictionaries with extracted data, in the order of the items.
+        """
+        logger.info(f"Extracting structured data from {len(items)} sources, up to {group_size} per call")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Group items that can share a prompt
+        indices_by_group: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+        for index, (_, source_type, _, fields) in enumerate(items):
+            indices_by_group.setdefault((source_type, tuple(fields)), []).append(index)
+
+        async def extract_group(source_type: str, fields: Tuple[str, ...], indices: List[int]) -> Dict[int, Dict[str, Any]]:
+            # Rows are keyed by company name, so each name is sent once per group
+            rows = {}
+            for index in indices:
+                company_name, _, content, _ = items[index]
+                rows.setdefault(company_name, content)
+
+            try:
+                extracted = await self.aextract_structured_data_rows(source_type, list(rows.items()), list(fields),
+                                                                     semaphore)
+            except Exception as e:
+                logger.error(f"Error extracting a group of {len(rows)} companies from {source_type}: {e}")
+                return {}
+
+            # A company whose content differs from the row sent for it goes through a single extraction
+            return {
+                index: dict(extracted[items[index][0]]) for index in indices
+                if items[index][0] in extracted and rows[items[index][0]] == items[index][2]
+            }
+
+        # Step 1: Extract every group of more than one item with one call
+        group_calls = []
+        for (source_type, fields), indices in indices_by_group.items():
+            for start in range(0, len(indices), group_size):
+                group = indices[start:start + group_size]
+                if len(group) > 1:
+                    group_calls.append(extract_group(source_type, fields, group))
+
+        extracted: Dict[int, Dict[str, Any]] = {}
+        for group_results in await asyncio.gather(*group_calls):
+            extracted.update(group_results)
+
+        # Step 2: Fall back to single extractions for everything else
+        missing = [index for index in range(len(items)) if index not in extracted]
+        if missing:
+            logger.info(f"Extracting {len(missing)} sources not covered by a group individually")
+            single_results = await asyncio.gather(*(
+                self.aextract_structured_data(*items[index], semaphore) for index in missing
+            ))
+            extracted.update(zip(missing, single_results))
+
+        results = [
+            {"company_name": company_name, "source_type": source_type, "data": extracted[index]}
+            for index, (company_name, source_type, _, _) in enumerate(items)
+        ]
+
+        logger.info(f"Successfully extracted data from {len(results)} sources")
+        return results
+
+    def extract_structured_data_multi(self, company_name: str, sources: List[Tuple[str, str]], fields: List[str]) -> Dict[str, Any]:
+        """
+        Extract structured data from several sources about one company in a single LLM call.
+
+        Args:
+            company_name: Name of the company.
+            sources: List of tuples (source_type, content).
+            fields: Union of fields to extract across all sources.
+
+        Returns:
+            Dictionary with extracted fields.
+        """
+        # Drop empty sources
+        sources = [(source_type, content) for source_type, content in sources if content]
+
+        if not sources or not fields:
+            return {}
+
+        if len(sources) == 1:
+            source_type, content = sources[0]
+            return self.extract_structured_data(company_name, source_type, content, fields)
+
+        # Give each source an equal share of the content budget so no source is truncated away
+        section_budget = MAX_CONTENT_LENGTH // len(sources)
+        sections = []
+        for source_type, content in sources:
+            content = self._truncate_content(content, section_budget)
+            sections.append(f"=== {source_type} ===\n{content}")
+
+        combined_source_type = f"combined ({', '.join(source_type for source_type, _ in sources)})"
+        logger.info(f"Extracting {len(fields)} fields for {company_name} from {len(sources)} sources in one call")
+
+        return self.extract_structured_data(company_name, combined_source_type, "\n\n".join(sections), fields)
+
+    def extract_structured_data_rows(self, source_type: str, rows: List[Tuple[str, str]], fields: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract the same fields for several companies in a single LLM call.
+
+        Each row is sent under its index and Gemini is asked for a JSON array of
+        objects keyed by that index. Rows already in the cache are not sent.
+
+        Args:
+            source_type: Type of source shared by all rows (e.g., "LinkedIn").
+            rows: List of tuples (company_name, content).
+            fields: List of fields to extract for every row.
+
+        Returns:
+            Dictionary mapping company name to extracted data. Rows the response
+            did not cover are left out so the caller can fall back to single-row extraction.
+        """
+        # Serve cached rows first
+        results, pending = self._get_cached_rows(source_type, rows, fields)
+
+        if not pending or not fields:
+            return results
+
+        try:
+            logger.info(f"Extracting {len(fields)} fields for {len(pending)} companies from {source_type} in one call")
+            response = self._generate(self.flash_model, self._build_rows_extraction_prompt(source_type, pending, fields))
+
+            for company_name, cache_key, filtered_data in self._parse_rows_extraction(source_type, response, pending, fields):
+                get_llm_cache().set(cache_key, dict(filtered_data))
+                results[company_name] = filtered_data
+
+            logger.info(f"Batch extraction covered {len(results)} of {len(rows)} companies from {source_type}")
+
+        except Exception as e:
+            logger.error(f"Error in batch extraction from {source_type}: {e}")
+
+        return results
+
+    async def aextract_structured_data_rows(self, source_type: str, rows: List[Tuple[str, str]], fields: List[str],
+                                            semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Asynchronous version of extract_structured_data_rows, retrying transient errors with backoff.
+
+        Args:
+            source_type: Type of source shared by all rows (e.g., "LinkedIn").
+            rows: List of tuples (company_name, content).
+            fields: List of fields to extract for every row.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
 
         Returns:
-            List of dictionaries with analyzed startup data.
+            Dictionary mapping company name to extracted data. Rows the response
+            did not cover are left out so the caller can fall back to single-row extraction.
         """
-        logger.info(f"Analyzing {len(startups_data)} startups in parallel")
+        results, pending = await asyncio.to_thread(self._get_cached_rows, source_type, rows, fields)
 
-        batch_processor = GeminiAPIBatchProcessor(max_workers=30)
+        if not pending or not fields:
+            return results
 
-        # Define the processing function
-        def process_startup(api_client, startup_data, fields):
-            return api_client.analyze_startup(startup_data, fields)
+        try:
+            logger.info(f"Extracting {len(fields)} fields for {len(pending)} companies from {source_type} in one call")
+            response = await self._agenerate(self.flash_model, self._build_rows_extraction_prompt(source_type, pending, fields),
+                                             semaphore)
 
-        # Process the batch
-        results = batch_processor.process_batch(
-            self, startups_data, process_startup, fields
-        )
+            for company_name, cache_key, filtered_data in self._parse_rows_extraction(source_type, response, pending, fields):
+                await asyncio.to_thread(get_llm_cache().set, cache_key, dict(filtered_data))
+                results[company_name] = filtered_data
+
+            logger.info(f"Batch extraction covered {len(results)} of {len(rows)} companies from {source_type}")
+
+        except Exception as e:
+            logger.error(f"Error in batch extraction from {source_type}: {e}")
 
-        logger.info(f"Successfully analyzed {len(results)} startups")
         return results
 
-    def validate_startups_batch(self, startups: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    def _get_cached_rows(self, source_type: str, rows: List[Tuple[str, str]],
+                         fields: List[str]) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]:
         """
-        Validate multiple startups in parallel.
+        Split extraction rows into cached results and rows still to extract.
 
         Args:
-            startups: List of startup dictionaries to validate.
-            query: The original search query.
+            source_type: Type of source shared by all rows.
+            rows: List of tuples (company_name, content).
+            fields: List of fields to extract for every row.
 
         Returns:
-            List of validated startup dictionaries.
+            Tuple of (company name -> cached data, list of (company_name, content, cache_key) to extract).
         """
-        logger.info(f"Validating {len(startups)} startups in parallel")
-
-        # Split into smaller batches for better performance with Gemini
-        batch_size = 5  # Gemini works better with smaller batches
-        batches = [startups[i:i+batch_size] for i in range(0, len(startups), batch_size)]
-
-        batch_processor = GeminiAPIBatchProcessor(max_workers=30)
-
-        # Define the processing function
-        def process_batch(api_client, batch, query):
-            # Convert batch to JSON
-            batch_json = json.dumps(batch, indent=2)
-
-            # Create prompt
-            prompt = f"""
-            You are a startup intelligence analyst specializing in data validation and enrichment.
-            I have a dataset of startups related to the search query: "{query}".
-
-            TASK:
-            Analyze the following startup data to:
-            1. VERIFY each startup is RELEVANT to the query
-            2. CORRECT any anomalies, inconsistencies, or inaccuracies
-            3. FILL IN missing information where possible
-            4. STANDARDIZE formatting across all entries
-
-            STARTUP RELEVANCE CRITERIA:
-            - The startup's core business, products, or services must directly relate to query
-            - The startup should be operating in the industry or solving problems mentioned in the query
-            - The startup should be targeting the market or audience implied by the query
-
-            DATA VALIDATION GUIDELINES:
-            - Company Name: Ensure correct spelling and proper capitalization
-            - Website: Verify it's the official company website (not social media or third-party sites)
-            - LinkedIn: Ensure it's the correct company LinkedIn page
-            - Location: Standardize format (City, State/Region, Country)
-            - Founded Year: Verify accuracy and use 4-digit year format
-            - Industry: Use specific, standardized industry categories
-            - Company Size: Standardize format (e.g., "11-50 employees")
-            - Funding: Include latest round, amount, and date if available
-            - Product Description: Ensure it accurately describes what the company does
-
-            DATA TO VALIDATE:
-            {batch_json}
-
-            Return ONLY the corrected data in valid JSON format, with the same structure as the above json.
-            If a startup is not relevant to the query, remove it completely from the results.
-            """
-
-            # Configure search grounding for Gemini 2.0 Flash
-            safety_settings = [
-                {
-                    "category": "HARM_CATEGORY_HARASSMENT",
-                    "threshold": "BLOCK_NONE"
-                },
-                {
-                    "category": "HARM_CATEGORY_HATE_SPEECH",
-                    "threshold": "BLOCK_NONE"
-                },
-                {
-                    "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "threshold": "BLOCK_NONE"
-                },
-                {
-                    "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                    "threshold": "BLOCK_NONE"
-                }
-            ]
+        results = {}
+        pending = []
+        for company_name, content in rows:
+            cache_key = self._get_extraction_cache_key(company_name, source_type, content, fields)
+            cached_data = get_llm_cache().get(cache_key)
+            if cached_data is not None:
+                results[company_name] = dict(cached_data)
+            else:
+                pending.append((company_name, content, cache_key))
+        return results, pending
 
-            generation_config = {
-                "temperature": 0.2,
-                "top_p": 0.95,
-                "top_k": 64,
-                "max_output_tokens": 8192,
-            }
+    def _build_rows_extraction_prompt(self, source_type: str, pending: List[Tuple[str, str, str]], fields: List[str]) -> str:
+        """
+        Build the prompt extracting the same fields for several companies.
 
-            # Use Gemini 2.0 Flash with search grounding for validation
-            model = genai.GenerativeModel(
-                model_name='gemini-2.0-flash',
-                generation_config=generation_config,
-                safety_settings=safety_settings,
-                tools=[{"web_search": {}}]  # Enable search grounding
-            )
+        Args:
+            source_type: Type of source shared by all rows.
+            pending: List of tuples (company_name, content, cache_key) to extract.
+            fields: List of fields to extract for every row.
 
-            # Get response from Gemini 2.0 Flash with search grounding
-            response = model.generate_content(prompt)
+        Returns:
+            Prompt string.
+        """
+        # Build one prompt with the field list once and every row's content under its index
+        sections = []
+        for index, (company_name, content, _) in enumerate(pending):
+            content = self._truncate_content(content, MAX_CONTENT_LENGTH)
+            sections.append(f"=== [{index}] {company_name} ===\n{content}")
 
-            # Extract JSON from response
-            try:
-                # Find JSON in the response
-                response_text = response.text
-                if "```json" in response_text:
-                    json_content = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    json_content = response_text.split("```")[1].strip()
-                else:
-                    json_content = response_text.strip()
-
-                # Parse the JSON
-                return json.loads(json_content)
-            except Exception as e:
-                logger.error(f"Error parsing response: {e}")
-                return batch  # Return original batch on error
+        fields_str = ", ".join(fields)
+        return f"""
+        You are a startup intelligence data extractor specializing in comprehensive company analysis.
+        Below is {source_type} content for {len(pending)} companies, each under a numbered header.
+        For each company, extract the following information from its own content only: {fields_str}.
 
-        # Process all batches
-        results = []
-        for i, batch in enumerate(batches):
-            logger.info(f"Processing batch {i+1}/{len(batches)} with {len(batch)} startups")
-            batch_results = batch_processor.process_batch(
-                self, [batch], process_batch, query
-            )
-            # Flatten results
-            for batch_result in batch_results:
-                if isinstance(batch_result, list):
-                    results.extend(batch_result)
-                else:
-                    results.append(batch_result)
+        {chr(10).join(sections)}
 
-        logger.info(f"Successfully validated {len(results)} startups")
-        return results
+        If information for a field is not available, respond with null.
+        Be precise and extract only factual information present in the content.
 
-    def validate_startups_chunk(self, chunk_text: str, query: str, startup_indices: List[int]) -> Dict[str, Any]:
+        Format your response as a JSON array with one object per company.
+        Each object must have an "index" key with the company's number, plus the requested fields as keys.
         """
-        Validate a chunk of startup data using Gemini 2.0 Flash.
 
-        This method is designed to work with the ContentProcessor's chunking functionality.
+    def _parse_rows_extraction(self, source_type: str, response, pending: List[Tuple[str, str, str]],
+                               fields: List[str]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Parse a multi-company extraction response.
 
         Args:
-            chunk_text: The text chunk containing startup data.
-            query: The original search query.
-            startup_indices: List of indices of startups in the original list.
+            source_type: Type of source shared by all rows.
+            response: Model response.
+            pending: List of tuples (company_name, content, cache_key) that were sent.
+            fields: List of fields extracted for every row.
 
         Returns:
-            Dictionary with validated startup data and metadata.
+            List of tuples (company_name, cache_key, extracted data) for the rows the response covered.
         """
-        logger.info(f"Validating chunk with {len(startup_indices)} startups")
+        if not response or not response.text:
+            logger.error(f"Empty response from Gemini for batch {source_type} extraction")
+            return []
 
-        # Create prompt for Gemini
-        prompt = f"""
-        You are a startup intelligence analyst specializing in data validation and enrichment.
-        I have a dataset of startups related to the search query: "{query}".
+        is_valid, parsed_data, error_message = self._validate_response(response.text)
 
-        TASK:
-        Analyze the following startup data to:
-        1. VERIFY each startup is RELEVANT to the query
-        2. CORRECT any anomalies, inconsistencies, or inaccuracies
-        3. FILL IN missing information where possible
-        4. STANDARDIZE formatting across all entries
+        if not is_valid or not isinstance(parsed_data, list):
+            logger.error(f"Invalid batch response from Gemini for {source_type}: {error_message or 'expected a JSON array'}")
+            return []
 
-        STARTUP RELEVANCE CRITERIA:
-        - The startup's core business, products, or services must directly relate to query
-        - The startup should be operating in the industry or solving problems mentioned in the query
-        - The startup should be targeting the market or audience implied by the query
+        extracted = []
+        for item in parsed_data:
+            try:
+                index = int(item.pop("index"))
+            except (KeyError, TypeError, ValueError):
+                continue
 
-        DATA VALIDATION GUIDELINES:
-        - Company Name: Ensure correct spelling and proper capitalization
-        - Website: Verify it's the official company website (not social media or third-party sites)
-        - LinkedIn: Ensure it's the correct company LinkedIn page
-        - Location: Standardize format (City, State/Region, Country)
-        - Founded Year: Verify accuracy and use 4-digit year format
-        - Industry: Use specific, standardized industry categories
-        - Company Size: Standardize format (e.g., "11-50 employees")
-        - Funding: Include latest round, amount, and date if available
-        - Product Description: Ensure it accurately describes what the company does
+            if not 0 <= index < len(pending):
+                continue
 
-        DATA TO VALIDATE:
-        {chunk_text}
+            company_name, _, cache_key = pending[index]
+            _, cleaned_data, _ = self._validate_fields(item, fields)
+            extracted.append((company_name, cache_key, self._filter_empty_values(cleaned_data)))
 
-        Return ONLY the corrected data in valid JSON format, with the same structure as the above json.
-        If a startup is not relevant to the query, remove it completely from the results.
+        return extracted
+
+    def submit_extraction_batch(self, source_type: str, rows: List[Tuple[str, str]], fields: List[str]) -> Optional[str]:
         """
+        Submit extraction requests as a Gemini Batch Mode job.
 
-        # Configure search grounding for Gemini 2.0 Flash
-        safety_settings = [
-            {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_NONE"
-            },
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_NONE"
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_NONE"
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                "threshold": "BLOCK_NONE"
-            }
-        ]
+        Batch jobs complete asynchronously within 24 hours at half the price of
+        interactive calls, which suits bulk enrichment that isn't needed right away.
 
-        generation_config = {
-            "temperature": 0.2,
-            "top_p": 0.95,
-            "top_k": 64,
-            "max_output_tokens": 8192,
-        }
+        Args:
+            source_type: Type of source shared by all rows (e.g., "LinkedIn").
+            rows: List of tuples (company_name, content).
+            fields: List of fields to extract for every row.
 
-        # Use Gemini 2.0 Flash with search grounding for validation
-        model = genai.GenerativeModel(
-            model_name='gemini-2.0-flash',
-            generation_config=generation_config,
-            safety_settings=safety_settings,
-            tools=[{"web_search": {}}]  # Enable search grounding
-        )
+        Returns:
+            Batch job name (e.g. "batches/123") to collect results with, or None if submission failed.
+        """
+        if not rows or not fields:
+            return None
 
         try:
-            # Get response from Gemini 2.0 Flash with search grounding
-            response = model.generate_content(prompt)
-
-            # Extract JSON from response
-            response_text = response.text
-            if "```json" in response_text:
-                json_content = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_content = response_text.split("```")[1].strip()
-            else:
-                json_content = response_text.strip()
-
-            # Parse the JSON
-            validated_data = json.loads(json_content)
+            # Write one request per line, keyed by company name, using the same prompt as interactive extraction
+            with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False, encoding="utf-8") as f:
+                requests_file = f.name
+                for company_name, content in rows:
+                    prompt = self._build_extraction_prompt(
+                        company_name, source_type, self._truncate_content(content, MAX_CONTENT_LENGTH), fields
+                    )
+                    f.write(_dumps_json({"key": company_name, "request": {"contents": [{"parts": [{"text": prompt}]}]}}) + "\n")
+
+            display_name = f"{source_type.lower()}-extraction-{int(time.time())}"
+            uploaded_file = genai.upload_file(requests_file, mime_type="application/jsonl", display_name=display_name)
+
+            response = requests.post(
+                f"{BATCH_API_BASE_URL}/v1beta/{self.flash_model.model_name}:batchGenerateContent",
+                headers={"x-goog-api-key": self.api_key},
+                json={"batch": {"display_name": display_name, "input_config": {"file_name": uploaded_file.name}}},
+                timeout=60
+            )
+            response.raise_for_status()
+            job_name = response.json().get("name")
 
-            # Return the validated data with metadata
-            return {
-                "validated_data": validated_data,
-                "startup_indices": startup_indices,
-                "success": True
-            }
+            logger.info(f"Submitted batch job {job_name} extracting {source_type} data for {len(rows)} companies")
+            return job_name
 
         except Exception as e:
-            logger.error(f"Error validating chunk: {e}")
-            # Return error information
-            return {
-                "error": str(e),
-                "startup_indices": startup_indices,
-                "success": False
-            }
+            logger.error(f"Error submitting {source_type} extraction batch: {e}")
+            return None
+        finally:
+            if "requests_file" in locals() and os.path.exists(requests_file):
+                os.remove(requests_file)
 
-    def combine_validated_chunks(self, validated_chunks: List[Dict[str, Any]], original_startups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def collect_extraction_batch(self, job_name: str, fields: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
         """
-        Combine validated chunks into a single result.
+        Collect the results of a batch job submitted with submit_extraction_batch.
 
         Args:
-            validated_chunks: List of dictionaries with validated startup data and metadata.
-            original_startups: The original list of startup dictionaries.
+            job_name: Batch job name returned at submission.
+            fields: List of fields that were requested.
 
         Returns:
-            List of validated startup dictionaries.
+            Dictionary mapping company name to extracted data once the job has finished
+            (empty if it failed), or None while it is still running or its status couldn't be fetched.
         """
-        logger.info(f"Combining {len(validated_chunks)} validated chunks")
+        headers = {"x-goog-api-key": self.api_key}
 
-        # Create a copy of the original startups to update
-        result_startups = original_startups.copy()
+        try:
+            response = requests.get(f"{BATCH_API_BASE_URL}/v1beta/{job_name}", headers=headers, timeout=60)
+            response.raise_for_status()
+            job = response.json()
+
+            if not job.get("done"):
+                logger.info(f"Batch job {job_name} is still running ({job.get('metadata', {}).get('state', 'unknown state')})")
+                return None
+
+            responses_file = job.get("response", {}).get("responsesFile")
+            if "error" in job or not responses_file:
+                logger.error(f"Batch job {job_name} did not succeed: {job.get('error', 'no responses file')}")
+                return {}
+
+            # Download the results, one JSON response per line
+            download = requests.get(
+                f"{BATCH_API_BASE_URL}/download/v1beta/{responses_file}:download",
+                params={"alt": "media"}, headers=headers, timeout=300
+            )
+            download.raise_for_status()
 
-        # Process each validated chunk
-        for chunk in validated_chunks:
-            # Skip failed chunks
-            if not chunk.get("success", False):
-                logger.warning(f"Skipping failed chunk: {chunk.get('error', 'Unknown error')}")
-                continue
+            results = {}
+            for line in download.text.splitlines():
+                if not line.strip():
+                    continue
 
-            # Get the validated data and startup indices
-            validated_data = chunk.get("validated_data", [])
-            startup_indices = chunk.get("startup_indices", [])
+                item = _loads_json(line)
+                candidates = item.get("response", {}).get("candidates") or [{}]
+                text = "".join(part.get("text", "") for part in candidates[0].get("content", {}).get("parts", []))
 
-            # If validated_data is a list, process each item
-            if isinstance(validated_data, list):
-                # Match validated startups with original startups by index
-                for i, validated_startup in enumerate(validated_data):
-                    if i < len(startup_indices):
-                        original_index = startup_indices[i]
-                        if original_index < len(result_startups):
-                            # Update the startup with validated data
-                            result_startups[original_index] = validated_startup
-                    else:
-                        # If there are more validated startups than indices, append them
-                        result_startups.append(validated_startup)
+                is_valid, parsed_data, error_message = self._validate_response(text)
+                if not is_valid or not isinstance(parsed_data, dict):
+                    logger.warning(f"Invalid batch response for {item.get('key')}: {error_message}")
+                    results[item.get("key")] = {}
+                    continue
 
-            # If validated_data is a dictionary, process it as a single startup
-            elif isinstance(validated_data, dict):
-                # Update the first startup in the indices
-                if startup_indices and startup_indices[0] < len(result_startups):
-                    result_startups[startup_indices[0]] = validated_data
+                _, cleaned_data, _ = self._validate_fields(parsed_data, fields)
+                results[item.get("key")] = self._filter_empty_values(cleaned_data)
 
-        # Filter out any None values or empty dictionaries
-        result_startups = [s for s in result_startups if s and isinstance(s, dict)]
+            logger.info(f"Collected {len(results)} results from batch job {job_name}")
+            return results
 
-        logger.info(f"Combined {len(result_startups)} validated startups")
-        return result_startups
+        except Exception as e:
+            logger.error(f"Error collecting batch job {job_name}: {e}")
+            return None
 
-    def extract_structured_data_batch(self, items: List[Tuple[str, str, str, List[str]]]) -> List[Dict[str, Any]]:
+    def _build_extraction_prompt(self, company_name: str, source_type: str, content: str, fields: List[str]) -> str:
         """
-        Extract structured data from multiple sources in parallel.
+        Build the structured data extraction prompt.
 
         Args:
-            items: List of tuples (company_name, source_type, content, fields).
+            company_name: Name of the company.
+            source_type: Type of source (e.g., "LinkedIn", "Website", "Crunchbase").
+            content: Text content to analyze, already within the length budget.
+            fields: List of fields to extract.
 
         Returns:
-            List of dictionaries with extracted data.
+            Prompt string.
         """
-        logger.info(f"Extracting structured data from {len(items)} sources in parallel")
-
-        batch_processor = GeminiAPIBatchProcessor(max_workers=30)
-
-        # Define the processing function
-        def process_item(api_client, item):
-            company_name, source_type, content, fields = item
-            return {
-                "company_name": company_name,
-                "source_type": source_type,
-                "data": api_client.extract_structured_data(company_name, source_type, content, fields)
-            }
-
-        # Process the batch
-        results = batch_processor.process_batch(
-            self, items, process_item
-        )
-
-        logger.info(f"Successfully extracted data from {len(results)} sources")
-        return results
+        return "".join((
+            _EXTRACTION_PROMPT_HEAD, company_name,
+            _EXTRACTION_PROMPT_SOURCE, source_type,
+            _EXTRACTION_PROMPT_FIELDS, ", ".join(fields),
+            _EXTRACTION_PROMPT_CONTENT, content,
+            _EXTRACTION_PROMPT_TAIL,
+        ))
 
     def extract_structured_data(self, company_name: str, source_type: str, content: str, fields: List[str]) -> Dict[str, Any]:
         """
@@ -875,71 +2424,224 @@ class GeminiAPIClient:
         Returns:
             Dictionary with extracted fields.
         """
-        # Truncate content if it's too long (Gemini has token limits)
-        if len(content) > MAX_CONTENT_LENGTH:
-            logger.info(f"Truncating content for {company_name} from {len(content)} to {MAX_CONTENT_LENGTH} characters")
-            content = content[:MAX_CONTENT_LENGTH] + "..."
+        # Check the in-run memo for an extraction of the same content covering these fields
+        requested_fields = frozenset(fields)
+        memo_key = self._get_extraction_memo_key(company_name, content)
+        memo_data = self._get_memoized_extraction(memo_key, requested_fields)
+        if memo_data is not None:
+            logger.info(f"Reusing extraction of the same content for {company_name} from {source_type}")
+            return memo_data
+
+        # Identical extraction requests recur across reruns, so they are cached persistently
+        cache_key = self._get_extraction_cache_key(company_name, source_type, content, fields)
+
+        # Check the cache while holding the key's lock so concurrent requests for the same content wait for one API call
+        with get_llm_cache().key_lock(cache_key):
+            return self._extract_structured_data_uncached(company_name, source_type, content, fields,
+                                                          cache_key, memo_key, requested_fields)
+
+    @staticmethod
+    def _get_extraction_memo_key(company_name: str, content: str) -> Tuple[str, str]:
+        """
+        Build the in-run memo key for an extraction.
 
-        # Create a more detailed prompt for Gemini with specific instructions for each field
-        fields_str = ", ".join(fields)
-        prompt = f"""
-        You are a startup intelligence data extractor specializing in comprehensive company analysis.
-        Extract the following information about {company_name} from this {source_type} content: {fields_str}.
+        Args:
+            company_name: Name of the company.
+            content: Content to analyze.
 
-        Content:
-        {content}
+        Returns:
+            Tuple of (company name, content digest).
+        """
+        return company_name, hashlib.blake2b(content.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
 
-        For each field, provide the most accurate and detailed information available in the content.
-        If information for a field is not available, respond with null.
+    def _get_memoized_extraction(self, memo_key: Tuple[str, str], requested_fields: frozenset) -> Optional[Dict[str, Any]]:
+        """
+        Look up an earlier extraction of the same content that covers the requested fields.
 
-        Specific guidelines for extraction:
+        Args:
+            memo_key: In-run memo key for the content.
+            requested_fields: Set of requested fields.
 
-        - Company Description: Extract a comprehensive description of what the company does, its mission, and value proposition.
+        Returns:
+            The memoized data restricted to the requested fields, or None if there is none.
+        """
+        with self._extraction_memo_lock:
+            memo_entries = self._extraction_memo.get(memo_key)
+            if memo_entries is None:
+                return None
+            self._extraction_memo.move_to_end(memo_key)
+
+            for memo_fields, memo_data in memo_entries:
+                if requested_fields <= memo_fields:
+                    return {k: v for k, v in memo_data.items() if k in requested_fields}
+        return None
+
+    def _remember_extraction(self, memo_key: Tuple[str, str], requested_fields: frozenset, data: Dict[str, Any]):
+        """
+        Add an extraction to the in-run memo.
 
-        - Founders: List all founders with their full names. Format as a comma-separated list.
+        Args:
+            memo_key: In-run memo key for the content.
+            requested_fields: Set of fields that were requested.
+            data: Extracted data.
+        """
+        with self._extraction_memo_lock:
+            self._extraction_memo.setdefault(memo_key, []).append((requested_fields, dict(data)))
+            self._extraction_memo.move_to_end(memo_key)
+            while len(self._extraction_memo) > EXTRACTION_MEMO_SIZE:
+                self._extraction_memo.popitem(last=False)
 
-        - Founder LinkedIn Profiles: Extract LinkedIn profile URLs for founders if available. Format as a JSON array.
+    def _prepare_extraction_content(self, company_name: str, content: str) -> str:
+        """
+        Truncate extraction content to the budget, tracking how often that happens.
 
-        - CEO/Leadership: Extract information about the CEO and key leadership team members with their roles.
+        Args:
+            company_name: Name of the company.
+            content: Content to analyze.
 
-        - Location: Extract the company's headquarters location. Include city, region/state, and country if available.
+        Returns:
+            Content that fits in MAX_CONTENT_LENGTH.
+        """
+        # Truncate content if it's too long (Gemini has token limits)
+        self.truncation_stats["calls"] += 1
+        if len(content) > MAX_CONTENT_LENGTH:
+            self.truncation_stats["truncated"] += 1
+            truncation_rate = self.truncation_stats["truncated"] / self.truncation_stats["calls"]
+            logger.info(f"Truncating content for {company_name} from {len(content)} to {MAX_CONTENT_LENGTH} characters "
+                        f"({truncation_rate:.0%} of extractions truncated so far)")
+            content = self._truncate_content(content, MAX_CONTENT_LENGTH)
+        return content
+
+    async def aextract_structured_data(self, company_name: str, source_type: str, content: str, fields: List[str],
+                                       semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Asynchronous version of extract_structured_data.
 
-        - Founded Year: Extract the year the company was founded as a 4-digit number.
+        Concurrent requests for the same content share one in-flight API call.
 
-        - Industry: Extract the primary industry and any sub-industries the company operates in.
+        Args:
+            company_name: Name of the company.
+            source_type: Type of source (e.g., "LinkedIn", "Website", "Crunchbase").
+            content: HTML or text content to analyze.
+            fields: List of fields to extract.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
 
-        - Company Size: Extract the number of employees, preferably as a range (e.g., "11-50 employees").
+        Returns:
+            Dictionary with extracted fields.
+        """
+        requested_fields = frozenset(fields)
+        memo_key = self._get_extraction_memo_key(company_name, content)
+        memo_data = self._get_memoized_extraction(memo_key, requested_fields)
+        if memo_data is not None:
+            logger.info(f"Reusing extraction of the same content for {company_name} from {source_type}")
+            return memo_data
+
+        cache_key = self._get_extraction_cache_key(company_name, source_type, content, fields)
+
+        # Successful extractions are cached by _aextract_structured_data_uncached itself,
+        # so fallback and error results are never stored
+        return dict(await self._amemoized(
+            cache_key,
+            lambda: self._aextract_structured_data_uncached(company_name, source_type, content, fields,
+                                                            cache_key, memo_key, requested_fields, semaphore),
+            lambda data: False
+        ))
+
+    async def _aextract_structured_data_uncached(self, company_name: str, source_type: str, content: str,
+                                                 fields: List[str], cache_key: str, memo_key: Tuple[str, str],
+                                                 requested_fields: frozenset,
+                                                 semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Asynchronous version of _extract_structured_data_uncached, for a cache miss.
 
-        - Funding: Extract detailed funding information including total amount raised, latest round, and date if available.
+        Args:
+            company_name: Name of the company.
+            source_type: Type of source.
+            content: HTML or text content to analyze.
+            fields: List of fields to extract.
+            cache_key: Persistent cache key for the request.
+            memo_key: In-run memo key for the content.
+            requested_fields: Set of requested fields.
+            semaphore: Optional semaphore bounding the number of Gemini calls in flight.
 
-        - Technology Stack: Extract technologies, programming languages, frameworks, or platforms used by the company.
+        Returns:
+            Dictionary with extracted fields.
+        """
+        content = self._prepare_extraction_content(company_name, content)
+        prompt = self._build_extraction_prompt(company_name, source_type, content, fields)
 
-        - Competitors: Extract names of direct competitors if mentioned. Format as a comma-separated list.
+        try:
+            response = await self._agenerate(self.flash_model, prompt, semaphore)
 
-        - Market Focus: Extract the target market, customer segments, or geographical focus areas.
+            if not response or not response.text:
+                logger.error(f"Empty response from Gemini for {company_name}")
+                return {"error": "Empty response from API"}
 
-        - Social Media Links: Extract all social media profile URLs. Format as a JSON object with platform names as keys.
+            # Validate and parse the response
+            is_valid, parsed_data, error_message = self._validate_response(response.text)
 
-        - Latest News: Extract recent news, announcements, or milestones about the company.
+            if not is_valid or not parsed_data:
+                logger.error(f"Invalid response from Gemini for {company_name}: {error_message}")
+                # Try a simpler prompt as fallback
+                return await asyncio.to_thread(self._extract_with_fallback, company_name, source_type, content, fields)
 
-        - Investors: Extract names of investors, VCs, or investment firms that have funded the company.
+            # Validate the fields
+            _, cleaned_data, warnings = self._validate_fields(parsed_data, fields)
 
-        - Growth Metrics: Extract any metrics related to company growth, such as user numbers, revenue growth, etc.
+            for warning in warnings:
+                logger.warning(f"Validation warning for {company_name}: {warning}")
 
-        - Products/Services: Extract detailed information about the company's products or services.
+            # Filter out null values and standardize "not available" values
+            filtered_data = self._filter_empty_values(cleaned_data)
 
-        - Team: Extract information about the team size, key team members, and their roles.
+            logger.info(f"Successfully extracted {len(filtered_data)} fields for {company_name} from {source_type}")
 
-        - Contact: Extract contact information including email, phone, or contact form URL.
+            # Cache a copy so callers can't mutate the cached result
+            self._remember_response(cache_key, dict(filtered_data))
+            await asyncio.to_thread(get_llm_cache().set, cache_key, dict(filtered_data))
+            self._remember_extraction(memo_key, requested_fields, filtered_data)
+            return filtered_data
 
-        Format your response as a JSON object with the requested fields as keys.
-        Be precise and extract only factual information present in the content.
+        except Exception as e:
+            logger.error(f"Error extracting data from {source_type} for {company_name}: {e}")
+            logger.debug(f"Error traceback: {traceback.format_exc()}")
+
+            # Try fallback extraction
+            return await asyncio.to_thread(self._extract_with_fallback, company_name, source_type, content, fields)
+
+    def _extract_structured_data_uncached(self, company_name: str, source_type: str, content: str, fields: List[str],
+                                          cache_key: str, memo_key: Tuple[str, str],
+                                          requested_fields: frozenset) -> Dict[str, Any]:
+        """
+        Extract structured data on a memo miss, serving it from the persistent cache when possible.
+
+        Args:
+            company_name: Name of the company.
+            source_type: Type of source.
+            content: HTML or text content to analyze.
+            fields: List of fields to extract.
+            cache_key: Persistent cache key for the request.
+            memo_key: In-run memo key for the content.
+            requested_fields: Set of requested fields.
+
+        Returns:
+            Dictionary with extracted fields.
         """
+        cached_data = get_llm_cache().get(cache_key)
+        if cached_data is not None:
+            logger.info(f"Using cached extraction for {company_name} from {source_type}")
+            self._remember_extraction(memo_key, requested_fields, cached_data)
+            return dict(cached_data)
+
+        content = self._prepare_extraction_content(company_name, content)
+
+        # Create a more detailed prompt for Gemini with specific instructions for each field
+        prompt = self._build_extraction_prompt(company_name, source_type, content, fields)
 
         try:
             # Use the flash model for simpler extraction tasks
             logger.debug(f"Sending extraction request to Gemini for {company_name} from {source_type}")
-            response = self.flash_model.generate_content(prompt)
+            response = self._generate(self.flash_model, prompt)
 
             if not response or not response.text:
                 logger.error(f"Empty response from Gemini for {company_name}")
@@ -961,22 +2663,13 @@ class GeminiAPIClient:
                     logger.warning(f"Validation warning for {company_name}: {warning}")
 
             # Filter out null values and standardize "not available" values
-            filtered_data = {}
-            for k, v in cleaned_data.items():
-                if v is None or v == "null" or v == "Not available" or v == "":
-                    continue
-
-                # For lists, filter out empty items
-                if isinstance(v, list) and not any(item for item in v if item):
-                    continue
-
-                # For dicts, filter out empty dicts
-                if isinstance(v, dict) and not v:
-                    continue
-
-                filtered_data[k] = v
+            filtered_data = self._filter_empty_values(cleaned_data)
 
             logger.info(f"Successfully extracted {len(filtered_data)} fields for {company_name} from {source_type}")
+
+            # Cache a copy so callers can't mutate the cached result
+            get_llm_cache().set(cache_key, dict(filtered_data))
+            self._remember_extraction(memo_key, requested_fields, filtered_data)
             return filtered_data
 
         except Exception as e:
@@ -1018,7 +2711,7 @@ class GeminiAPIClient:
             """
 
             # Try with the flash model again
-            response = self.flash_model.generate_content(simple_prompt)
+            response = self._generate(self.flash_model, simple_prompt)
 
             if not response or not response.text:
                 logger.error(f"Empty response from fallback extraction for {company_name}")
@@ -1033,7 +2726,8 @@ class GeminiAPIClient:
                 return {"Company Name": company_name, "error": error_message}
 
             # Filter out null values
-            filtered_data = {k: v for k, v in parsed_data.items() if v is not None and v != "null" and v != "Not available" and v != ""}
+            filtered_data = {k: v for k, v in parsed_data.items()
+                             if isinstance(v, (list, dict)) or v not in _EMPTY_VALUES}
 
             if not filtered_data and "Company Name" not in filtered_data:
                 filtered_data["Company Name"] = company_name
@@ -1044,3 +2738,26 @@ class GeminiAPIClient:
         except Exception as e:
             logger.error(f"Fallback extraction failed for {company_name}: {e}")
             return {"Company Name": company_name, "error": str(e)}
+
+
+# Shared client for callers that don't pass one, created on first use
+_default_client: Optional[GeminiAPIClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> GeminiAPIClient:
+    """
+    Get the process-wide GeminiAPIClient, creating it on first use.
+
+    Sharing one client keeps its model handles, extraction memo and truncation
+    stats across every extraction call instead of rebuilding them per call.
+
+    Returns:
+        The shared GeminiAPIClient instance.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = GeminiAPIClient()
+    return _default_client
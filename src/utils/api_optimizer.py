@@ -7,7 +7,9 @@ including batching, rate limiting, and retry logic.
 
 import time
 import random
+import asyncio
 import logging
+import threading
 from typing import List, Dict, Any, Callable, Optional, Tuple, Union
 from functools import wraps
 
@@ -121,6 +123,76 @@ class RateLimiter:
         self.last_call_time = current_time
         self.call_history.append(current_time)
 
+class TokenBucket:
+    """Token bucket limiting requests and tokens per minute, shared by threads and coroutines."""
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """
+        Initialize the token bucket. It starts full, so a burst up to the limits goes out at once.
+        
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum (estimated) tokens per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = requests_per_minute
+        self.available_tokens = tokens_per_minute
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, estimated_tokens: int) -> float:
+        """
+        Take a request and its tokens from the bucket, going into debt if it is empty.
+        
+        Args:
+            estimated_tokens: Estimated tokens used by the request
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            # Refill for the time elapsed since the last reservation
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.last_refill = now
+            self.available_requests = min(self.requests_per_minute,
+                                          self.available_requests + elapsed * self.requests_per_minute / 60.0)
+            self.available_tokens = min(self.tokens_per_minute,
+                                        self.available_tokens + elapsed * self.tokens_per_minute / 60.0)
+            
+            # Reserve the capacity now; callers that find the bucket in debt wait their turn
+            self.available_requests -= 1
+            self.available_tokens -= min(estimated_tokens, self.tokens_per_minute)
+            
+            return max(0.0,
+                       -self.available_requests * 60.0 / self.requests_per_minute,
+                       -self.available_tokens * 60.0 / self.tokens_per_minute)
+    
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Block until a request of the given size may be sent.
+        
+        Args:
+            estimated_tokens: Estimated tokens used by the request
+        """
+        wait_time = self._reserve(estimated_tokens)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+    
+    async def aacquire(self, estimated_tokens: int = 0):
+        """
+        Wait, without blocking the event loop, until a request of the given size may be sent.
+        
+        Args:
+            estimated_tokens: Estimated tokens used by the request
+        """
+        wait_time = self._reserve(estimated_tokens)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
+
 class CircuitBreaker:
     """Circuit breaker for API calls."""
     
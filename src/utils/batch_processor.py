@@ -16,6 +16,50 @@ from typing import List, Dict, Any, Callable, Optional, Tuple, Set
 logger = logging.getLogger(__name__)
 
 
+# Define transient errors that should be retried
+TRANSIENT_ERROR_MESSAGES = [
+    "rate limit",
+    "timeout",
+    "connection",
+    "network",
+    "503",
+    "500",
+    "502",
+    "504",
+    "too many requests",
+    "temporarily unavailable",
+    "server error",
+    "internal server error",
+    "bad gateway",
+    "gateway timeout",
+    "service unavailable"
+]
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Determine if an error is transient and should be retried.
+
+    Args:
+        error: The exception that occurred.
+
+    Returns:
+        True if the error is transient, False otherwise.
+    """
+    error_str = str(error).lower()
+
+    # Check if the error message contains any of the transient error keywords
+    for transient_msg in TRANSIENT_ERROR_MESSAGES:
+        if transient_msg in error_str:
+            return True
+
+    # Check for specific exception types that are typically transient
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+
+    return False
+
+
 class GeminiAPIBatchProcessor:
     """
     A processor for batch processing Gemini API calls in parallel.
@@ -24,24 +68,8 @@ class GeminiAPIBatchProcessor:
     proper rate limiting, error handling, and retry mechanisms for transient errors.
     """
 
-    # Define transient errors that should be retried
-    TRANSIENT_ERROR_MESSAGES = [
-        "rate limit",
-        "timeout",
-        "connection",
-        "network",
-        "503",
-        "500",
-        "502",
-        "504",
-        "too many requests",
-        "temporarily unavailable",
-        "server error",
-        "internal server error",
-        "bad gateway",
-        "gateway timeout",
-        "service unavailable"
-    ]
+    # Transient error keywords, also exposed on the class
+    TRANSIENT_ERROR_MESSAGES = TRANSIENT_ERROR_MESSAGES
 
     def __init__(self, max_workers: int = 30, request_delay: float = 0.2,
                  max_retries: int = 3, retry_delay: float = 1.0,
@@ -89,18 +117,7 @@ class GeminiAPIBatchProcessor:
         Returns:
             True if the error is transient, False otherwise.
         """
-        error_str = str(error).lower()
-
-        # Check if the error message contains any of the transient error keywords
-        for transient_msg in self.TRANSIENT_ERROR_MESSAGES:
-            if transient_msg in error_str:
-                return True
-
-        # Check for specific exception types that are typically transient
-        if isinstance(error, (ConnectionError, TimeoutError)):
-            return True
-
-        return False
+        return is_transient_error(error)
 
     def _process_with_retry(self, process_func: Callable, api_client: Any,
                            item: Any, *args, **kwargs) -> Any:
@@ -12,6 +12,22 @@ from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
+# Legal suffixes removed from the end of company names, in the order they are stripped
+_COMPANY_SUFFIX_RES = tuple(
+    re.compile(rf"\s+{re.escape(suffix)}\.?$", re.IGNORECASE)
+    for suffix in (
+        "Inc", "LLC", "Ltd", "Limited", "Corp", "Corporation",
+        "Co", "Company", "GmbH", "S.A.", "B.V.", "AG"
+    )
+)
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_URL_RE = re.compile(r"^https?://[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}(/.*)?$")
+_AND_SEPARATOR_RE = re.compile(r"\s+and\s+")
+_SYMBOL_SEPARATOR_RE = re.compile(r"\s*[&|/]\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+_TEAM_SIZE_RE = re.compile(r"\b(\d+(?:-\d+)?)\b")
+_HTTP_URL_RE = re.compile(r"https?://[^\s]+")
+
 
 class DataCleaner:
     """
@@ -64,22 +80,14 @@ class DataCleaner:
         Returns:
             Cleaned company name.
         """
-        # Remove common legal suffixes
-        suffixes = [
-            "Inc", "LLC", "Ltd", "Limited", "Corp", "Corporation",
-            "Co", "Company", "GmbH", "S.A.", "B.V.", "AG"
-        ]
-        
         cleaned_name = name.strip()
         
         # Remove trailing periods
         cleaned_name = cleaned_name.rstrip(".")
         
-        # Remove legal suffixes
-        for suffix in suffixes:
-            # Match suffix at the end of the name, possibly with punctuation
-            pattern = rf"\s+{re.escape(suffix)}\.?$"
-            cleaned_name = re.sub(pattern, "", cleaned_name, flags=re.IGNORECASE)
+        # Remove legal suffixes at the end of the name, possibly with punctuation
+        for suffix_re in _COMPANY_SUFFIX_RES:
+            cleaned_name = suffix_re.sub("", cleaned_name)
         
         return cleaned_name.strip()
     
@@ -94,7 +102,7 @@ class DataCleaner:
             Cleaned year as integer, or None if invalid.
         """
         # Extract 4-digit year
-        year_match = re.search(r"\b(19|20)\d{2}\b", str(year_str))
+        year_match = _YEAR_RE.search(str(year_str))
         
         if year_match:
             year = int(year_match.group(0))
@@ -146,8 +154,7 @@ class DataCleaner:
             cleaned_url = "https://" + cleaned_url
         
         # Basic validation
-        url_pattern = r"^https?://[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}(/.*)?$"
-        if re.match(url_pattern, cleaned_url):
+        if _URL_RE.match(cleaned_url):
             return cleaned_url
         
         return None
@@ -175,8 +182,8 @@ class DataCleaner:
         
         # Normalize separators
         # Replace various separators with commas
-        cleaned_names = re.sub(r"\s+and\s+", ", ", cleaned_names)
-        cleaned_names = re.sub(r"\s*[&|/]\s*", ", ", cleaned_names)
+        cleaned_names = _AND_SEPARATOR_RE.sub(", ", cleaned_names)
+        cleaned_names = _SYMBOL_SEPARATOR_RE.sub(", ", cleaned_names)
         
         return cleaned_names
     
@@ -226,8 +233,8 @@ class DataCleaner:
         
         # Normalize separators
         # Replace various separators with commas
-        cleaned_tech = re.sub(r"\s+and\s+", ", ", cleaned_tech)
-        cleaned_tech = re.sub(r"\s*[&|/]\s*", ", ", cleaned_tech)
+        cleaned_tech = _AND_SEPARATOR_RE.sub(", ", cleaned_tech)
+        cleaned_tech = _SYMBOL_SEPARATOR_RE.sub(", ", cleaned_tech)
         
         return cleaned_tech
     
@@ -245,7 +252,7 @@ class DataCleaner:
         cleaned_desc = str(description).strip()
         
         # Remove excessive whitespace
-        cleaned_desc = re.sub(r"\s+", " ", cleaned_desc)
+        cleaned_desc = _WHITESPACE_RE.sub(" ", cleaned_desc)
         
         # Ensure proper capitalization
         if cleaned_desc and not cleaned_desc[0].isupper():
@@ -264,7 +271,7 @@ class DataCleaner:
             Cleaned team size, or None if invalid.
         """
         # Try to extract numeric team size
-        size_match = re.search(r"\b(\d+(?:-\d+)?)\b", str(team_size))
+        size_match = _TEAM_SIZE_RE.search(str(team_size))
         
         if size_match:
             return size_match.group(0)
@@ -298,7 +305,7 @@ class DataCleaner:
         result = {}
         
         # Extract URLs
-        urls = re.findall(r"https?://[^\s]+", str(social_media))
+        urls = _HTTP_URL_RE.findall(str(social_media))
         
         # Categorize by platform
         for url in urls:
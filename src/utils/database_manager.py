@@ -7,6 +7,7 @@ This module provides utilities for storing and retrieving data from a database.
 import os
 import json
 import time
+import hashlib
 import sqlite3
 import logging
 from typing import List, Dict, Any, Optional, Tuple, Union
@@ -62,6 +63,17 @@ class DatabaseManager:
         )
         ''')
         
+        # Create fetched pages table (freshness-checked page cache keyed by URL hash)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pages (
+            url_hash TEXT PRIMARY KEY,
+            url TEXT,
+            status INTEGER,
+            content TEXT,
+            fetched_at REAL
+        )
+        ''')
+        
         # Create queries table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS queries (
@@ -240,6 +252,58 @@ class DatabaseManager:
         finally:
             conn.close()
     
+    def save_page(self, url: str, status: int, content: str):
+        """
+        Save a fetched page to the page cache.
+        
+        Args:
+            url: URL
+            status: HTTP status code of the response
+            content: Raw HTML content
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+            cursor.execute(
+                "INSERT OR REPLACE INTO pages (url_hash, url, status, content, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url_hash, url, status, content, time.time())
+            )
+            conn.commit()
+            logger.debug(f"Saved page: {url}")
+        except Exception as e:
+            logger.error(f"Error saving page {url}: {e}")
+        finally:
+            conn.close()
+    
+    def get_page(self, url: str, max_age_seconds: float) -> Optional[Tuple[int, str]]:
+        """
+        Get a fetched page from the page cache if it is fresh enough.
+        
+        Args:
+            url: URL
+            max_age_seconds: Maximum age of the cached page in seconds
+            
+        Returns:
+            Tuple of (status, raw_content) or None if not cached or stale
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+            cursor.execute(
+                "SELECT status, content FROM pages WHERE url_hash = ? AND fetched_at >= ?",
+                (url_hash, time.time() - max_age_seconds)
+            )
+            return cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Error getting page {url}: {e}")
+            return None
+        finally:
+            conn.close()
+    
     def save_query(self, query: str, expanded_queries: List[str]):
         """
         Save a query and its expansions to the database.
@@ -7,8 +7,10 @@ that supports rotating between multiple API keys and CX IDs to avoid rate limits
 """
 
 import time
+import random
 import logging
 import requests
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional, Any
 from bs4 import BeautifulSoup
 
@@ -49,6 +51,7 @@ class EnhancedGoogleSearchClient:
         # Retry parameters
         self.max_retries = 3
         self.retry_delay = 2.0  # seconds
+        self.max_retry_delay = 60.0  # seconds
 
         logger.info("Enhanced Google Search client initialized with API key rotation")
 
@@ -64,6 +67,36 @@ class EnhancedGoogleSearchClient:
 
         self.last_request_time = time.time()
 
+    def _get_retry_delay(self, retry: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Get how long to wait before the next retry.
+
+        Honors the Retry-After header when the API sends one, otherwise uses
+        exponential backoff with jitter so parallel workers don't retry in lockstep.
+
+        Args:
+            retry: Zero-based index of the attempt that just failed.
+            response: The failed response, if any.
+
+        Returns:
+            Delay in seconds, capped at max_retry_delay.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                # Retry-After is either a number of seconds or an HTTP date
+                if retry_after.strip().isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                return min(max(delay, 0.0), self.max_retry_delay)
+            except Exception as e:
+                logger.debug(f"Could not parse Retry-After header {retry_after!r}: {e}")
+
+        delay = self.retry_delay * (2 ** retry)
+        delay += random.uniform(0, delay)
+        return min(delay, self.max_retry_delay)
+
     def search(self, query: str, num_results: int = 10, max_results: int = None, start_index: int = 0) -> List[Dict[str, str]]:
         """
         Search for information using Google Custom Search with API key rotation.
@@ -122,7 +155,7 @@ class EnhancedGoogleSearchClient:
                             api_key, cx_id = self.key_manager.get_next_key_pair()
                             params["key"] = api_key
                             params["cx"] = cx_id
-                            time.sleep(self.retry_delay * (2 ** retry))  # Exponential backoff
+                            time.sleep(self._get_retry_delay(retry, response))  # Backoff, honoring Retry-After
                             continue
                         else:
                             logger.error(f"Failed after {self.max_retries} retries")
@@ -154,7 +187,7 @@ class EnhancedGoogleSearchClient:
                     # If we have more retries, try again
                     if retry < self.max_retries - 1:
                         logger.info(f"Retrying ({retry+1}/{self.max_retries})...")
-                        time.sleep(self.retry_delay * (2 ** retry))  # Exponential backoff
+                        time.sleep(self._get_retry_delay(retry))  # Exponential backoff with jitter
                     else:
                         logger.error(f"Failed after {self.max_retries} retries")
 
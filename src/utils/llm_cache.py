@@ -0,0 +1,265 @@
+"""
+Persistent cache for LLM responses.
+
+This module stores parsed extraction results, query expansions and startup analyses
+in SQLite so repeated requests for the same content skip the Gemini call across runs.
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact JSON bytes with sorted keys.
+
+    Uses orjson when it is installed; the stdlib fallback produces the same bytes,
+    so cache keys don't depend on which one is available.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # orjson rejects strings with lone surrogates; let the stdlib escape them
+            pass
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Deserialize JSON bytes.
+
+    Args:
+        data: JSON bytes
+
+    Returns:
+        Deserialized value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class LLMCache:
+    """SQLite-backed cache of LLM extraction responses with expiry and per-key locks."""
+
+    def __init__(self, db_path: str = "cache/llm_cache.db", ttl_days: float = 7):
+        """
+        Initialize the LLM cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl_days: Number of days a cached response stays valid
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+
+        # One lock per key so concurrent requests for the same content wait for a
+        # single API call instead of all calling the API at once. Each entry is
+        # [lock, number of holders and waiters] and is dropped when that reaches zero.
+        self._key_locks: Dict[str, list] = {}
+        self._key_locks_lock = threading.Lock()
+
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        # Initialize the database
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initialize the cache schema.
+        """
+        conn = self._get_connection()
+
+        try:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                value BLOB,
+                created_at REAL
+            )
+            ''')
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error initializing LLM cache: {e}")
+        finally:
+            conn.close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get a connection to the cache database.
+
+        Returns:
+            SQLite connection
+        """
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def make_key(company_name: str, source_type: str, content: str, fields: List[str]) -> str:
+        """
+        Build the cache key for an extraction request.
+
+        Whitespace in the content is normalized so pages that differ only in layout
+        share an entry.
+
+        Args:
+            company_name: Name of the company
+            source_type: Type of source
+            content: Content to analyze
+            fields: Fields to extract
+
+        Returns:
+            Cache key string
+        """
+        payload = _dumps({
+            "cn": company_name,
+            "st": source_type,
+            "f": sorted(fields),
+            "c": " ".join(content.split())
+        })
+        return f"extract:{hashlib.sha256(payload).hexdigest()}"
+
+    @contextmanager
+    def key_lock(self, key: str) -> Iterator[None]:
+        """
+        Hold the lock guarding computation of a key.
+
+        The lock is only kept while some thread holds or waits for it, so the lock
+        table doesn't grow with every key seen during the run.
+
+        Args:
+            key: Cache key
+
+        Yields:
+            None, while the key's lock is held
+        """
+        with self._key_locks_lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._key_locks_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response if it has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response or None if not cached or expired
+        """
+        conn = self._get_connection()
+
+        try:
+            row = conn.execute(
+                "SELECT value FROM llm_responses WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                return None
+            return _loads(zlib.decompress(row[0]))
+        except Exception as e:
+            logger.error(f"Error reading LLM cache: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def set(self, key: str, value: Any):
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response to cache
+        """
+        conn = self._get_connection()
+
+        try:
+            blob = zlib.compress(_dumps(value))
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, blob, time.time())
+            )
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing LLM cache: {e}")
+        finally:
+            conn.close()
+
+    def clear_expired(self) -> int:
+        """
+        Delete expired responses.
+
+        Returns:
+            Number of responses deleted
+        """
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Error clearing LLM cache: {e}")
+            return 0
+        finally:
+            conn.close()
+
+
+# Shared LLM cache, created on first use so importing this module doesn't create the database
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """
+    Get the process-wide LLM cache, creating it on first use.
+
+    Returns:
+        The shared LLMCache instance
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMCache()
+    return _llm_cache
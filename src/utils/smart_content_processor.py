@@ -15,6 +15,9 @@ from bs4 import BeautifulSoup
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Class names that mark a main content container; bs4 matches this against each class natively
+_MAIN_CONTENT_CLASS_RE = re.compile(r"content|main|article", re.I)
+
 class ContentRelevanceFilter:
     """Filter content based on relevance to a query."""
     
@@ -390,7 +393,7 @@ class SiteSpecificExtractor:
             
             # Try to find main content container
             main_elements = soup.find_all(['main', 'article', 'div'], 
-                                         class_=lambda c: c and any(x in str(c).lower() for x in ['content', 'main', 'article']))
+                                         class_=_MAIN_CONTENT_CLASS_RE)
             
             if main_elements:
                 # Use the largest content container
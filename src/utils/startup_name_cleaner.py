@@ -20,6 +20,16 @@ from src.utils.api_client import GeminiAPIClient
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Legal suffixes removed from startup names, in the order they are stripped
+_SUFFIX_RES = tuple(re.compile(suffix, re.IGNORECASE) for suffix in (
+    r'\s+Inc\.?$', r'\s+LLC\.?$', r'\s+Ltd\.?$', r'\s+Limited$',
+    r'\s+Corp\.?$', r'\s+Corporation$', r'\s+Co\.?$', r'\s+Company$',
+    r'\s+GmbH$', r'\s+S\.?A\.?$', r'\s+B\.?V\.?$', r'\s+P\.?L\.?C\.?$'
+))
+_QUOTES_RE = re.compile(r'[\'"`]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
 class StartupNameCleaner:
     """Clean and deduplicate startup names using LLM-based processing."""
 
@@ -65,20 +75,14 @@ class StartupNameCleaner:
             Cleaned startup name
         """
         # Remove common suffixes
-        suffixes = [
-            r'\s+Inc\.?$', r'\s+LLC\.?$', r'\s+Ltd\.?$', r'\s+Limited$',
-            r'\s+Corp\.?$', r'\s+Corporation$', r'\s+Co\.?$', r'\s+Company$',
-            r'\s+GmbH$', r'\s+S\.?A\.?$', r'\s+B\.?V\.?$', r'\s+P\.?L\.?C\.?$'
-        ]
-
-        for suffix in suffixes:
-            name = re.sub(suffix, '', name, flags=re.IGNORECASE)
+        for suffix_re in _SUFFIX_RES:
+            name = suffix_re.sub('', name)
 
         # Remove quotes and special characters
-        name = re.sub(r'[\'"`]', '', name)
+        name = _QUOTES_RE.sub('', name)
 
         # Normalize whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = _WHITESPACE_RE.sub(' ', name).strip()
 
         return name
 
@@ -226,7 +230,7 @@ class StartupNameCleaner:
         normalized = name.lower()
 
         # Remove all non-alphanumeric characters
-        normalized = re.sub(r'[^a-z0-9]', '', normalized)
+        normalized = _NON_ALNUM_RE.sub('', normalized)
 
         return normalized
 
@@ -158,13 +158,14 @@ class TextChunker:
             logger.info(f"All texts fit within a single chunk (total length: {total_length + separators_length})")
 
             # Combine all texts into a single chunk
-            combined_text = ""
+            parts = []
             for i, text in enumerate(filtered_texts):
                 if i > 0:
                     # Add a more substantial separator with source information
                     separator = f"\n\n--- SOURCE: {filtered_metadata[i].get('title', 'Unknown')} | URL: {filtered_metadata[i].get('url', 'Unknown')} ---\n\n"
-                    combined_text += separator
-                combined_text += text
+                    parts.append(separator)
+                parts.append(text)
+            combined_text = "".join(parts)
 
             return [{
                 "chunk": combined_text,
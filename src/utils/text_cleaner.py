@@ -10,10 +10,20 @@ import logging
 from typing import Optional, Dict, Any, List
 from bs4 import BeautifulSoup, Comment
 import html2text
+import lxml.html
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Class names that mark a main content container; bs4 matches this against each class natively
+_MAIN_CONTENT_CLASS_RE = re.compile(r"content|main|article|post", re.I)
+
+# Inline tags whose text belongs on the same line as the text around them
+_INLINE_TAGS = frozenset([
+    'a', 'abbr', 'b', 'cite', 'code', 'em', 'font', 'i', 'label', 'mark', 'q', 's',
+    'small', 'span', 'strong', 'sub', 'sup', 'time', 'u'
+])
+
 class TextCleaner:
     """
     A utility class for cleaning and normalizing text content from various sources.
@@ -50,6 +60,9 @@ class TextCleaner:
             'comment', 'social', 'share', 'related', 'widget'
         ]
 
+        # All unwanted classes and IDs as one pattern, so bs4 finds them in a single pass
+        self.unwanted_class_pattern = re.compile("|".join(map(re.escape, self.unwanted_classes)), re.I)
+
     # Basic Text Cleaning Methods
 
     def clean_text(self, text: str) -> str:
@@ -169,17 +182,8 @@ class TextCleaner:
             # Create a copy of the soup for fallback
             soup_copy = BeautifulSoup(html_content, 'lxml')
 
-            # Remove unwanted elements
-            for tag in self.unwanted_tags:
-                for element in soup.find_all(tag):
-                    element.decompose()
-
-            # Remove elements with unwanted classes or IDs
-            for class_name in self.unwanted_classes:
-                for element in soup.find_all(class_=re.compile(class_name, re.I)):
-                    element.decompose()
-                for element in soup.find_all(id=re.compile(class_name, re.I)):
-                    element.decompose()
+            # Remove unwanted elements, and elements with unwanted classes or IDs
+            self._remove_unwanted(soup)
 
             # Remove comments
             for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
@@ -334,17 +338,22 @@ class TextCleaner:
         content_ids = ['mw-content-text', 'content', 'main-content', 'article-content', 'post-content']
         for content_id in content_ids:
             content_element = soup.find(id=content_id)
-            if content_element and len(content_element.get_text(strip=True)) > 100:
-                return content_element.get_text(separator=' ', strip=True)
+            if content_element:
+                # Walk the element's strings once for both the length check and the result
+                strings = list(content_element.stripped_strings)
+                if sum(map(len, strings)) > 100:
+                    return ' '.join(strings)
 
         # Try to find main content containers by tag and class
         main_elements = soup.find_all(['main', 'article', 'section', 'div'],
-                                     class_=lambda c: c and any(x in c.lower() for x in ['content', 'main', 'article', 'post']))
+                                     class_=_MAIN_CONTENT_CLASS_RE)
 
         if main_elements:
-            # Use the largest content container
-            main_element = max(main_elements, key=lambda x: len(x.get_text()))
-            return main_element.get_text(separator=' ', strip=True)
+            # Use the largest content container, keeping each container's strings
+            # so the winner's text isn't collected a second time
+            largest_strings = max((list(element.strings) for element in main_elements),
+                                  key=lambda strings: sum(map(len, strings)))
+            return ' '.join(string.strip() for string in largest_strings if string.strip())
 
         # If no main content container found, use the body
         body = soup.find('body')
@@ -354,6 +363,23 @@ class TextCleaner:
         # Last resort: use the entire document
         return soup.get_text(separator=' ', strip=True)
 
+    def _remove_unwanted(self, element: BeautifulSoup) -> None:
+        """
+        Remove unwanted tags and elements with unwanted classes or IDs, in three tree walks.
+
+        Args:
+            element: BeautifulSoup element to clean in place.
+        """
+        for matches in (
+            element.find_all(self.unwanted_tags),
+            element.find_all(class_=self.unwanted_class_pattern),
+            element.find_all(id=self.unwanted_class_pattern),
+        ):
+            for unwanted in matches:
+                # Skip elements already removed along with an unwanted ancestor
+                if not unwanted.decomposed:
+                    unwanted.decompose()
+
     def clean_element(self, element: BeautifulSoup) -> BeautifulSoup:
         """
         Clean HTML elements by removing unwanted tags and attributes.
@@ -364,17 +390,8 @@ class TextCleaner:
         Returns:
             Cleaned BeautifulSoup element.
         """
-        # Remove unwanted tags
-        for tag in self.unwanted_tags:
-            for unwanted in element.find_all(tag):
-                unwanted.decompose()
-
-        # Remove elements with unwanted classes or IDs
-        for class_name in self.unwanted_classes:
-            for unwanted in element.find_all(class_=re.compile(class_name, re.I)):
-                unwanted.decompose()
-            for unwanted in element.find_all(id=re.compile(class_name, re.I)):
-                unwanted.decompose()
+        # Remove unwanted tags, and elements with unwanted classes or IDs
+        self._remove_unwanted(element)
 
         # Remove comments
         for comment in element.find_all(text=lambda text: isinstance(text, Comment)):
@@ -560,3 +577,84 @@ class TextCleaner:
             return self._process_image_content(content)
         else:  # Default to text
             return self._process_text_content(content)
+
+    @staticmethod
+    def extract_page_text(html_content: str, tags: List[str]) -> str:
+        """
+        Extract the title, meta description and text of the given tags from HTML.
+
+        The page is walked once by lxml with a single XPath union, so text nodes
+        shared by nested tags are only included once. Text inside inline tags is kept
+        on the line of the element around it, so each block element becomes one line.
+
+        Args:
+            html_content: The HTML content to extract text from.
+            tags: Tag names whose text should be extracted (e.g. ['p', 'h1']).
+
+        Returns:
+            Extracted text, or an empty string if the HTML could not be parsed.
+        """
+        if not html_content or not tags:
+            return ""
+
+        try:
+            tree = lxml.html.fromstring(html_content)
+        except Exception as e:
+            logger.warning(f"Error parsing HTML for text extraction: {e}")
+            return ""
+
+        parts = []
+
+        # Add the title
+        title = " ".join(t.strip() for t in tree.xpath("//title/text()") if t.strip())
+        if title:
+            parts.append(f"Title: {title}\n")
+
+        # Add meta descriptions
+        meta_desc = tree.xpath("//meta[@name='description']/@content")
+        if meta_desc:
+            parts.append(f"Meta Description: {meta_desc[0]}\n")
+
+        # Extract text from the requested tags in one pass, grouping consecutive text
+        # nodes of the same block element into one line
+        lines = []
+        line_buf = []
+        line_owner = None
+        for text in tree.xpath(" | ".join(f"//{tag}//text()" for tag in tags)):
+            owner = text.getparent()
+            if text.is_tail:
+                owner = owner.getparent()
+            while owner is not None and owner.tag in _INLINE_TAGS:
+                owner = owner.getparent()
+
+            if owner is not line_owner and line_buf:
+                lines.append(" ".join("".join(line_buf).split()))
+                line_buf = []
+            line_owner = owner
+            line_buf.append(text)
+
+        if line_buf:
+            lines.append(" ".join("".join(line_buf).split()))
+        parts.append("\n".join(line for line in lines if line))
+
+        return "\n".join(parts)
+
+    @staticmethod
+    def compact_for_llm(text: str, max_chars: int) -> str:
+        """
+        Drop repeated lines and cap the length of text before sending it to an LLM.
+
+        Pages repeat navigation, footer and card boilerplate many times, and the
+        useful signal is near the top, so this cuts input tokens on verbose pages.
+
+        Args:
+            text: Text to compact.
+            max_chars: Maximum number of characters to keep.
+
+        Returns:
+            Text with only the first occurrence of each line, truncated to max_chars.
+        """
+        if not text:
+            return ""
+
+        return "\n".join(dict.fromkeys(text.split("\n")))[:max_chars]
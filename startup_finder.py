@@ -37,14 +37,14 @@ from src.utils.content_processor import ContentProcessor
 
 # Import optimization utilities
 from src.utils.optimization_utils import (
-    MemoryOptimizer, ParallelProcessor, CacheManager,
+    ParallelProcessor, CacheManager,
     cache_manager, lru_cache_api_call
 )
 from src.utils.smart_content_processor import (
     ContentRelevanceFilter, EntityExtractor, SiteSpecificExtractor
 )
 from src.utils.api_optimizer import (
-    APIOptimizer, RateLimiter, CircuitBreaker,
+    APIOptimizer, CircuitBreaker,
     rate_limited, with_circuit_breaker, with_retry
 )
 from src.utils.query_optimizer import QueryOptimizer
@@ -365,7 +365,7 @@ def enrich_startup_data(crawler: EnhancedStartupCrawler, startup_name: str) -> D
 
             if raw_html and soup:
                 # Extract data using the website extractor
-                website_data = WebsiteExtractor.extract_data(startup_name, official_url, raw_html, soup)
+                website_data = WebsiteExtractor.extract_data(startup_name, official_url, raw_html, soup, api_client=crawler.api_client)
 
                 # Try to extract organization names using NLP
                 try:
@@ -432,7 +432,11 @@ def enrich_startup_data(crawler: EnhancedStartupCrawler, startup_name: str) -> D
 
             if raw_html and soup:
                 # Extract data using the LinkedIn extractor
-                linkedin_data = LinkedInExtractor.extract_data(startup_name, linkedin_url, raw_html, soup)
+                linkedin_data = LinkedInExtractor.extract_data(
+                    startup_name, linkedin_url, raw_html, soup,
+                    api_client=crawler.api_client,
+                    already_have={key for key, value in startup_data.items() if value}
+                )
 
                 # Merge the extracted data
                 for key, value in linkedin_data.items():
@@ -767,9 +771,6 @@ def validate_and_correct_data_with_gemini(enriched_data: List[Dict[str, Any]], q
         )
         logger.info(f"Initialized ContentProcessor with chunk_size=8000, overlap=500")
 
-        # Create a rate limiter for API calls
-        rate_limiter = RateLimiter(calls_per_second=0.5, calls_per_minute=30)
-
         # Create a circuit breaker for API calls
         circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
 
@@ -841,66 +842,46 @@ def validate_and_correct_data_with_gemini(enriched_data: List[Dict[str, Any]], q
             {{startup_data}}
             """
 
-            # Process chunks in batches to avoid rate limits
-            batch_size = min(3, max(1, len(chunks) // 5))
-            logger.info(f"Processing chunks in batches of {batch_size}")
+            # Validate all chunks concurrently; the Gemini client paces the calls to the
+            # model's rate limit, so no fixed delays are needed between them
+            max_workers = min(len(chunks), ParallelProcessor.get_optimal_workers())
+            logger.info(f"Validating {len(chunks)} chunks with {max_workers} workers")
 
-            # Process chunks in batches
-            chunk_results = []
-            for batch_idx, batch in enumerate(MemoryOptimizer.chunk_large_list(chunks, batch_size)):
-                logger.info(f"Processing batch {batch_idx+1}/{(len(chunks) + batch_size - 1) // batch_size}")
-
-                # Process batch in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-                    # Submit tasks for validating each chunk in the batch
-                    future_to_chunk = {}
-                    for chunk in batch:
-                        chunk_text = chunk["chunk"]
-                        chunk_sources = chunk["sources"]
-
-                        # Create a function to call with rate limiting and circuit breaking
-                        def validate_chunk():
-                            # Wait if needed to respect rate limits
-                            rate_limiter.wait_if_needed()
-
-                            # Process the chunk with the Gemini API
-                            return gemini_client.validate_startups_chunk(chunk_text, query,
-                                                                        [s["startup_index"] for s in chunk_sources if "startup_index" in s])
-
-                        # Submit the task with circuit breaker protection
-                        future = executor.submit(
-                            circuit_breaker.execute,
-                            validate_chunk
-                        )
-                        future_to_chunk[future] = chunk
+            def validate_chunk(chunk):
+                # Process the chunk with the Gemini API
+                return gemini_client.validate_startups_chunk(chunk["chunk"], query,
+                                                            [s["startup_index"] for s in chunk["sources"] if "startup_index" in s])
 
-                        # Log progress
-                        logger.info(f"Submitted chunk {chunk['chunk_index']+1}/{chunk['total_chunks']} for validation")
+            chunk_results = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit every chunk with circuit breaker protection
+                future_to_chunk = {}
+                for chunk in chunks:
+                    future = executor.submit(circuit_breaker.execute, validate_chunk, chunk)
+                    future_to_chunk[future] = chunk
 
-                    # Process results as they complete
-                    for future in concurrent.futures.as_completed(future_to_chunk):
-                        chunk = future_to_chunk[future]
+                    # Log progress
+                    logger.info(f"Submitted chunk {chunk['chunk_index']+1}/{chunk['total_chunks']} for validation")
 
-                        try:
-                            # Get the validation result
-                            validated_chunk = future.result()
-                            chunk_results.append(validated_chunk)
+                # Process results as they complete
+                for future in concurrent.futures.as_completed(future_to_chunk):
+                    chunk = future_to_chunk[future]
 
-                            # Update progress based on number of startups in this chunk
-                            num_startups = len([s for s in chunk["sources"] if "startup_index" in s])
-                            progress_tracker.update(num_startups)
+                    try:
+                        # Get the validation result
+                        validated_chunk = future.result()
+                        chunk_results.append(validated_chunk)
 
-                            # Log progress
-                            logger.info(f"Validated chunk {chunk['chunk_index']+1}/{chunk['total_chunks']} with {num_startups} startups")
+                        # Update progress based on number of startups in this chunk
+                        num_startups = len([s for s in chunk["sources"] if "startup_index" in s])
+                        progress_tracker.update(num_startups)
 
-                        except Exception as e:
-                            logger.error(f"Error validating chunk {chunk['chunk_index']+1}/{chunk['total_chunks']}: {e}")
-                            # Don't update progress here, will handle missing startups later
+                        # Log progress
+                        logger.info(f"Validated chunk {chunk['chunk_index']+1}/{chunk['total_chunks']} with {num_startups} startups")
 
-                # Add a delay between batches to avoid rate limits
-                if batch_idx < (len(chunks) + batch_size - 1) // batch_size - 1:
-                    logger.info(f"Waiting 5 seconds before processing next batch...")
-                    time.sleep(5)
+                    except Exception as e:
+                        logger.error(f"Error validating chunk {chunk['chunk_index']+1}/{chunk['total_chunks']}: {e}")
+                        # Don't update progress here, will handle missing startups later
 
             # Combine the validated chunks into a single result
             new_validated_data = gemini_client.combine_validated_chunks(chunk_results,
@@ -1845,6 +1826,142 @@ def enrich_startups(input_file, output_file, metrics_collector=None):
     return validated_results
 
 
+def load_startup_rows_from_csv(input_file: str) -> List[Dict[str, Any]]:
+    """
+    Load full startup rows from a CSV file, keyed by "Company Name".
+
+    Args:
+        input_file: Path to the CSV file.
+
+    Returns:
+        List of startup data dictionaries.
+    """
+    rows = []
+    with open(input_file, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            name = (row.get("Company Name") or row.get("Name") or "").strip()
+            if name:
+                row["Company Name"] = name
+                rows.append(row)
+    return rows
+
+
+def submit_batch_enrichment(input_file: str, output_file: Optional[str] = None) -> Optional[str]:
+    """
+    Submit LinkedIn and website extraction for the startups in a CSV as Gemini batch jobs.
+
+    Bulk mode trades latency for cost: the jobs complete within 24 hours at half the
+    price of interactive extraction. Startups need a LinkedIn or Website column value.
+
+    Args:
+        input_file: Path to input CSV file with startup names and URLs.
+        output_file: Path to the output CSV file written when the jobs are collected.
+
+    Returns:
+        Path to the batch manifest to pass to --collect-batch, or None if an error occurred.
+    """
+    # Validate environment
+    env_valid, env_msg = check_environment_setup()
+    if not env_valid:
+        logger.error(env_msg)
+        print(f"Error: {env_msg}")
+        return None
+
+    # Validate inputs
+    inputs_valid, input_errors = validate_enrich_mode_inputs(input_file)
+    if not inputs_valid:
+        error_msg = "\n".join(input_errors)
+        logger.error(f"Invalid inputs for batch mode: {error_msg}")
+        print(f"Error: {error_msg}")
+        return None
+
+    # Validate output file
+    output_valid, output_msg, validated_output_file = validate_output_file(output_file)
+    if not output_valid:
+        logger.error(output_msg)
+        print(f"Error: {output_msg}")
+        return None
+
+    rows = load_startup_rows_from_csv(input_file)
+    api_client = GeminiAPIClient()
+
+    # Step 1: Submit one job per source for every startup that has its URL
+    jobs = {}
+    for source, extractor in (("LinkedIn", LinkedInExtractor), ("Website", WebsiteExtractor)):
+        companies = [(row["Company Name"], row[source], None, None) for row in rows if row.get(source)]
+        if not companies:
+            continue
+
+        print(f"Submitting {source} extraction for {len(companies)} startups...")
+        job_name = extractor.submit_batch(companies, api_client=api_client)
+        if job_name:
+            jobs[source] = job_name
+            print(f"Submitted {source} batch job: {job_name}")
+        else:
+            print(f"Error: could not submit {source} batch job")
+
+    if not jobs:
+        print("No batch jobs were submitted")
+        return None
+
+    # Step 2: Save a manifest so the results can be collected later
+    manifest_file = os.path.join("output/data", f"batch_jobs_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    with open(manifest_file, 'w') as f:
+        json.dump({"input_file": input_file, "output_file": validated_output_file, "jobs": jobs}, f, indent=2)
+
+    print(f"Batch jobs submitted. Collect the results with: --collect-batch {manifest_file}")
+    return manifest_file
+
+
+def collect_batch_enrichment(manifest_file: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Collect batch jobs submitted by submit_batch_enrichment and write the enriched CSV.
+
+    Args:
+        manifest_file: Path to the batch manifest.
+
+    Returns:
+        List of enriched startup data dictionaries, or None if the jobs aren't finished or an error occurred.
+    """
+    try:
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+        rows = load_startup_rows_from_csv(manifest["input_file"])
+    except Exception as e:
+        logger.error(f"Error loading batch manifest {manifest_file}: {e}")
+        print(f"Error: {e}")
+        return None
+
+    api_client = GeminiAPIClient()
+    extractors = {"LinkedIn": LinkedInExtractor, "Website": WebsiteExtractor}
+
+    # Collect every job before merging, so a partially finished run can simply be retried
+    job_results = {}
+    for source, job_name in manifest["jobs"].items():
+        results = extractors[source].collect_batch(job_name, api_client=api_client)
+        if results is None:
+            print(f"{source} batch job {job_name} has not finished yet. Try again later.")
+            return None
+        job_results[source] = results
+
+    # Merge the extracted data, but don't overwrite existing data
+    rows_by_name = {row["Company Name"]: row for row in rows}
+    for source, results in job_results.items():
+        for name, data in results.items():
+            row = rows_by_name.get(name)
+            if row is None:
+                continue
+            for key, value in data.items():
+                if value and not row.get(key):
+                    row[key] = value
+        print(f"Merged {source} data for {len(results)} startups")
+
+    if generate_csv_from_startups(rows, manifest["output_file"]):
+        print(f"Results saved to {manifest['output_file']}")
+    return rows
+
+
 def find_and_enrich_startups(query, max_results, num_expansions, output_file, use_query_expansion,
                         direct_startups=None, metrics_collector=None, resume_data=None, start_phase="discovery"):
     """
@@ -2276,6 +2393,11 @@ def parse_arguments():
                         help="Resume from the latest checkpoint of a specific phase")
     parser.add_argument("--resume-latest", action="store_true",
                         help="Resume from the latest available checkpoint")
+    parser.add_argument("--batch", action="store_true",
+                        help="With --mode enrich: submit LinkedIn/website extraction as Gemini batch jobs "
+                             "(up to 24h, half the cost) instead of extracting interactively")
+    parser.add_argument("--collect-batch", type=str,
+                        help="Collect finished batch jobs from the manifest written by --batch")
 
     return parser.parse_args()
 
@@ -2560,7 +2682,13 @@ if __name__ == "__main__":
             print(f"Error loading startups file: {e}")
 
     # Check if we have the required arguments for the selected mode
-    if args.resume or args.resume_phase or args.resume_latest:
+    if args.collect_batch:
+        # Collect bulk extraction jobs
+        collect_batch_enrichment(args.collect_batch)
+    elif args.batch and args.mode == "enrich" and args.input_file:
+        # Submit bulk extraction jobs
+        submit_batch_enrichment(args.input_file, args.output_file)
+    elif args.resume or args.resume_phase or args.resume_latest:
         # Run in resume mode
         run_startup_finder(
             mode=args.mode,
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the startup ranker's content relevance scoring.
+"""
+
+import os
+import sys
+import logging
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.processor.ranker import Ranker
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_content_relevance_matches_whole_words():
+    """Query terms should match whole words, not substrings ("ai" is not in "maid")."""
+    ranker = Ranker()
+
+    assert ranker.calculate_content_relevance({"Product Description": "A maid service"}, "ai") == 0.0
+    assert ranker.calculate_content_relevance({"Product Description": "An AI service"}, "ai") == 1.0
+
+
+def test_content_relevance_counts_each_term_once():
+    """A term found in several fields should only be credited once."""
+    ranker = Ranker()
+    startup = {
+        "Company Name": "Robotics Co",
+        "Product Description": "Robotics for warehouses",
+        "Industry": "Robotics"
+    }
+
+    assert ranker.calculate_content_relevance(startup, "robotics healthcare") == 0.5
+
+
+def test_content_relevance_empty_query():
+    """A query made only of stop words should score 0 rather than divide by zero."""
+    ranker = Ranker()
+
+    assert ranker.calculate_content_relevance({"Product Description": "The company"}, "the a of") == 0.0
+    assert ranker.rank_results([{"Company Name": "Acme"}], "the a of")[0]["confidence"] >= 0.0
+
+
+if __name__ == "__main__":
+    test_content_relevance_matches_whole_words()
+    test_content_relevance_counts_each_term_once()
+    test_content_relevance_empty_query()
+    logger.info("All ranker tests passed!")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test that validation falls back gracefully when the validation model can't be built.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.api_client import GeminiAPIClient
+
+
+def _raise_unknown_tool():
+    """Simulate an SDK that rejects the web_search tool."""
+    raise ValueError("Unknown field for FunctionDeclaration: web_search")
+
+
+def test_validate_startups_batch_returns_original_startups(monkeypatch):
+    """validate_startups_batch should return its input when the model can't be built."""
+    monkeypatch.setattr(GeminiAPIClient, "_create_validation_model", staticmethod(_raise_unknown_tool))
+    client = GeminiAPIClient(api_key="test-key")
+
+    startups = [{"Company Name": "Acme"}, {"Company Name": "Globex"}]
+    assert client.validate_startups_batch(startups, "AI startups") == startups
+
+
+def test_validate_startups_chunk_reports_failure(monkeypatch):
+    """validate_startups_chunk should report an unsuccessful chunk instead of raising."""
+    monkeypatch.setattr(GeminiAPIClient, "_create_validation_model", staticmethod(_raise_unknown_tool))
+    client = GeminiAPIClient(api_key="test-key")
+
+    result = client.validate_startups_chunk('[{"Company Name": "Acme"}]', "AI startups", [0])
+    assert result["success"] is False
+    assert result["startup_indices"] == [0]
+    assert "web_search" in result["error"]